@@ -5,7 +5,7 @@ use color_eyre::eyre::{Context, Result};
 use serde::Serialize;
 
 use crate::config::types::InitSystem;
-use crate::system::cmd::{CommandRunner, check_exit, chroot_cmd};
+use crate::system::cmd::{CommandRunner, check_exit, chroot_cmd_quiet};
 
 pub const HOSTID_VALUE: &str = "0x00bab10c";
 
@@ -134,7 +134,7 @@ pub async fn install_and_generate_zbm(
         install_zbm_pacman_hook(&t)?;
 
         tracing::info!("running generate-zbm to build EFI bundle");
-        let output = chroot_cmd(&*r, &t, "generate-zbm", &[])?;
+        let output = chroot_cmd_quiet(&*r, &t, "generate-zbm", &[])?;
         check_exit(&output, "generate-zbm")?;
 
         let efi_src = t.join("boot/efi/EFI/zbm/vmlinuz.EFI");
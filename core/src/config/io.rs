@@ -1,12 +1,11 @@
 use std::fs;
+use std::io::Write;
 use std::path::Path;
 
 use color_eyre::eyre::{Context, Result};
 
 use super::types::GlobalConfig;
 
-const ZFS_CONFIG_KEY: &str = "archinstall_zfs";
-
 impl GlobalConfig {
     pub fn load_from_file(path: &Path) -> Result<Self> {
         let content = fs::read_to_string(path)
@@ -15,36 +14,62 @@ impl GlobalConfig {
     }
 
     pub fn load_from_str(json: &str) -> Result<Self> {
-        let value: serde_json::Value =
-            serde_json::from_str(json).wrap_err("failed to parse config JSON")?;
+        // Deserialize straight from the text instead of building a
+        // `serde_json::Value` tree first: the envelope pass skips every
+        // top-level key except `archinstall_zfs` without allocating for it.
+        // Only the direct format (no such key) needs a second pass.
+        #[derive(serde::Deserialize)]
+        struct Envelope {
+            archinstall_zfs: Option<GlobalConfig>,
+        }
 
-        // Check if there's an archinstall_zfs sub-key
-        if let Some(zfs_block) = value.get(ZFS_CONFIG_KEY) {
-            serde_json::from_value(zfs_block.clone())
-                .wrap_err("failed to deserialize archinstall_zfs config block")
-        } else {
+        let envelope: Envelope =
+            serde_json::from_str(json).wrap_err("failed to parse config JSON")?;
+        match envelope.archinstall_zfs {
+            Some(config) => Ok(config),
             // Try parsing the whole file as GlobalConfig
-            serde_json::from_value(value).wrap_err("failed to deserialize config")
+            None => serde_json::from_str(json).wrap_err("failed to deserialize config"),
         }
     }
 
+    /// Write the config as pretty JSON. A config is a few KiB, so it is
+    /// rendered in memory first: saving an unchanged config again leaves the
+    /// file (and its mtime) alone instead of rewriting it.
     pub fn save_to_file(&self, path: &Path) -> Result<()> {
-        let json = self.to_json_string()?;
+        let mut json = Vec::new();
+        self.write_json(&mut json)?;
+        if fs::read(path).is_ok_and(|existing| existing == json) {
+            tracing::debug!(path = %path.display(), "config unchanged, not rewriting");
+            return Ok(());
+        }
         fs::write(path, json)
-            .wrap_err_with(|| format!("failed to write config: {}", path.display()))?;
-        Ok(())
+            .wrap_err_with(|| format!("failed to write config: {}", path.display()))
+    }
+
+    /// Stream the pretty-printed config, followed by a newline, into
+    /// `writer`. Used for the saved file and for the dry-run dump on stdout.
+    pub fn write_json(&self, mut writer: impl Write) -> Result<()> {
+        serde_json::to_writer_pretty(&mut writer, self).wrap_err("failed to serialize config")?;
+        writer.write_all(b"\n").wrap_err("failed to write config")
     }
 
     pub fn to_json_string(&self) -> Result<String> {
         serde_json::to_string_pretty(self).wrap_err("failed to serialize config")
     }
 
+    /// Serialize under an `archinstall_zfs` key, the mirror of the combined
+    /// format `load_from_str` accepts. Borrows `self` into the envelope, so
+    /// there is no intermediate `serde_json::Value` copy of the config.
     pub fn to_combined_json(&self) -> Result<String> {
-        let value = serde_json::to_value(self).wrap_err("failed to serialize config")?;
-        let combined = serde_json::json!({
-            ZFS_CONFIG_KEY: value
-        });
-        serde_json::to_string_pretty(&combined).wrap_err("failed to serialize combined config")
+        #[derive(serde::Serialize)]
+        struct Envelope<'a> {
+            archinstall_zfs: &'a GlobalConfig,
+        }
+
+        serde_json::to_string_pretty(&Envelope {
+            archinstall_zfs: self,
+        })
+        .wrap_err("failed to serialize combined config")
     }
 }
 
@@ -79,6 +104,19 @@ mod tests {
         assert_eq!(cfg.pool_name.as_deref(), Some("zfsroot"));
     }
 
+    #[test]
+    fn test_load_combined_format_skips_archinstall_keys() {
+        let json = r#"{
+            "disk_config": {"config_type": "default_layout", "device_modifications": []},
+            "archinstall_zfs": {"pool_name": "zfsroot"},
+            "version": "3.0.0"
+        }"#;
+
+        let cfg = GlobalConfig::load_from_str(json).unwrap();
+        assert_eq!(cfg.pool_name.as_deref(), Some("zfsroot"));
+        assert!(GlobalConfig::load_from_str("{").is_err());
+    }
+
     #[test]
     fn test_to_combined_json() {
         let cfg = GlobalConfig {
@@ -93,6 +131,9 @@ mod tests {
             value["archinstall_zfs"]["pool_name"].as_str(),
             Some("mypool")
         );
+
+        let loaded = GlobalConfig::load_from_str(&json).unwrap();
+        assert_eq!(loaded.pool_name.as_deref(), Some("mypool"));
     }
 
     #[test]
@@ -117,4 +158,43 @@ mod tests {
         assert_eq!(loaded.pool_name.as_deref(), Some("roundtrip"));
         assert_eq!(loaded.hostname.as_deref(), Some("testhost"));
     }
+
+    #[test]
+    fn test_save_unchanged_config_skips_write() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("config.json");
+        let mut cfg = GlobalConfig::default();
+
+        cfg.save_to_file(&path).unwrap();
+        let epoch = std::time::SystemTime::UNIX_EPOCH;
+        std::fs::File::options()
+            .write(true)
+            .open(&path)
+            .unwrap()
+            .set_modified(epoch)
+            .unwrap();
+
+        cfg.save_to_file(&path).unwrap();
+        let modified = || std::fs::metadata(&path).unwrap().modified().unwrap();
+        assert_eq!(modified(), epoch);
+
+        cfg.hostname = Some("changed".to_string());
+        cfg.save_to_file(&path).unwrap();
+        assert_ne!(modified(), epoch);
+    }
+
+    #[test]
+    fn test_write_json_matches_to_json_string() {
+        let cfg = GlobalConfig {
+            pool_name: Some("streamed".to_string()),
+            ..Default::default()
+        };
+
+        let mut out = Vec::new();
+        cfg.write_json(&mut out).unwrap();
+        assert_eq!(
+            String::from_utf8(out).unwrap(),
+            format!("{}\n", cfg.to_json_string().unwrap())
+        );
+    }
 }
@@ -113,6 +113,16 @@ pub enum SeatAccess {
     Polkit,
 }
 
+impl SeatAccess {
+    /// Package providing this seat-access mechanism.
+    pub fn package(self) -> &'static str {
+        match self {
+            Self::Seatd => "seatd",
+            Self::Polkit => "polkit",
+        }
+    }
+}
+
 impl std::fmt::Display for SeatAccess {
     fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
         match self {
@@ -132,6 +142,14 @@ pub enum SwapMode {
     ZswapPartitionEncrypted,
 }
 
+impl SwapMode {
+    /// Whether swap lives on a dedicated partition (plain or encrypted), as
+    /// opposed to zram or no swap at all.
+    pub fn uses_partition(self) -> bool {
+        matches!(self, Self::ZswapPartition | Self::ZswapPartitionEncrypted)
+    }
+}
+
 impl std::fmt::Display for SwapMode {
     fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
         match self {
@@ -276,14 +294,27 @@ impl ProfileSelection {
 
     /// Resolve this selection's profile in the registry. Returns `None`
     /// when the profile name no longer exists (e.g. after a downgrade).
-    pub fn profile_def(&self) -> Option<crate::profile::Profile> {
-        crate::profile::get_profile(&self.profile)
+    /// Borrows from the static registry, so repeated lookups are free of
+    /// copies.
+    pub fn profile_def(&self) -> Option<&'static crate::profile::Profile> {
+        crate::profile::all_profiles()
+            .iter()
+            .find(|p| p.name == self.profile)
     }
 
     /// Effective DM = explicit override, falling back to the profile default.
     pub fn effective_display_manager(&self) -> Option<DisplayManager> {
+        match self.profile_def() {
+            Some(p) => self.display_manager_for(p),
+            None => self.display_manager_override,
+        }
+    }
+
+    /// [`Self::effective_display_manager`] for a profile the caller has
+    /// already resolved with [`Self::profile_def`].
+    pub fn display_manager_for(&self, profile: &crate::profile::Profile) -> Option<DisplayManager> {
         self.display_manager_override
-            .or_else(|| self.profile_def().and_then(|p| p.default_display_manager()))
+            .or_else(|| profile.default_display_manager())
     }
 
     /// Profile packages ∪ chosen optionals. Does *not* include the DM
@@ -310,6 +341,24 @@ pub enum AudioServer {
     Pulseaudio,
 }
 
+impl AudioServer {
+    /// Packages installed for this audio stack.
+    pub fn packages(self) -> &'static [&'static str] {
+        match self {
+            Self::Pipewire => &["pipewire", "pipewire-alsa", "pipewire-pulse", "wireplumber"],
+            Self::Pulseaudio => &["pulseaudio", "pulseaudio-alsa"],
+        }
+    }
+
+    /// User units that must be enabled globally so each session starts them.
+    pub fn user_services(self) -> &'static [&'static str] {
+        match self {
+            Self::Pipewire => &["pipewire", "pipewire-pulse", "wireplumber"],
+            Self::Pulseaudio => &[],
+        }
+    }
+}
+
 impl std::fmt::Display for AudioServer {
     fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
         match self {
@@ -319,6 +368,9 @@ impl std::fmt::Display for AudioServer {
     }
 }
 
+/// Kernel installed when the config doesn't name one.
+pub const DEFAULT_KERNEL: &str = "linux-lts";
+
 fn default_dataset_prefix() -> String {
     "arch0".to_string()
 }
@@ -361,14 +413,14 @@ impl Default for GlobalConfig {
             swap_partition_size: None,
             swap_partition: None,
             zram_size_expr: default_zram_size_expr(),
-            set_bootfs: true,
+            set_bootfs: default_set_bootfs(),
             zrepl_enabled: false,
             aur_packages: Vec::new(),
             hostname: Some("archzfs".to_string()),
             locale: Some("en_US.UTF-8 UTF-8".to_string()),
             keyboard_layout: default_keyboard_layout(),
             timezone: None,
-            ntp: true,
+            ntp: default_ntp(),
             root_password: None,
             users: None,
             kernels: None,
@@ -400,18 +452,18 @@ impl GlobalConfig {
     }
 
     /// Return the list of kernels to install. Always contains at least one
-    /// entry — defaults to `["linux-lts"]` when none are configured.
+    /// entry — defaults to `[DEFAULT_KERNEL]` when none are configured.
     pub fn effective_kernels(&self) -> Vec<&str> {
         match &self.kernels {
             Some(k) if !k.is_empty() => k.iter().map(|s| s.as_str()).collect(),
-            _ => vec!["linux-lts"],
+            _ => vec![DEFAULT_KERNEL],
         }
     }
 
     pub fn primary_kernel(&self) -> &str {
         match &self.kernels {
             Some(k) if !k.is_empty() => k[0].as_str(),
-            _ => "linux-lts",
+            _ => DEFAULT_KERNEL,
         }
     }
 }
@@ -528,6 +580,21 @@ mod tests {
         assert_eq!(cfg.primary_kernel(), "linux-lts");
     }
 
+    #[test]
+    fn test_default_matches_serde_defaults() {
+        // A config file that omits a field must get the same value as
+        // GlobalConfig::default().
+        let parsed: GlobalConfig = serde_json::from_str("{}").unwrap();
+        let cfg = GlobalConfig::default();
+        assert_eq!(parsed.dataset_prefix, cfg.dataset_prefix);
+        assert_eq!(parsed.zram_size_expr, cfg.zram_size_expr);
+        assert_eq!(parsed.set_bootfs, cfg.set_bootfs);
+        assert_eq!(parsed.keyboard_layout, cfg.keyboard_layout);
+        assert_eq!(parsed.ntp, cfg.ntp);
+        assert_eq!(parsed.parallel_downloads, cfg.parallel_downloads);
+        assert_eq!(parsed.primary_kernel(), DEFAULT_KERNEL);
+    }
+
     #[test]
     fn test_serde_roundtrip() {
         let cfg = GlobalConfig {
@@ -636,4 +703,12 @@ mod tests {
             assert_eq!(swap, back);
         }
     }
+
+    #[test]
+    fn test_swap_mode_uses_partition() {
+        assert!(!SwapMode::None.uses_partition());
+        assert!(!SwapMode::Zram.uses_partition());
+        assert!(SwapMode::ZswapPartition.uses_partition());
+        assert!(SwapMode::ZswapPartitionEncrypted.uses_partition());
+    }
 }
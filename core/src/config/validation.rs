@@ -1,6 +1,4 @@
-use super::types::{
-    GlobalConfig, InstallationMode, SwapMode, ZFS_PASSPHRASE_MIN_LENGTH, ZfsEncryptionMode,
-};
+use super::types::{GlobalConfig, InstallationMode, ZFS_PASSPHRASE_MIN_LENGTH, ZfsEncryptionMode};
 
 /// Valid Linux hostname: 1-63 chars, alphanumeric + hyphens, no leading/trailing hyphen.
 fn is_valid_hostname(name: &str) -> bool {
@@ -45,17 +43,15 @@ impl GlobalConfig {
         errors.extend(self.validate_dataset_prefix());
         errors.extend(self.validate_device_paths());
 
-        // Mode-dependent validation
+        // Mode-dependent validation. Every mode checks the swap partition
+        // settings, so classify the swap mode once up front.
+        let uses_swap_partition = self.swap_mode.uses_partition();
         match mode {
             InstallationMode::FullDisk => {
                 if self.disk.is_none() {
                     errors.push("Full disk mode requires a disk selection (disk)".to_string());
                 }
-                if matches!(
-                    self.swap_mode,
-                    SwapMode::ZswapPartition | SwapMode::ZswapPartitionEncrypted
-                ) && self.swap_partition_size.is_none()
-                {
+                if uses_swap_partition && self.swap_partition_size.is_none() {
                     errors.push(
                         "Swap partition mode requires swap_partition_size in full disk mode"
                             .to_string(),
@@ -72,11 +68,7 @@ impl GlobalConfig {
                     errors
                         .push("New pool mode requires a ZFS partition (zfs_partition)".to_string());
                 }
-                if matches!(
-                    self.swap_mode,
-                    SwapMode::ZswapPartition | SwapMode::ZswapPartitionEncrypted
-                ) && self.swap_partition.is_none()
-                {
+                if uses_swap_partition && self.swap_partition.is_none() {
                     errors.push(
                         "Swap partition mode requires swap_partition in new pool mode".to_string(),
                     );
@@ -88,11 +80,7 @@ impl GlobalConfig {
                         "Existing pool mode requires an EFI partition (efi_partition)".to_string(),
                     );
                 }
-                if matches!(
-                    self.swap_mode,
-                    SwapMode::ZswapPartition | SwapMode::ZswapPartitionEncrypted
-                ) && self.swap_partition.is_none()
-                {
+                if uses_swap_partition && self.swap_partition.is_none() {
                     errors.push(
                         "Swap partition mode requires swap_partition in existing pool mode"
                             .to_string(),
@@ -1,3 +1,5 @@
+use std::sync::LazyLock;
+
 use color_eyre::eyre::{Result, bail};
 use zfskit::dataset::{CreateOptions, MountOptions};
 
@@ -6,28 +8,33 @@ pub struct DatasetConfig {
     pub properties: Vec<(String, String)>,
 }
 
-pub fn default_datasets() -> Vec<DatasetConfig> {
-    vec![
-        DatasetConfig {
-            name: "root".to_string(),
-            properties: vec![
-                ("mountpoint".to_string(), "/".to_string()),
-                ("canmount".to_string(), "noauto".to_string()),
-            ],
-        },
-        DatasetConfig {
-            name: "data/home".to_string(),
-            properties: vec![("mountpoint".to_string(), "/home".to_string())],
-        },
-        DatasetConfig {
-            name: "data/root".to_string(),
-            properties: vec![("mountpoint".to_string(), "/root".to_string())],
-        },
-        DatasetConfig {
-            name: "vm".to_string(),
-            properties: vec![("mountpoint".to_string(), "/vm".to_string())],
-        },
-    ]
+/// The boot environment layout every install creates. It never changes, so
+/// it is built on first use and shared instead of re-allocated per call.
+pub fn default_datasets() -> &'static [DatasetConfig] {
+    static DEFAULT: LazyLock<Vec<DatasetConfig>> = LazyLock::new(|| {
+        vec![
+            DatasetConfig {
+                name: "root".to_string(),
+                properties: vec![
+                    ("mountpoint".to_string(), "/".to_string()),
+                    ("canmount".to_string(), "noauto".to_string()),
+                ],
+            },
+            DatasetConfig {
+                name: "data/home".to_string(),
+                properties: vec![("mountpoint".to_string(), "/home".to_string())],
+            },
+            DatasetConfig {
+                name: "data/root".to_string(),
+                properties: vec![("mountpoint".to_string(), "/root".to_string())],
+            },
+            DatasetConfig {
+                name: "vm".to_string(),
+                properties: vec![("mountpoint".to_string(), "/vm".to_string())],
+            },
+        ]
+    });
+    &DEFAULT
 }
 
 fn properties_to_opts(props: &[(&str, &str)]) -> CreateOptions {
@@ -75,28 +82,28 @@ pub async fn create_child_datasets(
     let mut sorted: Vec<&DatasetConfig> = datasets.iter().collect();
     sorted.sort_by_key(|d| d.name.matches('/').count());
 
-    let mut created: std::collections::HashSet<String> = std::collections::HashSet::new();
+    // The base is formatted once; `created` tracks names relative to it,
+    // borrowed from the layout.
+    let base = format!("{pool_name}/{prefix}");
+    let mut created: std::collections::HashSet<&str> = std::collections::HashSet::new();
 
     for ds in sorted {
         // Auto-create parent datasets if needed (e.g., "data" before "data/home")
-        let parts: Vec<&str> = ds.name.split('/').collect();
-        if parts.len() > 1 {
-            let parent = parts[..parts.len() - 1].join("/");
-            let parent_full = format!("{pool_name}/{prefix}/{parent}");
-            if !created.contains(&parent_full) {
-                create_dataset(zfs, &parent_full, &[("mountpoint", "none")]).await?;
-                created.insert(parent_full);
-            }
+        if let Some((parent, _)) = ds.name.rsplit_once('/')
+            && created.insert(parent)
+        {
+            let parent_full = format!("{base}/{parent}");
+            create_dataset(zfs, &parent_full, &[("mountpoint", "none")]).await?;
         }
 
-        let full_name = format!("{pool_name}/{prefix}/{}", ds.name);
+        let full_name = format!("{base}/{}", ds.name);
         let props: Vec<(&str, &str)> = ds
             .properties
             .iter()
             .map(|(k, v)| (k.as_str(), v.as_str()))
             .collect();
         create_dataset(zfs, &full_name, &props).await?;
-        created.insert(full_name);
+        created.insert(&ds.name);
     }
     Ok(())
 }
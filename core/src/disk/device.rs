@@ -1,6 +1,6 @@
 use std::collections::HashMap;
 use std::fs;
-use std::path::{Path, PathBuf};
+use std::path::{Component, Path, PathBuf};
 use std::process::Command;
 
 use color_eyre::eyre::{Result, WrapErr};
@@ -556,9 +556,12 @@ fn collect_alias_dir(
     for entry in fs::read_dir(dir).wrap_err_with(|| format!("failed to read {}", dir.display()))? {
         let entry = entry?;
         let path = entry.path();
-        let Ok(target) = fs::canonicalize(&path) else {
+        // udev links point straight at the device node (`../../sda1`), so
+        // one readlink resolves them; canonicalize would walk every component.
+        let Ok(link) = fs::read_link(&path) else {
             continue;
         };
+        let target = resolve_link_target(dir, &link);
 
         aliases
             .entry(target)
@@ -569,6 +572,47 @@ fn collect_alias_dir(
     Ok(())
 }
 
+/// The device node behind `path`: a `/dev/disk/by-*` link is resolved with
+/// one readlink, anything that isn't a link is returned as is.
+pub(crate) fn device_node(path: &Path) -> PathBuf {
+    match fs::read_link(path) {
+        Ok(link) => resolve_link_target(path.parent().unwrap_or(Path::new("/")), &link),
+        Err(_) => path.to_path_buf(),
+    }
+}
+
+/// The PARTUUID of a partition, taken from the udev links in
+/// `/dev/disk/by-partuuid` rather than probing the device with blkid.
+/// `None` if no link points at it.
+pub fn partuuid_of(partition: &Path) -> Option<String> {
+    partuuid_in(Path::new("/dev/disk/by-partuuid"), partition)
+}
+
+fn partuuid_in(dir: &Path, partition: &Path) -> Option<String> {
+    let node = device_node(partition);
+    fs::read_dir(dir).ok()?.flatten().find_map(|entry| {
+        let link = fs::read_link(entry.path()).ok()?;
+        (resolve_link_target(dir, &link) == node)
+            .then(|| entry.file_name().to_string_lossy().into_owned())
+    })
+}
+
+/// Resolve a symlink target relative to the directory holding the link,
+/// folding `.` and `..` lexically.
+fn resolve_link_target(dir: &Path, link: &Path) -> PathBuf {
+    let mut resolved = PathBuf::new();
+    for component in dir.join(link).components() {
+        match component {
+            Component::CurDir => {}
+            Component::ParentDir => {
+                resolved.pop();
+            }
+            other => resolved.push(other),
+        }
+    }
+    resolved
+}
+
 fn alias_preference_key(alias: &DevicePath) -> (u8, String) {
     let name = alias
         .path
@@ -971,6 +1015,46 @@ mod tests {
         assert!(!partitions[0].removable);
     }
 
+    #[test]
+    fn resolve_link_target_follows_udev_links() {
+        let by_id = Path::new("/dev/disk/by-id");
+        assert_eq!(
+            resolve_link_target(by_id, Path::new("../../nvme0n1p2")),
+            PathBuf::from("/dev/nvme0n1p2")
+        );
+        assert_eq!(
+            resolve_link_target(by_id, Path::new("/dev/sda")),
+            PathBuf::from("/dev/sda")
+        );
+    }
+
+    #[test]
+    fn partuuid_in_matches_aliases_of_the_same_node() {
+        use std::os::unix::fs::symlink;
+
+        let dir = tempfile::tempdir().unwrap();
+        let root = dir.path();
+        for sub in ["by-partuuid", "by-id"] {
+            fs::create_dir(root.join(sub)).unwrap();
+        }
+        fs::write(root.join("sda2"), "").unwrap();
+        fs::write(root.join("sda3"), "").unwrap();
+        symlink("../sda2", root.join("by-partuuid/1111-aaaa")).unwrap();
+        symlink("../sda3", root.join("by-partuuid/2222-bbbb")).unwrap();
+        symlink("../sda3", root.join("by-id/ata-disk-part3")).unwrap();
+
+        let by_partuuid = root.join("by-partuuid");
+        assert_eq!(
+            partuuid_in(&by_partuuid, &root.join("by-id/ata-disk-part3")).as_deref(),
+            Some("2222-bbbb")
+        );
+        assert_eq!(
+            partuuid_in(&by_partuuid, &root.join("sda2")).as_deref(),
+            Some("1111-aaaa")
+        );
+        assert_eq!(partuuid_in(&by_partuuid, &root.join("sda4")), None);
+    }
+
     #[test]
     fn parent_devnode_for_partition_handles_common_names() {
         assert_eq!(
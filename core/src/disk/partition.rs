@@ -63,59 +63,23 @@ pub fn create_partitions(
 ) -> Result<PartitionLayout> {
     let disk_str = disk.to_string_lossy();
 
-    // Create GPT table
-    let output = runner.run("sgdisk", &["-o", &disk_str])?;
-    check_exit(&output, "sgdisk create GPT")?;
-
-    // Partition 1: EFI (500M)
-    let output = runner.run(
-        "sgdisk",
-        &["-n", "1:0:+500M", "-t", "1:ef00", "-c", "1:EFI", &disk_str],
-    )?;
-    check_exit(&output, "sgdisk create EFI partition")?;
-
-    let layout = if let Some(swap_sz) = swap_size {
-        // Partition 3: Swap (at end of disk)
-        let swap_spec = format!("-{swap_sz}:0");
-        let output = runner.run(
-            "sgdisk",
-            &[
-                "-n",
-                &format!("3:{swap_spec}"),
-                "-t",
-                "3:8200",
-                "-c",
-                "3:swap",
-                &disk_str,
-            ],
-        )?;
-        check_exit(&output, "sgdisk create swap partition")?;
-
-        // Partition 2: ZFS (remaining space)
-        let output = runner.run(
-            "sgdisk",
-            &["-n", "2:0:0", "-t", "2:bf00", "-c", "2:ZFS", &disk_str],
-        )?;
-        check_exit(&output, "sgdisk create ZFS partition")?;
-
-        PartitionLayout {
-            efi_part_num: 1,
-            zfs_part_num: 2,
-            swap_part_num: Some(3),
-        }
-    } else {
-        // Partition 2: ZFS (rest of disk)
-        let output = runner.run(
-            "sgdisk",
-            &["-n", "2:0:0", "-t", "2:bf00", "-c", "2:ZFS", &disk_str],
-        )?;
-        check_exit(&output, "sgdisk create ZFS partition")?;
-
-        PartitionLayout {
-            efi_part_num: 1,
-            zfs_part_num: 2,
-            swap_part_num: None,
-        }
+    // One sgdisk run for the whole layout: it applies its options in the
+    // order given, so this is the same sequence of table edits without a
+    // separate process (and GPT re-read/re-write) per partition.
+    // 1: EFI (500M), 3: swap (at end of disk, optional), 2: ZFS (the rest).
+    let mut args: Vec<&str> = vec!["-o", "-n", "1:0:+500M", "-t", "1:ef00", "-c", "1:EFI"];
+    let swap_new = swap_size.map(|sz| format!("3:-{sz}:0"));
+    if let Some(ref swap_new) = swap_new {
+        args.extend_from_slice(&["-n", swap_new, "-t", "3:8200", "-c", "3:swap"]);
+    }
+    args.extend_from_slice(&["-n", "2:0:0", "-t", "2:bf00", "-c", "2:ZFS", &disk_str]);
+    let output = runner.run("sgdisk", &args)?;
+    check_exit(&output, "sgdisk create partitions")?;
+
+    let layout = PartitionLayout {
+        efi_part_num: 1,
+        zfs_part_num: 2,
+        swap_part_num: swap_size.map(|_| 3),
     };
 
     // Inform kernel and udev about partition changes
@@ -230,9 +194,9 @@ mod tests {
     #[test]
     fn test_create_partitions_no_swap() {
         let responses = vec![
-            CannedResponse::default(), // sgdisk -o
-            CannedResponse::default(), // sgdisk EFI
-            CannedResponse::default(), // sgdisk ZFS
+            CannedResponse::default(), // sgdisk
+            CannedResponse::default(), // partprobe
+            CannedResponse::default(), // udevadm settle
             CannedResponse::default(), // mkfs.fat
         ];
         let runner = RecordingRunner::new(responses);
@@ -242,15 +206,19 @@ mod tests {
         assert_eq!(layout.efi_part_num, 1);
         assert_eq!(layout.zfs_part_num, 2);
         assert!(layout.swap_part_num.is_none());
+
+        let calls = runner.calls();
+        let sgdisk: Vec<_> = calls.iter().filter(|c| c.program == "sgdisk").collect();
+        assert_eq!(sgdisk.len(), 1);
+        assert!(!sgdisk[0].args.iter().any(|a| a.starts_with("3:")));
     }
 
     #[test]
     fn test_create_partitions_with_swap() {
         let responses = vec![
-            CannedResponse::default(), // sgdisk -o
-            CannedResponse::default(), // sgdisk EFI
-            CannedResponse::default(), // sgdisk swap
-            CannedResponse::default(), // sgdisk ZFS
+            CannedResponse::default(), // sgdisk
+            CannedResponse::default(), // partprobe
+            CannedResponse::default(), // udevadm settle
             CannedResponse::default(), // mkfs.fat
         ];
         let runner = RecordingRunner::new(responses);
@@ -260,6 +228,14 @@ mod tests {
         assert_eq!(layout.efi_part_num, 1);
         assert_eq!(layout.zfs_part_num, 2);
         assert_eq!(layout.swap_part_num, Some(3));
+
+        // Swap is carved from the end before ZFS takes the remaining space.
+        let calls = runner.calls();
+        assert_eq!(calls[0].program, "sgdisk");
+        assert_eq!(calls[0].args.last().unwrap(), "/dev/disk/by-id/test-disk");
+        let swap = calls[0].args.iter().position(|a| a == "3:-8G:0").unwrap();
+        let zfs = calls[0].args.iter().position(|a| a == "2:0:0").unwrap();
+        assert!(swap < zfs);
     }
 
     #[test]
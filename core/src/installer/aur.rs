@@ -3,7 +3,7 @@ use std::sync::Arc;
 
 use color_eyre::eyre::{Result, bail};
 
-use crate::system::cmd::{CommandRunner, check_exit, chroot, chroot_cmd, shell_quote};
+use crate::system::cmd::{CommandRunner, check_exit, chroot_cmd, chroot_quiet, shell_quote};
 
 const TEMP_USER: &str = "aurinstall";
 
@@ -122,12 +122,23 @@ fn setup_aur_environment(
     cancel: &tokio_util::sync::CancellationToken,
     download_config: crate::system::async_download::DownloadConfig,
 ) -> Result<()> {
-    // Install git and sudo via libalpm (base-devel already in base install)
-    let target_conf = target.join("etc/pacman.conf");
-    let mut ctx =
-        crate::system::alpm_pacman::AlpmContext::for_target(target, &target_conf, download_config)?;
-    ctx.sync_databases(false)?;
-    ctx.install_packages(&["git", "sudo"], cancel, None)?;
+    // The base install already brings git and sudo (via base-devel); only
+    // open a libalpm transaction, with its database sync, for what's missing.
+    let missing: Vec<&str> = [("git", "usr/bin/git"), ("sudo", "usr/bin/sudo")]
+        .into_iter()
+        .filter(|(_, bin)| !target.join(bin).exists())
+        .map(|(pkg, _)| pkg)
+        .collect();
+    if !missing.is_empty() {
+        let target_conf = target.join("etc/pacman.conf");
+        let mut ctx = crate::system::alpm_pacman::AlpmContext::for_target(
+            target,
+            &target_conf,
+            download_config,
+        )?;
+        ctx.sync_databases(false)?;
+        ctx.install_packages(&missing, cancel, None)?;
+    }
 
     // Create temp user
     let output = chroot_cmd(runner, target, "useradd", &["-m", TEMP_USER])?;
@@ -157,7 +168,7 @@ fn install_single_aur_package(
          cd {quoted_pkg} && \
          makepkg -si --noconfirm --needed --skippgpcheck'"
     );
-    let output = chroot(runner, target, &cmd)?;
+    let output = chroot_quiet(runner, target, &cmd)?;
     check_exit(&output, &format!("AUR install {package}"))?;
     Ok(())
 }
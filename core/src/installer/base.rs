@@ -1,36 +1,35 @@
 use std::path::Path;
 
+use alpm::SigLevel;
 use color_eyre::eyre::Result;
 use tokio_util::sync::CancellationToken;
 
 use crate::config::types::GlobalConfig;
 use crate::system::alpm_pacman::{AlpmContext, TargetMounts};
 use crate::system::async_download::DownloadConfig;
-use crate::system::cmd::CommandRunner;
 use crate::system::sysinfo;
 
-/// Install base system packages into target.
-/// Returns `TargetMounts` which must be kept alive for the duration of the
-/// installation — dropping it unmounts API filesystems (proc, sys, dev, etc.).
-pub fn install_base(
-    _runner: &dyn CommandRunner,
-    target: &Path,
-    config: &GlobalConfig,
-    cancel: &CancellationToken,
-    progress_tx: Option<
-        std::sync::Arc<tokio::sync::watch::Sender<crate::system::async_download::DownloadProgress>>,
-    >,
-) -> Result<TargetMounts> {
+/// Packages pacstrapped into the target: base system, firmware, the selected
+/// kernels, the initramfs generator and the CPU's microcode. `git` is here
+/// for the AUR builds (ZFSBootMenu is always one), so they don't need a
+/// transaction of their own.
+pub fn base_packages(config: &GlobalConfig) -> Vec<&str> {
     let mut packages: Vec<&str> = vec![
         "base",
         "base-devel",
+        "git",
         "linux-firmware",
         "linux-firmware-marvell",
         "sof-firmware",
     ];
 
-    // Add selected kernels
-    packages.extend(config.effective_kernels());
+    // Add selected kernels. A kernel listed twice would make libalpm reject
+    // the transaction as a duplicate target.
+    for kernel in config.effective_kernels() {
+        if !packages.contains(&kernel) {
+            packages.push(kernel);
+        }
+    }
 
     // Add initramfs package
     let initramfs_pkg = match config.init_system {
@@ -44,6 +43,28 @@ pub fn install_base(
         packages.push(ucode);
     }
 
+    packages
+}
+
+/// Install base system packages into target, together with the ZFS packages
+/// for the primary kernel: one libalpm transaction, so one dependency
+/// resolution, download batch and hook run (depmod, DKMS, initramfs) instead
+/// of a second transaction for ZFS.
+/// Returns `TargetMounts` which must be kept alive for the duration of the
+/// installation — dropping it unmounts API filesystems (proc, sys, dev, etc.).
+pub fn install_base(
+    target: &Path,
+    config: &GlobalConfig,
+    cancel: &CancellationToken,
+    progress_tx: Option<
+        std::sync::Arc<tokio::sync::watch::Sender<crate::system::async_download::DownloadProgress>>,
+    >,
+) -> Result<TargetMounts> {
+    let zfs_packages =
+        crate::kernel::get_zfs_packages(config.primary_kernel(), config.zfs_module_mode);
+    let mut packages = base_packages(config);
+    packages.extend(zfs_packages.iter().map(String::as_str));
+
     // Set parallel downloads on host before installing
     crate::system::pacman::set_parallel_downloads(None, config.parallel_downloads)?;
 
@@ -59,6 +80,17 @@ pub fn install_base(
             ..Default::default()
         },
     )?;
+    // The host's pacman.conf only lists archzfs when Phase 0 had to install
+    // ZFS on the host; otherwise register it for this transaction. No
+    // signature checks, matching the `SigLevel = Never` stanza
+    // add_archzfs_repo writes: the target has no archzfs keys yet.
+    if !ctx.has_repo("archzfs") {
+        ctx.register_repo(
+            "archzfs",
+            &[crate::system::pacman::ARCHZFS_SERVER],
+            SigLevel::empty(),
+        )?;
+    }
     ctx.sync_databases(false)?;
     ctx.install_packages(&packages, cancel, progress_tx)?;
     ctx.finalize_target()?;
@@ -71,7 +103,30 @@ pub fn install_base(
     Ok(target_mounts)
 }
 
-// Note: install_base now uses AlpmContext directly (libalpm) instead of
-// shelling out to pacstrap. It can only be tested with a real pacman
-// environment (QEMU). The package list construction logic is straightforward
-// enough that unit testing the full flow is not necessary.
+// install_base itself drives libalpm against a real target and can only be
+// exercised in QEMU; the package list is tested here.
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::config::types::InitSystem;
+
+    #[test]
+    fn test_base_packages() {
+        let config = GlobalConfig {
+            init_system: InitSystem::Dracut,
+            kernels: Some(vec![
+                "linux-lts".to_string(),
+                "linux".to_string(),
+                "linux-lts".to_string(),
+            ]),
+            ..Default::default()
+        };
+        let packages = base_packages(&config);
+        assert_eq!(packages[0], "base");
+        assert!(packages.contains(&"dracut"));
+        assert!(packages.contains(&"git"));
+        assert!(!packages.contains(&"mkinitcpio"));
+        assert_eq!(packages.iter().filter(|p| **p == "linux-lts").count(), 1);
+        assert_eq!(packages.iter().filter(|p| **p == "linux").count(), 1);
+    }
+}
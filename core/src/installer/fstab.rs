@@ -17,8 +17,10 @@ pub fn generate_fstab(
     let output = runner.run("genfstab", &["-U", &target_str])?;
     check_exit(&output, "genfstab")?;
 
-    // Filter out ZFS lines and fix EFI mount options
-    let fstab_content: String = output
+    // Filter out ZFS lines and fix EFI mount options, building the whole
+    // file in one buffer that is written out once at the end.
+    let mut final_fstab = String::with_capacity(output.stdout.len() + 128);
+    for (n, line) in output
         .stdout
         .lines()
         .filter(|line| {
@@ -30,58 +32,70 @@ pub fn generate_fstab(
             // Filter out ZFS-managed mounts
             !trimmed.contains("zfs") && !trimmed.contains(pool_name)
         })
-        .map(|line| {
-            // For the EFI mount (/boot/efi vfat), set passno to 0 (no fsck
-            // for vfat) and ensure nofail so a failed mount doesn't block boot
-            if line.contains("/boot/efi") && line.contains("vfat") && !line.trim().starts_with('#')
-            {
-                let mut fixed = line.to_string();
-                // Inject nofail into mount options
-                if !fixed.contains("nofail") {
-                    fixed = fixed.replacen("\trw,", "\trw,nofail,", 1);
-                }
-                // Replace passno 2 or 1 with 0 at end of line
-                if fixed.ends_with("\t0\t2") || fixed.ends_with("\t0\t1") {
-                    let len = fixed.len();
-                    fixed.replace_range(len - 3.., "0\t0");
-                }
-                fixed
-            } else {
-                line.to_string()
+        .enumerate()
+    {
+        if n > 0 {
+            final_fstab.push('\n');
+        }
+        // For the EFI mount (/boot/efi vfat), set passno to 0 (no fsck
+        // for vfat) and ensure nofail so a failed mount doesn't block boot
+        if line.contains("/boot/efi") && line.contains("vfat") && !line.trim().starts_with('#') {
+            let mut fixed = line.to_string();
+            // Inject nofail into mount options
+            if !fixed.contains("nofail") {
+                fixed = fixed.replacen("\trw,", "\trw,nofail,", 1);
             }
-        })
-        .collect::<Vec<_>>()
-        .join("\n");
+            // Replace passno 2 or 1 with 0 at end of line
+            if fixed.ends_with("\t0\t2") || fixed.ends_with("\t0\t1") {
+                let len = fixed.len();
+                fixed.replace_range(len - 3.., "0\t0");
+            }
+            final_fstab.push_str(&fixed);
+        } else {
+            final_fstab.push_str(line);
+        }
+    }
 
     // Add root dataset explicitly
     let root_ds = format!("{pool_name}/{prefix}/root");
-    let mut final_fstab = fstab_content;
     final_fstab.push_str(&format!(
         "\n# ZFS root dataset\n{root_ds}\t/\tzfs\tdefaults\t0\t0\n"
     ));
 
-    // Write fstab
+    // Swap is configured before this runs, and genfstab only lists active
+    // swap, so carry over the entries add_swap_entry already wrote.
     let fstab_path = target.join("etc/fstab");
+    let previous = fs::read_to_string(&fstab_path).unwrap_or_default();
+    let swap_lines: Vec<&str> = previous
+        .lines()
+        .filter(|line| line.split_whitespace().nth(2) == Some("swap"))
+        .filter(|line| !has_entry(&final_fstab, first_field(line)))
+        .collect();
+    if !swap_lines.is_empty() {
+        final_fstab.push_str("\n# Swap\n");
+        for line in swap_lines {
+            final_fstab.push_str(line);
+            final_fstab.push('\n');
+        }
+    }
+
+    // Write fstab
     if let Some(parent) = fstab_path.parent() {
         fs::create_dir_all(parent)?;
     }
-    fs::write(&fstab_path, final_fstab).wrap_err("failed to write fstab")?;
+    crate::system::fs::write_atomic(&fstab_path, final_fstab).wrap_err("failed to write fstab")?;
 
     tracing::info!("generated fstab");
     Ok(())
 }
 
 pub fn add_swap_entry(target: &Path, device: &str) -> Result<()> {
-    let fstab_path = target.join("etc/fstab");
-    let mut content = if fstab_path.exists() {
-        fs::read_to_string(&fstab_path)?
-    } else {
-        String::new()
-    };
-
-    content.push_str(&format!("\n# Swap\n{device}\tnone\tswap\tdefaults\t0\t0\n"));
-    fs::write(&fstab_path, content)?;
-    Ok(())
+    append_entry(
+        &target.join("etc/fstab"),
+        0o644,
+        device,
+        &format!("\n# Swap\n{device}\tnone\tswap\tdefaults\t0\t0\n"),
+    )
 }
 
 pub fn add_cryptswap_entry(target: &Path, device: &str) -> Result<()> {
@@ -90,15 +104,13 @@ pub fn add_cryptswap_entry(target: &Path, device: &str) -> Result<()> {
     if let Some(parent) = crypttab_path.parent() {
         fs::create_dir_all(parent)?;
     }
-    let mut crypttab = if crypttab_path.exists() {
-        fs::read_to_string(&crypttab_path)?
-    } else {
-        String::new()
-    };
-    crypttab.push_str(&format!(
-        "cryptswap\t{device}\t/dev/urandom\tswap,cipher=aes-xts-plain64,size=256\n"
-    ));
-    fs::write(&crypttab_path, crypttab)?;
+    append_entry(
+        &crypttab_path,
+        // crypttab can name key files; keep it root-only like the stock one.
+        0o600,
+        "cryptswap",
+        &format!("cryptswap\t{device}\t/dev/urandom\tswap,cipher=aes-xts-plain64,size=256\n"),
+    )?;
 
     // Add fstab entry for the decrypted device
     add_swap_entry(target, "/dev/mapper/cryptswap")?;
@@ -106,6 +118,39 @@ pub fn add_cryptswap_entry(target: &Path, device: &str) -> Result<()> {
     Ok(())
 }
 
+/// Append `text` to the table at `path` unless a line already starts with
+/// `key` (the device or mapping name), so re-running doesn't duplicate it.
+/// The check and the append share one open of the file, which also sets
+/// `mode` if it creates the table.
+fn append_entry(path: &Path, mode: u32, key: &str, text: &str) -> Result<()> {
+    use std::io::{Read, Write};
+    use std::os::unix::fs::OpenOptionsExt;
+
+    let mut file = fs::OpenOptions::new()
+        .read(true)
+        .append(true)
+        .create(true)
+        .mode(mode)
+        .open(path)
+        .wrap_err_with(|| format!("failed to open {}", path.display()))?;
+    let mut content = String::new();
+    file.read_to_string(&mut content)?;
+    if has_entry(&content, key) {
+        tracing::debug!(path = %path.display(), key, "entry already present");
+        return Ok(());
+    }
+    file.write_all(text.as_bytes())?;
+    Ok(())
+}
+
+fn has_entry(table: &str, key: &str) -> bool {
+    table.lines().any(|line| first_field(line) == key)
+}
+
+fn first_field(line: &str) -> &str {
+    line.split_whitespace().next().unwrap_or_default()
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -150,6 +195,25 @@ testpool/arch0/data/home /home zfs defaults 0 0
         assert!(fstab.contains("swap"));
     }
 
+    #[test]
+    fn test_swap_entries_survive_genfstab() {
+        let dir = tempfile::tempdir().unwrap();
+        fs::create_dir_all(dir.path().join("etc")).unwrap();
+
+        add_swap_entry(dir.path(), "/dev/sda3").unwrap();
+        add_swap_entry(dir.path(), "/dev/sda3").unwrap();
+
+        let runner = RecordingRunner::new(vec![CannedResponse {
+            stdout: "# /etc/fstab\n".into(),
+            ..Default::default()
+        }]);
+        generate_fstab(&runner, dir.path(), "testpool", "arch0").unwrap();
+
+        let fstab = fs::read_to_string(dir.path().join("etc/fstab")).unwrap();
+        assert_eq!(fstab.matches("/dev/sda3\tnone\tswap").count(), 1);
+        assert!(fstab.contains("testpool/arch0/root\t/\tzfs"));
+    }
+
     #[test]
     fn test_add_cryptswap_entry() {
         let dir = tempfile::tempdir().unwrap();
@@ -161,6 +225,11 @@ testpool/arch0/data/home /home zfs defaults 0 0
         let crypttab = fs::read_to_string(dir.path().join("etc/crypttab")).unwrap();
         assert!(crypttab.contains("cryptswap"));
         assert!(crypttab.contains("/dev/disk/by-id/test-part3"));
+        {
+            use std::os::unix::fs::PermissionsExt;
+            let meta = fs::metadata(dir.path().join("etc/crypttab")).unwrap();
+            assert_eq!(meta.permissions().mode() & 0o777, 0o600);
+        }
 
         let fstab = fs::read_to_string(dir.path().join("etc/fstab")).unwrap();
         assert!(fstab.contains("/dev/mapper/cryptswap"));
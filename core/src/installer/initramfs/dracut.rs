@@ -3,7 +3,7 @@ use std::path::Path;
 
 use color_eyre::eyre::{Context, Result};
 
-use crate::system::cmd::{CommandRunner, check_exit, chroot};
+use crate::system::cmd::{CommandRunner, check_exit, chroot_quiet};
 
 const DRACUT_ZFS_CONF: &str = r#"hostonly="yes"
 hostonly_cmdline="no"
@@ -110,7 +110,7 @@ pub fn generate(runner: &dyn CommandRunner, target: &Path) -> Result<()> {
         "install -Dm0644 /usr/lib/modules/$kver/vmlinuz /boot/vmlinuz-$pkgbase; ",
         "dracut --force /boot/initramfs-$pkgbase.img --kver $kver",
     );
-    let output = chroot(runner, target, cmd)?;
+    let output = chroot_quiet(runner, target, cmd)?;
     check_exit(&output, "dracut generate initramfs")?;
     tracing::info!("generated initramfs with dracut");
     Ok(())
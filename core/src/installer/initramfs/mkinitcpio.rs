@@ -3,7 +3,7 @@ use std::path::Path;
 
 use color_eyre::eyre::{Context, Result};
 
-use crate::system::cmd::{CommandRunner, check_exit, chroot_cmd};
+use crate::system::cmd::{CommandRunner, check_exit, chroot_cmd_quiet};
 
 pub fn configure(target: &Path, encryption: bool) -> Result<()> {
     let conf_path = target.join("etc/mkinitcpio.conf");
@@ -17,7 +17,7 @@ pub fn configure(target: &Path, encryption: bool) -> Result<()> {
 
     // Ensure zfs is in MODULES
     new_content = patch_conf_array(&new_content, "MODULES", |modules| {
-        if !modules.contains(&"zfs".to_string()) {
+        if !modules.iter().any(|m| m == "zfs") {
             modules.push("zfs".to_string());
         }
     });
@@ -27,16 +27,16 @@ pub fn configure(target: &Path, encryption: bool) -> Result<()> {
     // if present, then insert zfs before filesystems.
     new_content = patch_conf_array(&new_content, "HOOKS", |hooks| {
         // Replace systemd hooks with udev equivalents
-        if hooks.contains(&"systemd".to_string()) {
+        if hooks.iter().any(|h| h == "systemd") {
             hooks.retain(|h| h != "systemd" && h != "sd-vconsole");
-            if !hooks.contains(&"udev".to_string()) {
+            if !hooks.iter().any(|h| h == "udev") {
                 if let Some(pos) = hooks.iter().position(|h| h == "base") {
                     hooks.insert(pos + 1, "udev".to_string());
                 } else {
                     hooks.insert(0, "udev".to_string());
                 }
             }
-            if !hooks.contains(&"keymap".to_string()) {
+            if !hooks.iter().any(|h| h == "keymap") {
                 if let Some(pos) = hooks.iter().position(|h| h == "keyboard") {
                     hooks.insert(pos + 1, "keymap".to_string());
                 } else if let Some(pos) = hooks.iter().position(|h| h == "udev") {
@@ -44,13 +44,22 @@ pub fn configure(target: &Path, encryption: bool) -> Result<()> {
                 }
             }
         }
-        // Insert zfs before filesystems
-        if !hooks.contains(&"zfs".to_string()) {
-            if let Some(pos) = hooks.iter().position(|h| h == "filesystems") {
-                hooks.insert(pos, "zfs".to_string());
-            } else {
-                hooks.push("zfs".to_string());
+        // Insert zfs before filesystems, rebuilding the list in one walk.
+        // A list that already has zfs is left alone so re-running is a no-op.
+        if !hooks.iter().any(|h| h == "zfs") {
+            let mut out = Vec::with_capacity(hooks.len() + 1);
+            let mut inserted = false;
+            for hook in hooks.drain(..) {
+                if !inserted && hook == "filesystems" {
+                    out.push("zfs".to_string());
+                    inserted = true;
+                }
+                out.push(hook);
             }
+            if !inserted {
+                out.push("zfs".to_string());
+            }
+            *hooks = out;
         }
     });
 
@@ -73,7 +82,7 @@ pub fn configure(target: &Path, encryption: bool) -> Result<()> {
 }
 
 pub fn generate(runner: &dyn CommandRunner, target: &Path) -> Result<()> {
-    let output = chroot_cmd(runner, target, "mkinitcpio", &["-P"])?;
+    let output = chroot_cmd_quiet(runner, target, "mkinitcpio", &["-P"])?;
     check_exit(&output, "mkinitcpio -P")?;
     tracing::info!("generated initramfs with mkinitcpio");
     Ok(())
@@ -81,37 +90,37 @@ pub fn generate(runner: &dyn CommandRunner, target: &Path) -> Result<()> {
 
 fn patch_conf_array(content: &str, key: &str, f: impl FnOnce(&mut Vec<String>)) -> String {
     let prefix = format!("{key}=(");
-    let mut result = String::new();
-    let mut found = false;
-    let mut pending_values: Option<Vec<String>> = None;
+    let mut result = String::with_capacity(content.len() + 16);
+    // Where each active `KEY=(...)` line landed in `result`. The values come
+    // from the last one, which is the definition bash ends up using.
+    let mut spans: Vec<std::ops::Range<usize>> = Vec::new();
+    let mut values: Vec<String> = Vec::new();
 
     for line in content.lines() {
         let trimmed = line.trim();
         if trimmed.starts_with(&prefix) && !trimmed.starts_with('#') {
-            found = true;
             let inner = trimmed
                 .strip_prefix(&prefix)
                 .and_then(|s| s.strip_suffix(')'))
                 .unwrap_or("");
-            let values: Vec<String> = inner.split_whitespace().map(|s| s.to_string()).collect();
-            pending_values = Some(values);
-            // placeholder, will be replaced after loop
-            result.push_str(&format!("__PLACEHOLDER_{key}__\n"));
-        } else {
-            result.push_str(line);
-            result.push('\n');
+            values = inner.split_whitespace().map(|s| s.to_string()).collect();
+            spans.push(result.len()..result.len() + line.len());
         }
+        result.push_str(line);
+        result.push('\n');
     }
 
-    let mut values = pending_values.unwrap_or_default();
     f(&mut values);
     let new_line = format!("{key}=({})", values.join(" "));
 
-    if found {
-        result = result.replace(&format!("__PLACEHOLDER_{key}__"), &new_line);
-    } else {
+    if spans.is_empty() {
         result.push_str(&new_line);
         result.push('\n');
+    } else {
+        // Splice back to front so earlier offsets stay valid.
+        for span in spans.into_iter().rev() {
+            result.replace_range(span, &new_line);
+        }
     }
 
     result
@@ -119,14 +128,21 @@ fn patch_conf_array(content: &str, key: &str, f: impl FnOnce(&mut Vec<String>))
 
 fn set_conf_value(content: &str, key: &str, value: &str) -> String {
     let prefix = format!("{key}=");
-    let mut result = String::new();
+    // The replacement is the same for every matching line, so format it once.
+    let new_line = format!("{key}=\"{value}\"\n");
+    let mut result = String::with_capacity(content.len() + new_line.len());
     let mut found = false;
 
     for line in content.lines() {
         let trimmed = line.trim();
-        if trimmed.starts_with(&prefix) || trimmed.starts_with(&format!("#{prefix}")) {
+        // Commented-out defaults (`#KEY=...`) are replaced as well.
+        if trimmed
+            .strip_prefix('#')
+            .unwrap_or(trimmed)
+            .starts_with(&prefix)
+        {
             found = true;
-            result.push_str(&format!("{key}=\"{value}\"\n"));
+            result.push_str(&new_line);
         } else {
             result.push_str(line);
             result.push('\n');
@@ -134,7 +150,7 @@ fn set_conf_value(content: &str, key: &str, value: &str) -> String {
     }
 
     if !found {
-        result.push_str(&format!("{key}=\"{value}\"\n"));
+        result.push_str(&new_line);
     }
 
     result
@@ -157,6 +173,19 @@ mod tests {
         assert!(result.contains("zfs filesystems"));
     }
 
+    #[test]
+    fn test_patch_conf_array_keeps_surrounding_lines() {
+        let input = "# comment\n#MODULES=(old)\nMODULES=(crc32c)\nBINARIES=()\n";
+        let result = patch_conf_array(input, "MODULES", |m| m.push("zfs".to_string()));
+        assert_eq!(
+            result,
+            "# comment\n#MODULES=(old)\nMODULES=(crc32c zfs)\nBINARIES=()\n"
+        );
+
+        let appended = patch_conf_array("BINARIES=()\n", "FILES", |f| f.push("/k".to_string()));
+        assert_eq!(appended, "BINARIES=()\nFILES=(/k)\n");
+    }
+
     #[test]
     fn test_configure_mkinitcpio() {
         let dir = tempfile::tempdir().unwrap();
@@ -177,11 +206,36 @@ mod tests {
         assert!(content.contains("/etc/zfs/zroot.key"));
     }
 
+    #[test]
+    fn test_configure_mkinitcpio_idempotent() {
+        let dir = tempfile::tempdir().unwrap();
+        let conf_path = dir.path().join("etc/mkinitcpio.conf");
+        fs::create_dir_all(dir.path().join("etc")).unwrap();
+        fs::write(
+            &conf_path,
+            "MODULES=()\nHOOKS=(base systemd autodetect modconf block filesystems fsck)\n",
+        )
+        .unwrap();
+
+        configure(dir.path(), false).unwrap();
+        configure(dir.path(), false).unwrap();
+
+        let content = fs::read_to_string(&conf_path).unwrap();
+        assert!(content.contains("MODULES=(zfs)\n"));
+        assert!(
+            content
+                .contains("HOOKS=(base udev keymap autodetect modconf block zfs filesystems fsck)")
+        );
+    }
+
     #[test]
     fn test_set_conf_value() {
         let input = "#COMPRESSION=\"zstd\"\n";
         let result = set_conf_value(input, "COMPRESSION", "cat");
         assert!(result.contains("COMPRESSION=\"cat\""));
         assert!(!result.contains("#COMPRESSION"));
+
+        let appended = set_conf_value("MODULES=()\n", "COMPRESSION", "cat");
+        assert_eq!(appended, "MODULES=()\nCOMPRESSION=\"cat\"\n");
     }
 }
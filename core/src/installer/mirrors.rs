@@ -1,34 +1,18 @@
-use std::path::Path;
-
 use color_eyre::eyre::Result;
 
 use crate::system::cmd::{CommandRunner, check_exit};
 
-/// Configure pacman mirrors on the target using reflector with country filters.
-/// Runs reflector directly (not chrooted) and writes to target's mirrorlist.
-pub fn configure_mirrors(
-    runner: &dyn CommandRunner,
-    target: &Path,
-    countries: &[String],
-) -> Result<()> {
+/// Rank mirrors for `countries` with reflector and return the resulting
+/// mirrorlist, or `None` when no countries are configured. Does not touch the
+/// target, so it can run while the base system is still being installed.
+pub fn rank_mirrors(runner: &dyn CommandRunner, countries: &[String]) -> Result<Option<String>> {
     if countries.is_empty() {
-        return Ok(());
+        return Ok(None);
     }
 
     tracing::info!(?countries, "configuring mirrors with reflector");
 
-    let mirrorlist = format!("{}/etc/pacman.d/mirrorlist", target.display());
-
-    let mut args: Vec<&str> = vec![
-        "--latest",
-        "20",
-        "--protocol",
-        "https",
-        "--sort",
-        "rate",
-        "--save",
-        &mirrorlist,
-    ];
+    let mut args: Vec<&str> = vec!["--latest", "20", "--protocol", "https", "--sort", "rate"];
 
     // Add --country for each region
     for country in countries {
@@ -36,11 +20,12 @@ pub fn configure_mirrors(
         args.push(country);
     }
 
+    // Without --save, reflector prints the mirrorlist on stdout.
     let output = runner.run("reflector", &args)?;
     check_exit(&output, "reflector (mirror config)")?;
 
-    tracing::info!("mirrors configured for target");
-    Ok(())
+    tracing::info!("mirrors ranked");
+    Ok(Some(output.stdout))
 }
 
 /// List available reflector countries by running `reflector --list-countries`.
@@ -12,8 +12,7 @@ pub mod users;
 use std::path::{Path, PathBuf};
 use std::sync::Arc;
 
-use alpm::SigLevel;
-use color_eyre::eyre::{Result, bail};
+use color_eyre::eyre::{Context, Result, bail};
 use tokio_util::sync::CancellationToken;
 
 use crate::config::types::{GlobalConfig, InitSystem, SwapMode, ZfsEncryptionMode};
@@ -21,9 +20,13 @@ use crate::system::alpm_pacman::{AlpmContext, TargetMounts};
 use crate::system::async_download::{DownloadConfig, DownloadProgress};
 use crate::system::cmd::CommandRunner;
 
+/// Where the target system is assembled. The pool is imported with this
+/// altroot and every installer phase operates beneath it.
+pub const MOUNTPOINT: &str = "/mnt";
+
 pub struct Installer {
     pub runner: Arc<dyn CommandRunner>,
-    pub config: GlobalConfig,
+    pub config: Arc<GlobalConfig>,
     pub target: PathBuf,
     cancel: CancellationToken,
     download_progress_tx: Option<Arc<tokio::sync::watch::Sender<DownloadProgress>>>,
@@ -37,14 +40,14 @@ pub struct Installer {
 impl Installer {
     pub fn new(
         runner: Arc<dyn CommandRunner>,
-        config: GlobalConfig,
+        config: impl Into<Arc<GlobalConfig>>,
         target: &Path,
         cancel: CancellationToken,
         download_progress_tx: Option<Arc<tokio::sync::watch::Sender<DownloadProgress>>>,
     ) -> Self {
         Self {
             runner,
-            config,
+            config: config.into(),
             target: target.to_path_buf(),
             cancel,
             download_progress_tx,
@@ -70,14 +73,41 @@ impl Installer {
         // Phase 4: install base system via libalpm
         tracing::info!("Phase 4: Installing base system...");
         tracing::info!(target: "metrics", event = "phase_start", num = 4u32, name = "Installing base system");
-        let target_mounts = base::install_base(
-            &*self.runner,
-            &self.target,
-            &self.config,
-            &self.cancel,
-            self.download_progress_tx.clone(),
-        )?;
-        self._target_mounts = Some(target_mounts);
+        // Mirror ranking (reflector) is network-bound and independent of the
+        // base install, so it runs alongside it. The ranked list is kept in
+        // memory and written after the join, because finalize_target() copies
+        // the host mirrorlist over the target's at the end of install_base.
+        // reflector's rate test shares the link with the package downloads, so
+        // its ranking is skewed by that load; for a "top 20 by rate" list the
+        // skew is accepted in exchange for hiding reflector's runtime.
+        let mirror_regions = self
+            .config
+            .mirror_regions
+            .as_deref()
+            .filter(|regions| !regions.is_empty());
+        let (target_mounts, ranked) = std::thread::scope(|s| {
+            let ranking = mirror_regions.map(|regions| {
+                let runner = &*self.runner;
+                s.spawn(move || mirrors::rank_mirrors(runner, regions))
+            });
+            let target_mounts = base::install_base(
+                &self.target,
+                &self.config,
+                &self.cancel,
+                self.download_progress_tx.clone(),
+            );
+            let ranked = ranking.map(|h| h.join().expect("mirror ranking thread panicked"));
+            (target_mounts, ranked)
+        });
+        self._target_mounts = Some(target_mounts?);
+        if let Some(mirrorlist) = ranked.transpose()?.flatten() {
+            crate::system::fs::write_atomic(
+                &self.target.join("etc/pacman.d/mirrorlist"),
+                mirrorlist,
+            )
+            .wrap_err("failed to install ranked mirrorlist on target")?;
+            tracing::info!("mirrors configured for target");
+        }
 
         // Create a reusable AlpmContext for all subsequent package installs.
         // The target now has pacman.conf, keyring, and mirrorlist from finalize_target().
@@ -98,10 +128,11 @@ impl Installer {
         tracing::info!(target: "metrics", event = "phase_start", num = 5u32, name = "Configuring system");
         self.configure_system()?;
 
-        // Phase 6: archzfs repo on target + ZFS packages
-        tracing::info!("Phase 6: Installing ZFS packages on target...");
-        tracing::info!(target: "metrics", event = "phase_start", num = 6u32, name = "Installing ZFS packages");
-        self.install_zfs_on_target()?;
+        // Phase 6: archzfs repo and keys on target. The ZFS packages
+        // themselves went in with the Phase 4 transaction.
+        tracing::info!("Phase 6: Configuring archzfs repo on target...");
+        tracing::info!(target: "metrics", event = "phase_start", num = 6u32, name = "Configuring archzfs repo");
+        crate::system::pacman::add_archzfs_repo(&*self.runner, Some(&self.target))?;
 
         // Phase 7: Initramfs
         tracing::info!("Phase 7: Generating initramfs...");
@@ -113,12 +144,12 @@ impl Installer {
         tracing::info!(target: "metrics", event = "phase_start", num = 8u32, name = "Configuring users");
         self.configure_users()?;
 
-        // Phase 9: Profile packages + services
+        // Phase 9: Profile + additional repo packages, profile services
         tracing::info!("Phase 9: Installing profile packages...");
         tracing::info!(target: "metrics", event = "phase_start", num = 9u32, name = "Installing profile packages");
         self.install_profile()?;
 
-        // Phase 10: Additional packages + AUR
+        // Phase 10: AUR packages, extra services, post-install commands
         tracing::info!("Phase 10: Installing additional packages...");
         tracing::info!(target: "metrics", event = "phase_start", num = 10u32, name = "Installing additional packages");
         self.install_additional_packages()?;
@@ -167,11 +198,6 @@ impl Installer {
             services::enable_service(&*self.runner, &self.target, "systemd-timesyncd")?;
         }
 
-        // Mirror config
-        if let Some(ref regions) = self.config.mirror_regions {
-            mirrors::configure_mirrors(&*self.runner, &self.target, regions)?;
-        }
-
         // Network
         if self.config.network_copy_iso {
             network::copy_iso_network(&*self.runner, &self.target)?;
@@ -180,31 +206,6 @@ impl Installer {
         Ok(())
     }
 
-    fn install_zfs_on_target(&mut self) -> Result<()> {
-        // Edit pacman.conf and import GPG keys (still needs shell for pacman-key)
-        crate::system::pacman::add_archzfs_repo(&*self.runner, Some(&self.target))?;
-
-        // Register archzfs repo in the live alpm handle and sync
-        let ctx = self
-            .alpm_ctx
-            .as_mut()
-            .expect("alpm_ctx must be initialized");
-        ctx.register_repo(
-            "archzfs",
-            &["https://github.com/archzfs/archzfs/releases/download/experimental"],
-            SigLevel::PACKAGE_OPTIONAL | SigLevel::DATABASE_OPTIONAL,
-        )?;
-        ctx.sync_databases(true)?;
-
-        // Install ZFS packages via libalpm
-        let kernel = self.config.primary_kernel();
-        let zfs_packages = crate::kernel::get_zfs_packages(kernel, self.config.zfs_module_mode);
-        let pkg_refs: Vec<&str> = zfs_packages.iter().map(|s| s.as_str()).collect();
-        ctx.install_packages(&pkg_refs, &self.cancel, self.download_progress_tx.clone())?;
-
-        Ok(())
-    }
-
     fn generate_initramfs(&self) -> Result<()> {
         let encryption = self.config.zfs_encryption_mode != ZfsEncryptionMode::None;
 
@@ -259,43 +260,133 @@ impl Installer {
         Ok(())
     }
 
-    fn install_profile(&mut self) -> Result<()> {
-        if let Some(selection) = self.config.profile_selection.clone() {
-            let profile_name = selection.profile.clone();
-            if let Some(p) = selection.profile_def() {
-                // 1. Install packages (profile base + chosen optionals)
-                let pkgs = selection.resolved_packages();
-                if !pkgs.is_empty() {
-                    let pkg_refs: Vec<&str> = pkgs.iter().map(|s| s.as_str()).collect();
-                    self.install_target_packages(&pkg_refs)?;
-                }
+    /// Every package Phase 9 installs: profile base + chosen optionals, a
+    /// display-manager override, the seat-access provider, audio, bluetooth,
+    /// GPU driver, zram-generator for zram swap and the user's additional
+    /// repo packages. Deduplicated, in that order.
+    fn profile_packages(&self) -> Vec<String> {
+        let mut pkgs: Vec<String> = Vec::new();
+        let mut add = |pkg: &str| {
+            if !pkgs.iter().any(|p| p == pkg) {
+                pkgs.push(pkg.to_string());
+            }
+        };
 
-                // 2. Enable system services
-                for service in &p.services {
-                    services::enable_service(&*self.runner, &self.target, service)?;
-                }
+        if let Some(ref selection) = self.config.profile_selection
+            && let Some(p) = selection.profile_def()
+        {
+            for pkg in selection.resolved_packages() {
+                add(pkg.as_str());
+            }
+            if let Some(dm) = selection.display_manager_override
+                && p.default_display_manager() != Some(dm)
+            {
+                add(dm.package());
+            }
+            if p.needs_seat_access()
+                && let Some(seat) = selection.seat_access
+            {
+                add(seat.package());
+            }
+        }
+        if let Some(audio) = self.config.audio {
+            for &pkg in audio.packages() {
+                add(pkg);
+            }
+        }
+        if self.config.bluetooth {
+            add("bluez");
+            add("bluez-utils");
+        }
+        if let Some(driver) = self.config.gfx_driver {
+            for &pkg in driver.packages() {
+                add(pkg);
+            }
+        }
+        if self.config.swap_mode == SwapMode::Zram {
+            add("zram-generator");
+        }
+        for pkg in &self.config.additional_packages {
+            add(pkg.as_str());
+        }
+        pkgs
+    }
 
-                // 3. Enable user services globally
-                for service in &p.user_services {
-                    services::enable_user_service(&*self.runner, &self.target, service)?;
-                }
+    /// System services Phase 9 enables: the profile's own, the effective
+    /// display manager, seatd and bluetooth. Phase 10 skips these when they
+    /// are repeated in `extra_services`.
+    fn profile_services(&self) -> Vec<&str> {
+        let mut services: Vec<&str> = Vec::new();
+        if let Some(ref selection) = self.config.profile_selection
+            && let Some(p) = selection.profile_def()
+        {
+            services.extend(p.services.iter().map(|s| s.as_str()));
+            if let Some(dm) = selection.display_manager_for(p) {
+                services.push(dm.service());
+            }
+            if p.needs_seat_access()
+                && selection.seat_access == Some(crate::config::types::SeatAccess::Seatd)
+            {
+                services.push("seatd");
+            }
+        }
+        if self.config.bluetooth {
+            services.push("bluetooth");
+        }
+        services
+    }
+
+    /// User units Phase 9 enables globally: the profile's own followed by
+    /// the audio server's, each listed once. A profile that already ships
+    /// the PipeWire units would otherwise enable them a second time.
+    fn user_services(&self) -> Vec<&'static str> {
+        let mut units: Vec<&'static str> = Vec::new();
+        let profile_units = self
+            .config
+            .profile_selection
+            .as_ref()
+            .and_then(|s| s.profile_def())
+            .map(|p| p.user_services.as_slice())
+            .unwrap_or_default();
+        let audio_units = self
+            .config
+            .audio
+            .map(|a| a.user_services())
+            .unwrap_or_default();
+        for &unit in profile_units.iter().chain(audio_units) {
+            if !units.contains(&unit) {
+                units.push(unit);
+            }
+        }
+        units
+    }
+
+    fn install_profile(&mut self) -> Result<()> {
+        // One libalpm transaction for the whole phase: a single dependency
+        // resolution, download batch and hook run instead of one per component.
+        let pkgs = self.profile_packages();
+        let pkg_refs: Vec<&str> = pkgs.iter().map(|s| s.as_str()).collect();
+        self.install_target_packages(&pkg_refs)?;
+
+        if let Some(ref selection) = self.config.profile_selection {
+            if let Some(p) = selection.profile_def() {
+                // 1. Enable system services
+                services::enable_services(&*self.runner, &self.target, &p.services)?;
 
-                // 4. Display manager — install + enable the effective DM.
-                //    If the user picked a different DM than the profile default,
-                //    install the override package and disable the original.
+                // 2. Display manager — enable the effective DM. If the user
+                //    picked a different DM than the profile default (its
+                //    package was installed above), disable the original.
                 let profile_dm = p.default_display_manager();
-                let effective_dm = selection.effective_display_manager();
+                let effective_dm = selection.display_manager_for(p);
                 if let Some(dm) = effective_dm {
-                    let is_override = profile_dm != Some(dm);
-                    if is_override {
-                        self.install_target_packages(&[dm.package()])?;
-                        if let Some(old) = profile_dm {
-                            services::disable_service(&*self.runner, &self.target, old.service())?;
-                        }
+                    if profile_dm != Some(dm)
+                        && let Some(old) = profile_dm
+                    {
+                        services::disable_service(&*self.runner, &self.target, old.service())?;
                     }
                     services::enable_service(&*self.runner, &self.target, dm.service())?;
 
-                    // 5. Autologin
+                    // 3. Autologin
                     if let Some(ref user_list) = self.config.users
                         && let Some(user) = user_list.iter().find(|u| u.autologin)
                     {
@@ -310,50 +401,32 @@ impl Installer {
                     }
                 }
 
-                // 6. Seat access for Wayland compositors
+                // 4. Seat access for Wayland compositors
                 if p.needs_seat_access() {
                     self.configure_seat_access(selection.seat_access)?;
                 }
 
-                // 7. Post-install steps (db init, group membership, etc.)
+                // 5. Post-install steps (db init, group membership, etc.)
                 self.run_post_install_steps(&p.post_install_steps)?;
             } else {
-                tracing::warn!(profile = %profile_name, "unknown profile, skipping");
+                tracing::warn!(profile = %selection.profile, "unknown profile, skipping");
             }
         }
 
-        // Audio server
-        if let Some(audio) = self.config.audio {
-            let pkgs: Vec<&str> = match audio {
-                crate::config::types::AudioServer::Pipewire => {
-                    vec!["pipewire", "pipewire-alsa", "pipewire-pulse", "wireplumber"]
-                }
-                crate::config::types::AudioServer::Pulseaudio => {
-                    vec!["pulseaudio", "pulseaudio-alsa"]
-                }
-            };
-            self.install_target_packages(&pkgs)?;
-
-            // PipeWire user services must be enabled globally for auto-start.
-            // system services (like pipewire-pulse.socket) are not enough —
-            // each user session needs the user units enabled.
-            if matches!(audio, crate::config::types::AudioServer::Pipewire) {
-                for svc in &["pipewire", "pipewire-pulse", "wireplumber"] {
-                    services::enable_user_service(&*self.runner, &self.target, svc)?;
-                }
-            }
+        // Profile and audio user units, enabled globally. PipeWire needs its
+        // user units enabled for auto-start: system services (like
+        // pipewire-pulse.socket) are not enough — each user session needs them.
+        for unit in self.user_services() {
+            services::enable_user_service(&*self.runner, &self.target, unit)?;
         }
 
         // Bluetooth
         if self.config.bluetooth {
-            self.install_target_packages(&["bluez", "bluez-utils"])?;
             services::enable_service(&*self.runner, &self.target, "bluetooth")?;
         }
 
         // GPU drivers
         if let Some(driver) = self.config.gfx_driver {
-            let pkgs = driver.packages();
-            self.install_target_packages(pkgs)?;
             tracing::info!(?driver, "installed GPU driver packages");
         }
 
@@ -362,37 +435,20 @@ impl Installer {
 
     /// Configure seat access for Wayland compositors. The mode is taken
     /// from the active profile selection (`ProfileSelection::seat_access`).
-    fn configure_seat_access(
-        &mut self,
-        seat: Option<crate::config::types::SeatAccess>,
-    ) -> Result<()> {
+    /// The provider package itself is installed with the rest of Phase 9.
+    fn configure_seat_access(&self, seat: Option<crate::config::types::SeatAccess>) -> Result<()> {
         use crate::config::types::SeatAccess;
-        use crate::system::cmd::{check_exit, chroot_cmd};
 
         match seat {
             Some(SeatAccess::Seatd) => {
-                self.install_target_packages(&["seatd"])?;
                 services::enable_service(&*self.runner, &self.target, "seatd")?;
                 // Add all installer-created users to the `seat` group
-                if let Some(ref user_list) = self.config.users.clone() {
-                    // groupadd -f is idempotent
-                    let _ = chroot_cmd(&*self.runner, &self.target, "groupadd", &["-f", "seat"]);
-                    for user in user_list {
-                        let output = chroot_cmd(
-                            &*self.runner,
-                            &self.target,
-                            "usermod",
-                            &["-aG", "seat", &user.username],
-                        )?;
-                        check_exit(&output, &format!("add {} to seat group", user.username))?;
-                    }
-                }
+                self.add_users_to_group("seat")?;
                 tracing::info!("configured seatd for seat access");
             }
             Some(SeatAccess::Polkit) => {
-                // polkit is typically already a compositor dependency; ensure it
-                // is present and let dbus activate it on demand.
-                self.install_target_packages(&["polkit"])?;
+                // polkit is typically already a compositor dependency; it is
+                // ensured above and dbus activates it on demand.
                 tracing::info!("configured polkit for seat access");
             }
             None => {
@@ -405,19 +461,40 @@ impl Installer {
         Ok(())
     }
 
+    /// Add every installer-created user to `group`, creating the group if
+    /// needed. One arch-chroot for the whole batch instead of one per user.
+    fn add_users_to_group(&self, group: &str) -> Result<()> {
+        use crate::system::cmd::{check_exit, chroot, shell_quote};
+
+        let Some(ref user_list) = self.config.users else {
+            return Ok(());
+        };
+        if user_list.is_empty() {
+            return Ok(());
+        }
+        let quoted = shell_quote(group);
+        let adds: Vec<String> = user_list
+            .iter()
+            .map(|u| format!("usermod -aG {quoted} {}", shell_quote(&u.username)))
+            .collect();
+        // groupadd -f is idempotent; its status is deliberately not chained.
+        let script = format!("groupadd -f {quoted}; {}", adds.join(" && "));
+        let output = chroot(&*self.runner, &self.target, &script)?;
+        check_exit(&output, &format!("add users to {group} group"))
+    }
+
     /// Run profile-defined post-install steps (db init, group membership, etc.).
     ///
     /// Failures are logged as warnings rather than aborting — `initdb` will fail
     /// if the data directory already exists on a reinstall, and that is fine.
     fn run_post_install_steps(&self, steps: &[crate::profile::PostInstallStep]) -> Result<()> {
         use crate::profile::PostInstallStep;
-        use crate::system::cmd::{check_exit, chroot_cmd};
 
+        let target_str = self.target.to_string_lossy();
         for step in steps {
             match step {
                 PostInstallStep::RunAsUser { user, cmd, args } => {
                     tracing::info!(user, cmd, "running post-install step as user");
-                    let target_str = self.target.to_string_lossy();
                     // arch-chroot <target> runuser -u <user> -- <cmd> [args...]
                     let mut full_args: Vec<&str> =
                         vec![&*target_str, "runuser", "-u", user, "--", cmd];
@@ -435,7 +512,6 @@ impl Installer {
                 }
                 PostInstallStep::RunAsRoot { cmd, args } => {
                     tracing::info!(cmd, "running post-install step as root");
-                    let target_str = self.target.to_string_lossy();
                     let mut full_args: Vec<&str> = vec![&*target_str, cmd];
                     full_args.extend_from_slice(args);
                     let output = self.runner.run("arch-chroot", &full_args)?;
@@ -450,21 +526,7 @@ impl Installer {
                 }
                 PostInstallStep::AddUsersToGroup { group } => {
                     tracing::info!(group, "adding installer users to group");
-                    if let Some(ref user_list) = self.config.users {
-                        let _ = chroot_cmd(&*self.runner, &self.target, "groupadd", &["-f", group]);
-                        for user in user_list {
-                            let output = chroot_cmd(
-                                &*self.runner,
-                                &self.target,
-                                "usermod",
-                                &["-aG", group, &user.username],
-                            )?;
-                            check_exit(
-                                &output,
-                                &format!("add {} to {} group", user.username, group),
-                            )?;
-                        }
-                    }
+                    self.add_users_to_group(group)?;
                 }
             }
         }
@@ -472,12 +534,8 @@ impl Installer {
     }
 
     fn install_additional_packages(&mut self) -> Result<()> {
-        let additional: Vec<String> = self.config.additional_packages.clone();
-        if !additional.is_empty() {
-            let pkg_refs: Vec<&str> = additional.iter().map(|s| s.as_str()).collect();
-            self.install_target_packages(&pkg_refs)?;
-        }
-
+        // Repo packages from `additional_packages` went in with the Phase 9
+        // transaction; only AUR packages are left to install here.
         let aur_pkgs = self.config.all_aur_packages();
         if !aur_pkgs.is_empty() {
             // AUR install is async (dependency resolution uses async raur).
@@ -495,16 +553,23 @@ impl Installer {
             ))?;
         }
 
-        // Enable extra services
+        // Enable extra services, skipping any Phase 9 already enabled
+        let enabled = self.profile_services();
+        let mut extra: Vec<&str> = Vec::new();
         for service in &self.config.extra_services {
-            services::enable_service(&*self.runner, &self.target, service)?;
+            if enabled.contains(&service.as_str()) {
+                tracing::debug!(service, "already enabled by profile, skipping");
+                continue;
+            }
+            extra.push(service);
         }
+        services::enable_services(&*self.runner, &self.target, &extra)?;
 
         // Run user-defined post-install commands inside the chroot.
         // Each command is passed to `sh -c` so shell syntax works as expected.
+        let target_str = self.target.to_string_lossy();
         for cmd in &self.config.post_install_commands {
             tracing::info!(cmd, "running post-install command");
-            let target_str = self.target.to_string_lossy();
             let output = self
                 .runner
                 .run("arch-chroot", &[&target_str, "sh", "-c", cmd])?;
@@ -526,16 +591,15 @@ impl Installer {
             SwapMode::Zram => {
                 crate::swap::configure_zram(&self.target, self.config.zram_size_expr.as_deref())?;
             }
-            SwapMode::ZswapPartition => {
-                let part = self.effective_swap_partition();
-                if let Some(part) = part {
-                    crate::swap::setup_swap_partition(&*self.runner, &self.target, part, false)?;
-                }
-            }
-            SwapMode::ZswapPartitionEncrypted => {
-                let part = self.effective_swap_partition();
-                if let Some(part) = part {
-                    crate::swap::setup_swap_partition(&*self.runner, &self.target, part, true)?;
+            mode @ (SwapMode::ZswapPartition | SwapMode::ZswapPartitionEncrypted) => {
+                if let Some(part) = self.effective_swap_partition() {
+                    let encrypted = mode == SwapMode::ZswapPartitionEncrypted;
+                    crate::swap::setup_swap_partition(
+                        &*self.runner,
+                        &self.target,
+                        part,
+                        encrypted,
+                    )?;
                 }
             }
             SwapMode::None => {}
@@ -550,29 +614,11 @@ impl Installer {
             .or(self.config.swap_partition.as_deref())
     }
 
-    fn finalize_zfs(&self) -> Result<()> {
-        let pool_name = self.config.pool_name.as_deref().unwrap_or("zroot");
-        let prefix = &self.config.dataset_prefix;
-
-        // Enable ZFS services
-        for service in crate::zfs_setup::ZFS_SERVICES {
-            services::enable_service(&*self.runner, &self.target, service)?;
-        }
-
-        // TRIM strategy is configured outside Installer — it doesn't depend
-        // on Alpm and is async (zfskit set_property). See
-        // crate::zfs_trim::configure_zfs_trim, called from run_install.
-
-        // genfstab
-        fstab::generate_fstab(&*self.runner, &self.target, pool_name, prefix)?;
-
-        // Copy misc files (hostid, zfs cache)
-        crate::zfs_target_files::copy_misc_files(
-            &*self.runner,
-            &self.target,
-            pool_name,
-            Path::new("/mnt"),
-        )?;
+    /// The file-only part of Phase 12: hostid, pool cache, encryption key,
+    /// zrepl config and the ZED cache hook.
+    fn copy_target_files(&self, pool_name: &str, prefix: &str) -> Result<()> {
+        crate::zfs_target_files::copy_hostid(&self.target)?;
+        crate::zfs_target_files::copy_zfs_cache(&self.target, pool_name, &self.target)?;
 
         // Copy encryption key if needed
         if self.config.encryption_enabled() {
@@ -582,7 +628,7 @@ impl Installer {
                 if let Some(parent) = key_dst.parent() {
                     std::fs::create_dir_all(parent)?;
                 }
-                std::fs::copy(&key_src, &key_dst)?;
+                crate::system::fs::copy_if_changed(&key_src, &key_dst)?;
             }
         }
 
@@ -591,6 +637,36 @@ impl Installer {
             crate::zrepl::setup_zrepl(&self.target, pool_name, prefix)?;
         }
 
+        crate::zfs_target_files::install_zed_cache_hook(&*self.runner, &self.target)?;
+
+        Ok(())
+    }
+
+    fn finalize_zfs(&self) -> Result<()> {
+        let pool_name = self.config.pool_name.as_deref().unwrap_or("zroot");
+        let prefix = &self.config.dataset_prefix;
+
+        // Enable ZFS services
+        services::enable_services(&*self.runner, &self.target, crate::zfs_setup::ZFS_SERVICES)?;
+
+        // TRIM strategy is configured outside Installer — it doesn't depend
+        // on Alpm and is async (zfskit set_property). See
+        // crate::zfs_trim::configure_zfs_trim, called from run_install.
+
+        // genfstab only scans the mount table, while the hostid, pool cache,
+        // key, zrepl and ZED hook steps are plain file writes into the target
+        // (plus a host-side chattr), so they overlap with it. Nothing that
+        // goes through arch-chroot may run here: its bind mounts under the
+        // target would end up in fstab.
+        let runner = &*self.runner;
+        let target = self.target.as_path();
+        std::thread::scope(|s| {
+            let fstab = s.spawn(move || fstab::generate_fstab(runner, target, pool_name, prefix));
+            let files = self.copy_target_files(pool_name, prefix);
+            let fstab = fstab.join().expect("genfstab thread panicked");
+            fstab.and(files)
+        })?;
+
         Ok(())
     }
 }
@@ -621,4 +697,132 @@ mod tests {
                 .contains("validation failed")
         );
     }
+
+    #[test]
+    fn test_profile_packages_single_batch() {
+        use crate::config::types::{AudioServer, ProfileSelection, SeatAccess};
+
+        let runner: Arc<dyn CommandRunner> = Arc::new(RecordingRunner::new(vec![]));
+        let mut selection = ProfileSelection::new("sway").unwrap();
+        selection.seat_access = Some(SeatAccess::Seatd);
+        let config = GlobalConfig {
+            profile_selection: Some(selection),
+            audio: Some(AudioServer::Pipewire),
+            bluetooth: true,
+            swap_mode: SwapMode::Zram,
+            additional_packages: vec!["htop".to_string(), "pipewire".to_string()],
+            ..Default::default()
+        };
+        let installer = Installer::new(
+            runner,
+            config,
+            Path::new("/mnt"),
+            CancellationToken::new(),
+            None,
+        );
+
+        let pkgs = installer.profile_packages();
+        for expected in [
+            "sway",
+            "seatd",
+            "pipewire",
+            "wireplumber",
+            "bluez",
+            "zram-generator",
+            "htop",
+        ] {
+            assert!(pkgs.iter().any(|p| p == expected), "missing {expected}");
+        }
+        let mut unique = pkgs.clone();
+        unique.sort();
+        unique.dedup();
+        assert_eq!(unique.len(), pkgs.len(), "duplicates in {pkgs:?}");
+    }
+
+    #[test]
+    fn test_profile_services_cover_phase9() {
+        use crate::config::types::{ProfileSelection, SeatAccess};
+
+        let runner: Arc<dyn CommandRunner> = Arc::new(RecordingRunner::new(vec![]));
+        let mut selection = ProfileSelection::new("sway").unwrap();
+        selection.seat_access = Some(SeatAccess::Seatd);
+        let config = GlobalConfig {
+            profile_selection: Some(selection),
+            bluetooth: true,
+            extra_services: vec!["sshd".to_string(), "bluetooth".to_string()],
+            ..Default::default()
+        };
+        let installer = Installer::new(
+            runner,
+            config,
+            Path::new("/mnt"),
+            CancellationToken::new(),
+            None,
+        );
+
+        let services = installer.profile_services();
+        assert!(services.contains(&"seatd"));
+        assert!(services.contains(&"bluetooth"));
+        assert!(!services.contains(&"sshd"));
+    }
+
+    #[test]
+    fn test_user_services_listed_once() {
+        use crate::config::types::{AudioServer, ProfileSelection};
+
+        let runner: Arc<dyn CommandRunner> = Arc::new(RecordingRunner::new(vec![]));
+        let config = GlobalConfig {
+            profile_selection: Some(ProfileSelection::new("sway").unwrap()),
+            audio: Some(AudioServer::Pipewire),
+            ..Default::default()
+        };
+        let installer = Installer::new(
+            runner,
+            config,
+            Path::new("/mnt"),
+            CancellationToken::new(),
+            None,
+        );
+
+        let units = installer.user_services();
+        assert_eq!(units, AudioServer::Pipewire.user_services());
+    }
+
+    #[test]
+    fn test_add_users_to_group_single_chroot() {
+        use crate::config::types::UserConfig;
+
+        let recording = Arc::new(RecordingRunner::new(vec![]));
+        let runner: Arc<dyn CommandRunner> = recording.clone();
+        let user = |name: &str| UserConfig {
+            username: name.to_string(),
+            password: None,
+            sudo: false,
+            shell: None,
+            groups: None,
+            ssh_authorized_keys: Vec::new(),
+            autologin: false,
+        };
+        let config = GlobalConfig {
+            users: Some(vec![user("alice"), user("bob")]),
+            ..Default::default()
+        };
+        let installer = Installer::new(
+            runner,
+            config,
+            Path::new("/mnt"),
+            CancellationToken::new(),
+            None,
+        );
+
+        installer.add_users_to_group("seat").unwrap();
+
+        let calls = recording.calls();
+        assert_eq!(calls.len(), 1);
+        assert_eq!(calls[0].program, "arch-chroot");
+        assert_eq!(
+            calls[0].args.last().unwrap(),
+            "groupadd -f seat; usermod -aG seat alice && usermod -aG seat bob"
+        );
+    }
 }
@@ -27,6 +27,32 @@ pub fn enable_service(runner: &dyn CommandRunner, target: &Path, service: &str)
     Ok(())
 }
 
+/// Enable several system services with a single `systemctl --root` call.
+///
+/// systemctl rejects the whole batch when one unit file is missing, so on
+/// failure each service is retried on its own, keeping the per-service
+/// warnings of [`enable_service`].
+pub fn enable_services(runner: &dyn CommandRunner, target: &Path, services: &[&str]) -> Result<()> {
+    match services {
+        [] => return Ok(()),
+        [service] => return enable_service(runner, target, service),
+        _ => {}
+    }
+    let target_str = target.to_string_lossy();
+    let mut args = vec!["--root", &*target_str, "enable"];
+    args.extend_from_slice(services);
+    let output = runner.run("systemctl", &args)?;
+    if output.success() {
+        tracing::info!(?services, "enabled services");
+        return Ok(());
+    }
+    tracing::debug!(stderr = %output.stderr, "batched enable failed, enabling one by one");
+    for service in services {
+        enable_service(runner, target, service)?;
+    }
+    Ok(())
+}
+
 /// Enable a user-level systemd unit globally for all users in the target.
 ///
 /// Uses `systemctl --root <target> --global enable` which writes symlinks into
@@ -86,4 +112,32 @@ mod tests {
         let result = enable_service(&runner, Path::new("/mnt"), "nonexistent.service");
         assert!(result.is_ok(), "service enable failure should be non-fatal");
     }
+
+    #[test]
+    fn test_enable_services_batches_and_falls_back() {
+        let runner = RecordingRunner::new(vec![]);
+        enable_services(
+            &runner,
+            Path::new("/mnt"),
+            &["zfs.target", "zfs-zed.service"],
+        )
+        .unwrap();
+        let calls = runner.calls();
+        assert_eq!(calls.len(), 1);
+        assert_eq!(
+            calls[0].args,
+            ["--root", "/mnt", "enable", "zfs.target", "zfs-zed.service"]
+        );
+
+        let runner = RecordingRunner::new(vec![CannedResponse {
+            exit_code: 1,
+            stderr: "Unit file missing.service does not exist.".into(),
+            ..Default::default()
+        }]);
+        enable_services(&runner, Path::new("/mnt"), &["sshd", "missing.service"]).unwrap();
+        let calls = runner.calls();
+        assert_eq!(calls.len(), 3);
+        assert_eq!(calls[1].args.last().unwrap(), "sshd");
+        assert_eq!(calls[2].args.last().unwrap(), "missing.service");
+    }
 }
@@ -1,3 +1,6 @@
+use std::sync::LazyLock;
+use std::time::Duration;
+
 use color_eyre::eyre::{Context, Result};
 
 use crate::config::types::ZfsModuleMode;
@@ -157,6 +160,19 @@ pub async fn query_packages(
     Ok(result)
 }
 
+/// HTTP client for the compatibility lookups (archzfs.db, OpenZFS release
+/// notes). Shared so repeated scans reuse resolved hosts and open
+/// connections, and bounded so a half-working network fails the lookup
+/// instead of hanging the kernel picker.
+pub(crate) static HTTP_CLIENT: LazyLock<reqwest::Client> = LazyLock::new(|| {
+    reqwest::Client::builder()
+        .user_agent("archinstall-zfs-rs")
+        .connect_timeout(Duration::from_secs(5))
+        .timeout(Duration::from_secs(30))
+        .build()
+        .unwrap_or_default()
+});
+
 /// Download and parse the archzfs package database to get ZFS package versions.
 /// This works even when archzfs repo isn't configured locally (e.g., before
 /// add_archzfs_repo is called, or in CI environments).
@@ -164,12 +180,7 @@ async fn fetch_archzfs_db_versions() -> Option<std::collections::HashMap<String,
     let url = "https://github.com/archzfs/archzfs/releases/download/experimental/archzfs.db";
     tracing::debug!("downloading archzfs.db from {url}");
 
-    let resp = reqwest::Client::new()
-        .get(url)
-        .header("User-Agent", "archinstall-zfs-rs")
-        .send()
-        .await
-        .ok()?;
+    let resp = HTTP_CLIENT.get(url).send().await.ok()?;
     let data = resp.bytes().await.ok()?;
 
     // archzfs.db is an XZ-compressed tar archive
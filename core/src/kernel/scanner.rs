@@ -276,10 +276,9 @@ async fn fetch_zfs_kernel_range(zfs_version: &str) -> Option<(String, String)> {
 
     tracing::debug!(url, "fetching ZFS kernel compatibility from GitHub");
 
-    let resp = reqwest::Client::new()
+    let resp = super::HTTP_CLIENT
         .get(&url)
         .header("Accept", "application/vnd.github.v3+json")
-        .header("User-Agent", "archinstall-zfs-rs")
         .send()
         .await
         .ok()?;
@@ -24,7 +24,7 @@
 //!     .expect("failed to open metrics file");
 //!
 //! tracing_subscriber::registry()
-//!     .with(layer)
+//!     .with(layer.with_filter(MetricsLayer::filter()))
 //!     .init();
 //! ```
 //!
@@ -48,8 +48,23 @@ use std::time::{SystemTime, UNIX_EPOCH};
 use tracing::Subscriber;
 use tracing::field::{Field, Visit};
 use tracing_subscriber::Layer;
+use tracing_subscriber::filter::{LevelFilter, Targets};
 use tracing_subscriber::layer::Context;
 
+// ── Output locations ──────────────────────────────────
+
+/// Where the UIs write install metrics. `xtask` copies it back from the VM
+/// after a test run, together with the log below.
+pub const METRICS_PATH: &str = "/tmp/archinstall-metrics.jsonl";
+
+/// Directory and file name of the full trace log the UIs write.
+pub const LOG_DIR: &str = "/tmp";
+pub const LOG_FILE_NAME: &str = "archinstall-zfs.log";
+
+/// `EnvFilter` directives for that log: trace for our code, warn for noisy
+/// network dependencies.
+pub const LOG_FILE_FILTER: &str = "trace,h2=warn,hyper=warn,reqwest=warn,rustls=warn,pacman=info";
+
 // ── MetricsLayer ──────────────────────────────────────
 
 /// A tracing [`Layer`] that writes structured metrics events to a
@@ -70,6 +85,14 @@ impl MetricsLayer {
             file: Mutex::new(file),
         })
     }
+
+    /// Per-layer filter to install the layer with. Left unfiltered it would
+    /// keep every callsite enabled, so trace events from the network stack
+    /// that every other layer drops would still have their fields built and
+    /// dispatched on each download.
+    pub fn filter() -> Targets {
+        Targets::new().with_target("metrics", LevelFilter::TRACE)
+    }
 }
 
 impl<S: Subscriber> Layer<S> for MetricsLayer {
@@ -10,7 +10,7 @@ use std::path::{Path, PathBuf};
 use color_eyre::eyre::{Result, eyre};
 use zfskit::pool::{ExportOptions, ImportOptions, PoolCreateOptions, Vdev};
 
-use crate::config::types::{GlobalConfig, InstallationMode, SwapMode, ZfsEncryptionMode};
+use crate::config::types::{GlobalConfig, InstallationMode, ZfsEncryptionMode};
 use crate::system::cmd::CommandRunner;
 
 /// Partitions selected or created for the installation.
@@ -41,12 +41,10 @@ pub fn prepare_disk(
                 .ok_or_else(|| eyre!("disk not selected for full disk mode"))?;
             crate::disk::partition::zap_disk(runner, disk)?;
 
-            let swap_size = match config.swap_mode {
-                SwapMode::ZswapPartition | SwapMode::ZswapPartitionEncrypted => {
-                    config.swap_partition_size.as_deref()
-                }
-                _ => None,
-            };
+            let swap_size = config
+                .swap_partition_size
+                .as_deref()
+                .filter(|_| config.swap_mode.uses_partition());
             let layout = crate::disk::partition::create_partitions(runner, disk, swap_size)?;
             let parts = crate::disk::partition::wait_for_partitions(disk, &layout);
             let efi = parts[0].clone();
@@ -129,8 +127,11 @@ pub async fn prepare_zfs(
         crate::zfs_keyfile::write_key_file(Path::new("/"), pw)?;
     }
     let key_path = crate::zfs_keyfile::key_file_path(Path::new("/"));
+    let datasets = crate::dataset_layout::default_datasets();
 
-    match mode {
+    // Whether the arm below already loaded the key the install needs, so it
+    // isn't loaded a second time afterwards.
+    let key_loaded = match mode {
         InstallationMode::FullDisk | InstallationMode::NewPool => {
             let zfs_partition =
                 zfs_partition.ok_or_else(|| eyre!("zfs partition required for new pool modes"))?;
@@ -159,19 +160,22 @@ pub async fn prepare_zfs(
                 .set_property("cachefile", "none")
                 .await?;
 
-            let base_refs = base_dataset_props(encryption, &key_path, &compression);
-            let base_refs_view: Vec<(&str, &str)> =
-                base_refs.iter().map(|(k, v)| (*k, v.as_str())).collect();
-            crate::dataset_layout::create_base_dataset(&zfs, pool_name, prefix, &base_refs_view)
-                .await?;
-
-            let datasets = crate::dataset_layout::default_datasets();
-            crate::dataset_layout::create_child_datasets(&zfs, pool_name, prefix, &datasets)
-                .await?;
+            create_boot_environment(
+                &zfs,
+                pool_name,
+                prefix,
+                encryption,
+                &key_path,
+                &compression,
+                &datasets,
+            )
+            .await?;
             tracing::info!("Created datasets");
 
             export_pool(&zfs, pool_name).await?;
             import_pool_no_mount(&zfs, pool_name, mountpoint).await?;
+            // The re-import leaves every key unloaded.
+            false
         }
         InstallationMode::ExistingPool => {
             import_pool_no_mount(&zfs, pool_name, mountpoint).await?;
@@ -179,35 +183,57 @@ pub async fn prepare_zfs(
             // Pool-level encryption: load the pool key so the new BE can be
             // created as an encrypted child. Dataset-level encryption applies
             // only to the new base dataset; the pool itself is not encrypted.
-            if encryption == ZfsEncryptionMode::Pool {
+            let pool_key = encryption == ZfsEncryptionMode::Pool;
+            if pool_key {
                 let key_loc = format!("file://{}", key_path.display());
                 zfs.dataset(pool_name)?
                     .load_key_with_keylocation(&key_loc)
                     .await?;
             }
 
-            let base_refs = base_dataset_props(encryption, &key_path, &compression);
-            let base_refs_view: Vec<(&str, &str)> =
-                base_refs.iter().map(|(k, v)| (*k, v.as_str())).collect();
-            crate::dataset_layout::create_base_dataset(&zfs, pool_name, prefix, &base_refs_view)
-                .await?;
-
-            let datasets = crate::dataset_layout::default_datasets();
-            crate::dataset_layout::create_child_datasets(&zfs, pool_name, prefix, &datasets)
-                .await?;
+            create_boot_environment(
+                &zfs,
+                pool_name,
+                prefix,
+                encryption,
+                &key_path,
+                &compression,
+                &datasets,
+            )
+            .await?;
             tracing::info!("Created new BE in existing pool");
+            pool_key
         }
-    }
+    };
 
-    load_install_encryption_key(&zfs, pool_name, prefix, encryption, &key_path).await?;
+    if !key_loaded {
+        load_install_encryption_key(&zfs, pool_name, prefix, encryption, &key_path).await?;
+    }
 
-    let datasets = crate::dataset_layout::default_datasets();
     crate::dataset_layout::mount_datasets_ordered(&zfs, pool_name, prefix, &datasets).await?;
     tracing::info!("Datasets mounted");
 
     Ok(())
 }
 
+/// Create the base dataset `pool/prefix` and its children: the boot
+/// environment both new-pool and existing-pool installs end up with.
+async fn create_boot_environment(
+    zfs: &zfskit::Zfs,
+    pool_name: &str,
+    prefix: &str,
+    encryption: ZfsEncryptionMode,
+    key_path: &Path,
+    compression: &str,
+    datasets: &[crate::dataset_layout::DatasetConfig],
+) -> Result<()> {
+    let base_refs = base_dataset_props(encryption, key_path, compression);
+    let base_refs_view: Vec<(&str, &str)> =
+        base_refs.iter().map(|(k, v)| (*k, v.as_str())).collect();
+    crate::dataset_layout::create_base_dataset(zfs, pool_name, prefix, &base_refs_view).await?;
+    crate::dataset_layout::create_child_datasets(zfs, pool_name, prefix, datasets).await
+}
+
 fn base_dataset_props(
     encryption: ZfsEncryptionMode,
     key_path: &Path,
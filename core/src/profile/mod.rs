@@ -22,6 +22,8 @@
 pub mod desktop;
 pub mod server;
 
+use std::sync::LazyLock;
+
 use serde::{Deserialize, Serialize};
 
 /// A post-installation step to run after packages and services are configured.
@@ -232,15 +234,21 @@ impl Profile {
     }
 }
 
-pub fn get_profile(name: &str) -> Option<Profile> {
-    all_profiles().into_iter().find(|p| p.name == name)
-}
-
-pub fn all_profiles() -> Vec<Profile> {
+/// Built on first use and shared afterwards — UI screens resolve the active
+/// profile on every redraw, which previously rebuilt the whole table.
+static PROFILES: LazyLock<Vec<Profile>> = LazyLock::new(|| {
     let mut profiles = Vec::new();
     profiles.extend(desktop::desktop_profiles());
     profiles.extend(server::server_profiles());
     profiles
+});
+
+pub fn get_profile(name: &str) -> Option<Profile> {
+    all_profiles().iter().find(|p| p.name == name).cloned()
+}
+
+pub fn all_profiles() -> &'static [Profile] {
+    &PROFILES
 }
 
 #[cfg(test)]
@@ -6,9 +6,6 @@ use color_eyre::eyre::{Context, Result};
 use crate::system::cmd::{CommandRunner, check_exit};
 
 pub fn configure_zram(target: &Path, size_expr: Option<&str>) -> Result<()> {
-    let conf_dir = target.join("etc/systemd/zram-generator.conf.d");
-    fs::create_dir_all(&conf_dir)?;
-
     // Default: min(ram/2, 4096) MB
     let size = size_expr.unwrap_or("min(ram / 2, 4096)");
     let conf = format!("[zram0]\nzram-size = {size}\ncompression-algorithm = zstd\n");
@@ -17,7 +14,8 @@ pub fn configure_zram(target: &Path, size_expr: Option<&str>) -> Result<()> {
     if let Some(parent) = conf_path.parent() {
         fs::create_dir_all(parent)?;
     }
-    fs::write(&conf_path, conf).wrap_err("failed to write zram-generator.conf")?;
+    crate::system::fs::write_atomic(&conf_path, conf)
+        .wrap_err("failed to write zram-generator.conf")?;
 
     tracing::info!("configured zram swap");
     Ok(())
@@ -33,20 +31,43 @@ pub fn setup_swap_partition(
 
     if encrypted {
         // Encrypted swap via crypttab
-        crate::installer::fstab::add_cryptswap_entry(target, &part_str)?;
+        crate::installer::fstab::add_cryptswap_entry(target, &stable_device_name(partition))?;
         tracing::info!(partition = %part_str, "configured encrypted swap partition");
     } else {
         // Direct swap
         let output = runner.run("mkswap", &[&*part_str])?;
         check_exit(&output, "mkswap")?;
 
-        crate::installer::fstab::add_swap_entry(target, &part_str)?;
-        tracing::info!(partition = %part_str, "configured swap partition");
+        // mkswap reports the UUID it just stamped; naming the swap by it
+        // needs no lookup under /dev/disk at all.
+        let device = match swap_uuid(&output.stdout) {
+            Some(uuid) => format!("UUID={uuid}"),
+            None => stable_device_name(partition),
+        };
+        crate::installer::fstab::add_swap_entry(target, &device)?;
+        tracing::info!(partition = %part_str, device, "configured swap partition");
     }
 
     Ok(())
 }
 
+/// Name the partition by PARTUUID in the tables so a renumbered disk can't
+/// point them (and the random-key cryptswap mapping) at the wrong device.
+fn stable_device_name(partition: &Path) -> String {
+    match crate::disk::device::partuuid_of(partition) {
+        Some(uuid) => format!("PARTUUID={uuid}"),
+        None => partition.to_string_lossy().into_owned(),
+    }
+}
+
+/// The `UUID=...` value from mkswap's "Setting up swapspace version 1, ..."
+/// report.
+fn swap_uuid(mkswap_stdout: &str) -> Option<&str> {
+    let rest = mkswap_stdout.split_once("UUID=")?.1;
+    let uuid = rest.split_whitespace().next()?;
+    (!uuid.is_empty()).then_some(uuid)
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -62,6 +83,27 @@ mod tests {
         assert!(conf.contains("zstd"));
     }
 
+    #[test]
+    fn test_setup_swap_partition_uses_mkswap_uuid() {
+        use crate::system::cmd::tests::{CannedResponse, RecordingRunner};
+
+        let dir = tempfile::tempdir().unwrap();
+        fs::create_dir_all(dir.path().join("etc")).unwrap();
+        let runner = RecordingRunner::new(vec![CannedResponse {
+            stdout: "Setting up swapspace version 1, size = 4 GiB (4294963200 bytes)\n\
+                     no label, UUID=0a1b2c3d-4e5f-6071-8293-a4b5c6d7e8f9\n"
+                .to_string(),
+            ..Default::default()
+        }]);
+
+        setup_swap_partition(&runner, dir.path(), Path::new("/dev/fake3"), false).unwrap();
+
+        assert_eq!(runner.calls()[0].program, "mkswap");
+        let fstab = fs::read_to_string(dir.path().join("etc/fstab")).unwrap();
+        assert!(fstab.contains("UUID=0a1b2c3d-4e5f-6071-8293-a4b5c6d7e8f9\tnone\tswap"));
+        assert_eq!(swap_uuid("no UUID here"), None);
+    }
+
     #[test]
     fn test_configure_zram_custom_size() {
         let dir = tempfile::tempdir().unwrap();
@@ -258,6 +258,12 @@ impl AlpmContext {
         Ok(())
     }
 
+    /// Whether a sync database called `name` is registered (from pacman.conf
+    /// or via [`register_repo`](Self::register_repo)).
+    pub fn has_repo(&self, name: &str) -> bool {
+        self.handle.syncdbs().iter().any(|db| db.name() == name)
+    }
+
     /// Dynamically register an additional repo (e.g., archzfs after config edit).
     pub fn register_repo(
         &mut self,
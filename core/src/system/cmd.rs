@@ -25,6 +25,15 @@ pub trait CommandRunner: Send + Sync {
 
     fn run_streaming(&self, program: &str, args: &[&str], tx: &Sender<String>)
     -> Result<CmdOutput>;
+
+    /// Like [`run`](Self::run), for long-running commands whose stdout is
+    /// only ever logged (initramfs generation, package builds, reflector).
+    /// Implementations may forward stdout to the log as it arrives instead of
+    /// buffering it, in which case the returned `stdout` is empty. `stderr`
+    /// is always captured for error reporting.
+    fn run_quiet(&self, program: &str, args: &[&str]) -> Result<CmdOutput> {
+        self.run(program, args)
+    }
 }
 
 pub struct RealRunner;
@@ -137,6 +146,51 @@ impl CommandRunner for RealRunner {
             exit_code: output.status.code().unwrap_or(-1),
         })
     }
+
+    fn run_quiet(&self, program: &str, args: &[&str]) -> Result<CmdOutput> {
+        tracing::debug!(program, ?args, "running command (quiet)");
+        let mut child = Command::new(program)
+            .args(args)
+            .stdout(Stdio::piped())
+            .stderr(Stdio::piped())
+            .spawn()
+            .wrap_err_with(|| format!("failed to spawn: {program}"))?;
+
+        // Drain stderr on a helper thread so neither pipe can fill up and
+        // stall the child while we walk stdout.
+        let mut stderr = child.stderr.take().expect("stderr was piped");
+        let stderr_reader = std::thread::spawn(move || {
+            use std::io::Read;
+            let mut buf = Vec::new();
+            let _ = stderr.read_to_end(&mut buf);
+            buf
+        });
+
+        // Stdout goes straight to the log line by line; nothing is kept.
+        let stdout = child.stdout.take().expect("stdout was piped");
+        for line in BufReader::new(stdout).split(b'\n') {
+            let Ok(line) = line else { break };
+            let line = String::from_utf8_lossy(&line);
+            if !line.trim().is_empty() {
+                tracing::trace!("[{program}] {line}");
+            }
+        }
+
+        let status = child.wait().wrap_err("failed to wait on child")?;
+        let stderr_bytes = stderr_reader.join().unwrap_or_default();
+        let result = CmdOutput {
+            stdout: String::new(),
+            stderr: String::from_utf8_lossy(&stderr_bytes).into_owned(),
+            exit_code: status.code().unwrap_or(-1),
+        };
+        tracing::debug!(exit_code = result.exit_code, "command finished");
+        for line in result.stderr.lines() {
+            if !line.trim().is_empty() {
+                tracing::trace!("[{program} stderr] {line}");
+            }
+        }
+        Ok(result)
+    }
 }
 
 pub fn chroot(runner: &dyn CommandRunner, target: &Path, cmd: &str) -> Result<CmdOutput> {
@@ -144,6 +198,12 @@ pub fn chroot(runner: &dyn CommandRunner, target: &Path, cmd: &str) -> Result<Cm
     runner.run("arch-chroot", &[&*target_str, "bash", "-c", cmd])
 }
 
+/// [`chroot`] via [`CommandRunner::run_quiet`]: stdout is logged, not kept.
+pub fn chroot_quiet(runner: &dyn CommandRunner, target: &Path, cmd: &str) -> Result<CmdOutput> {
+    let target_str = target.to_string_lossy();
+    runner.run_quiet("arch-chroot", &[&*target_str, "bash", "-c", cmd])
+}
+
 /// Run a command inside an arch-chroot without bash interpretation.
 /// Arguments are passed directly to the program, avoiding shell injection.
 pub fn chroot_cmd(
@@ -158,6 +218,19 @@ pub fn chroot_cmd(
     runner.run("arch-chroot", &full_args)
 }
 
+/// [`chroot_cmd`] via [`CommandRunner::run_quiet`]: stdout is logged, not kept.
+pub fn chroot_cmd_quiet(
+    runner: &dyn CommandRunner,
+    target: &Path,
+    program: &str,
+    args: &[&str],
+) -> Result<CmdOutput> {
+    let target_str = target.to_string_lossy();
+    let mut full_args = vec![&*target_str, program];
+    full_args.extend_from_slice(args);
+    runner.run_quiet("arch-chroot", &full_args)
+}
+
 /// Shell-quote a string for safe interpolation into bash commands.
 /// Returns the string wrapped in single quotes with internal single quotes escaped.
 pub fn shell_quote(s: &str) -> String {
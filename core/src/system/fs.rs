@@ -0,0 +1,73 @@
+use std::io::Write;
+use std::path::Path;
+
+/// Replace `path` with `contents` atomically: write a sibling temp file,
+/// flush it to disk and rename it over the destination. A reader (or a
+/// reboot after the installer is killed) sees either the old file or the
+/// new one, never a truncated mix.
+pub fn write_atomic(path: &Path, contents: impl AsRef<[u8]>) -> std::io::Result<()> {
+    let mut tmp_name = std::ffi::OsString::from(".");
+    tmp_name.push(path.file_name().unwrap_or_default());
+    tmp_name.push(".tmp");
+    let tmp = path.with_file_name(tmp_name);
+
+    let result = std::fs::File::create(&tmp).and_then(|mut file| {
+        file.write_all(contents.as_ref())?;
+        file.sync_data()
+    });
+    match result.and_then(|()| std::fs::rename(&tmp, path)) {
+        Ok(()) => Ok(()),
+        Err(e) => {
+            let _ = std::fs::remove_file(&tmp);
+            Err(e)
+        }
+    }
+}
+
+/// Copy `src` to `dst` unless `dst` already holds the same bytes. Returns
+/// whether a copy was made. Meant for the small files (hostid, key files)
+/// the installer drops into the target, where comparing is cheaper than
+/// rewriting and a resumed run leaves the target untouched.
+pub fn copy_if_changed(src: &Path, dst: &Path) -> std::io::Result<bool> {
+    if let Ok(existing) = std::fs::metadata(dst)
+        && existing.len() == std::fs::metadata(src)?.len()
+        && std::fs::read(dst)? == std::fs::read(src)?
+    {
+        return Ok(false);
+    }
+    std::fs::copy(src, dst)?;
+    Ok(true)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_write_atomic_replaces_file() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("fstab");
+        std::fs::write(&path, "old contents that are longer\n").unwrap();
+
+        write_atomic(&path, "new\n").unwrap();
+
+        assert_eq!(std::fs::read_to_string(&path).unwrap(), "new\n");
+        let leftovers: Vec<_> = std::fs::read_dir(dir.path()).unwrap().collect();
+        assert_eq!(leftovers.len(), 1);
+    }
+
+    #[test]
+    fn test_copy_if_changed_skips_identical() {
+        let dir = tempfile::tempdir().unwrap();
+        let src = dir.path().join("src");
+        let dst = dir.path().join("dst");
+        std::fs::write(&src, "abcd").unwrap();
+
+        assert!(copy_if_changed(&src, &dst).unwrap());
+        assert!(!copy_if_changed(&src, &dst).unwrap());
+
+        std::fs::write(&dst, "abce").unwrap();
+        assert!(copy_if_changed(&src, &dst).unwrap());
+        assert_eq!(std::fs::read_to_string(&dst).unwrap(), "abcd");
+    }
+}
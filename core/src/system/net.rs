@@ -1,16 +1,79 @@
-use std::net::{SocketAddr, TcpStream};
-use std::time::Duration;
+use std::net::{IpAddr, Ipv4Addr, Ipv6Addr, SocketAddr, TcpStream};
+use std::sync::{Mutex, mpsc};
+use std::time::{Duration, Instant};
+
+/// Cloudflare DNS over both address families. The probes are raced so that
+/// a network with broken IPv6 (or no IPv4) can't stall the check.
+const PROBE_ADDRS: [SocketAddr; 2] = [
+    SocketAddr::new(IpAddr::V4(Ipv4Addr::new(1, 1, 1, 1)), 53),
+    SocketAddr::new(
+        IpAddr::V6(Ipv6Addr::new(0x2606, 0x4700, 0x4700, 0, 0, 0, 0, 0x1111)),
+        53,
+    ),
+];
+
+const PROBE_TIMEOUT: Duration = Duration::from_secs(2);
+
+/// How long a successful probe is trusted. The welcome/wifi screens and the
+/// install pre-flight all ask within moments of each other; only the first
+/// one needs to touch the network. Failures are never cached.
+const ONLINE_TTL: Duration = Duration::from_secs(30);
+
+static LAST_ONLINE: Mutex<Option<Instant>> = Mutex::new(None);
 
 /// Check internet connectivity by attempting a TCP connection to a well-known
-/// DNS server (Cloudflare 1.1.1.1:53). No TLS or HTTP involved — works on
-/// minimal ISOs without root certificates.
+/// DNS server (Cloudflare 1.1.1.1:53 / [2606:4700:4700::1111]:53). No TLS or
+/// HTTP involved — works on minimal ISOs without root certificates.
+///
+/// Both families are tried in parallel and the first successful connect wins
+/// (RFC 8305 "happy eyeballs"), so the worst case is one `PROBE_TIMEOUT`.
+/// IPv6 is only tried when the host has a global IPv6 address.
+/// A success is remembered for `ONLINE_TTL`.
 pub fn check_internet() -> bool {
-    let addr: SocketAddr = ([1, 1, 1, 1], 53).into();
-    TcpStream::connect_timeout(&addr, Duration::from_secs(5)).is_ok()
+    let mut last_online = LAST_ONLINE.lock().unwrap_or_else(|e| e.into_inner());
+    if last_online.is_some_and(|at| at.elapsed() < ONLINE_TTL) {
+        return true;
+    }
+    let online = probe();
+    if online {
+        *last_online = Some(Instant::now());
+    }
+    online
+}
+
+fn probe() -> bool {
+    // On an IPv4-only network the v6 connect can only fail, so there is
+    // nothing to race: connect inline without spawning a thread.
+    if !has_global_ipv6() {
+        return TcpStream::connect_timeout(&PROBE_ADDRS[0], PROBE_TIMEOUT).is_ok();
+    }
+    let (tx, rx) = mpsc::channel();
+    for addr in PROBE_ADDRS {
+        let tx = tx.clone();
+        std::thread::spawn(move || {
+            let _ = tx.send(TcpStream::connect_timeout(&addr, PROBE_TIMEOUT).is_ok());
+        });
+    }
+    drop(tx);
+    // Stops at the first success; a family that fails fast (e.g. no route)
+    // just reports false while we keep waiting for the other one.
+    rx.iter().any(|ok| ok)
+}
+
+/// Whether any interface has a global-scope IPv6 address. If the kernel
+/// table can't be read, assume yes and let the probe find out.
+fn has_global_ipv6() -> bool {
+    std::fs::read_to_string("/proc/net/if_inet6")
+        .map(|table| has_global_ipv6_in(&table))
+        .unwrap_or(true)
 }
 
-pub fn is_uefi() -> bool {
-    std::path::Path::new("/sys/firmware/efi").exists()
+/// Parse `/proc/net/if_inet6`: `addr ifindex prefixlen scope flags ifname`,
+/// where scope `00` is global.
+fn has_global_ipv6_in(table: &str) -> bool {
+    table
+        .lines()
+        .any(|line| line.split_whitespace().nth(3) == Some("00"))
 }
 
 #[cfg(test)]
@@ -21,4 +84,20 @@ mod tests {
     fn test_check_internet_does_not_panic() {
         let _ = check_internet();
     }
+
+    #[test]
+    fn test_has_global_ipv6_in() {
+        let link_local_only = "\
+00000000000000000000000000000001 01 80 10 80       lo
+fe80000000000000020c29fffe3a1b2c 02 40 20 80   enp1s0
+";
+        assert!(!has_global_ipv6_in(link_local_only));
+
+        let global = "\
+fe80000000000000020c29fffe3a1b2c 02 40 20 80   enp1s0
+2a0104f8000000000000000000000002 02 40 00 00   enp1s0
+";
+        assert!(has_global_ipv6_in(global));
+        assert!(!has_global_ipv6_in(""));
+    }
 }
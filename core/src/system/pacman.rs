@@ -16,6 +16,11 @@ pub fn wait_for_db_lock(_runner: &dyn CommandRunner) -> Result<()> {
     bail!("pacman db.lck not released after 10 minutes");
 }
 
+/// Where the archzfs repo is served from, for handles that register it
+/// directly instead of reading it from pacman.conf.
+pub const ARCHZFS_SERVER: &str =
+    "https://github.com/archzfs/archzfs/releases/download/experimental";
+
 const ARCHZFS_REPO_BLOCK: &str = "\n[archzfs]\nSigLevel = Never\nServer = https://github.com/archzfs/archzfs/releases/download/experimental\n";
 
 const ARCHZFS_KEY_IDS: &[&str] = &[
@@ -23,6 +28,10 @@ const ARCHZFS_KEY_IDS: &[&str] = &[
     "DDF7DB817396A49B2A2723F7403BD972F75D9D76",
 ];
 
+/// Where the host's archzfs keys are staged for the target keyring, relative
+/// to the target root. Not under /tmp: arch-chroot mounts a fresh tmpfs there.
+const STAGED_KEYS: &str = "var/tmp/archzfs-keys.asc";
+
 const KEYSERVERS: &[&str] = &[
     "hkps://keyserver.ubuntu.com",
     "hkps://pgp.mit.edu",
@@ -36,29 +45,24 @@ pub fn add_archzfs_repo(runner: &dyn CommandRunner, target: Option<&Path>) -> Re
         None => std::path::PathBuf::from("/etc/pacman.conf"),
     };
 
-    // Rewrite or append [archzfs] block
-    let content = std::fs::read_to_string(&pacman_conf)?;
-    if content.contains("[archzfs]") {
-        let new_content = rewrite_archzfs_block(&content);
-        std::fs::write(&pacman_conf, new_content)?;
-        tracing::info!("updated existing archzfs repo block");
-    } else {
-        let mut new_content = content;
-        new_content.push_str(ARCHZFS_REPO_BLOCK);
-        std::fs::write(&pacman_conf, new_content)?;
-        tracing::info!(path = %pacman_conf.display(), "added archzfs repo to pacman.conf");
+    write_archzfs_block(&pacman_conf)?;
+
+    // A keyring that already holds both keys (an ISO built with archzfs, or
+    // a re-run) needs neither the init/populate nor another import.
+    if archzfs_keys_present(runner, target.unwrap_or(Path::new("/"))) {
+        tracing::info!("archzfs keys already in the keyring, skipping import");
+        return Ok(());
     }
 
     // Initialize keyring
     let init_result = if let Some(t) = target {
-        let r = crate::system::cmd::chroot_cmd(runner, t, "pacman-key", &["--init"]);
-        if let Ok(ref output) = r
-            && output.success()
-        {
-            crate::system::cmd::chroot_cmd(runner, t, "pacman-key", &["--populate", "archlinux"])
-        } else {
-            r
-        }
+        // One chroot entry for both steps: arch-chroot's mount setup and the
+        // gpg-agent start are paid once instead of twice.
+        crate::system::cmd::chroot(
+            runner,
+            t,
+            "pacman-key --init && pacman-key --populate archlinux",
+        )
     } else {
         let r = runner.run("pacman-key", &["--init"]);
         if let Ok(ref output) = r
@@ -78,6 +82,15 @@ pub fn add_archzfs_repo(runner: &dyn CommandRunner, target: Option<&Path>) -> Re
         );
     }
 
+    // The live host imported the same keys when it set up ZFS; copying them
+    // over skips the keyserver round-trips and a chroot per key.
+    if let Some(t) = target
+        && import_host_keys(runner, t)
+    {
+        tracing::info!("imported archzfs keys from the host keyring");
+        return Ok(());
+    }
+
     // Import archzfs signing keys
     for key_id in ARCHZFS_KEY_IDS {
         let mut received = false;
@@ -114,6 +127,76 @@ pub fn add_archzfs_repo(runner: &dyn CommandRunner, target: Option<&Path>) -> Re
     Ok(())
 }
 
+/// Whether the pacman keyring under `root` already has both archzfs keys.
+/// Asks gpg directly against the keyring directory, so checking the target
+/// costs no chroot; a root without a keyring is answered without a command.
+fn archzfs_keys_present(runner: &dyn CommandRunner, root: &Path) -> bool {
+    let homedir = root.join("etc/pacman.d/gnupg");
+    if !homedir.is_dir() {
+        return false;
+    }
+    let homedir = homedir.to_string_lossy();
+    // gpg exits non-zero if any of the listed keys is missing.
+    let mut args = vec!["--homedir", &*homedir, "--batch", "--list-keys"];
+    args.extend_from_slice(ARCHZFS_KEY_IDS);
+    runner.run("gpg", &args).is_ok_and(|o| o.success())
+}
+
+/// Export the archzfs keys from the host keyring and add + locally sign them
+/// in the target keyring with one chroot. Returns false (leaving the caller to
+/// fall back to the keyservers) if the host doesn't have both keys.
+fn import_host_keys(runner: &dyn CommandRunner, target: &Path) -> bool {
+    let mut args = vec!["--export"];
+    args.extend_from_slice(ARCHZFS_KEY_IDS);
+    let exported = match runner.run("pacman-key", &args) {
+        Ok(output) if output.success() && !output.stdout.trim().is_empty() => output.stdout,
+        _ => return false,
+    };
+
+    let staged = target.join(STAGED_KEYS);
+    let written = staged
+        .parent()
+        .map_or(Ok(()), std::fs::create_dir_all)
+        .and_then(|()| std::fs::write(&staged, exported));
+    if written.is_err() {
+        return false;
+    }
+    // --lsign-key fails for a key that --add didn't bring in, so success
+    // means both keys are present and trusted.
+    let script = format!(
+        "pacman-key --add /{STAGED_KEYS} && pacman-key --lsign-key {}",
+        ARCHZFS_KEY_IDS.join(" ")
+    );
+    let imported = crate::system::cmd::chroot(runner, target, &script).is_ok_and(|o| o.success());
+    let _ = std::fs::remove_file(&staged);
+    imported
+}
+
+/// Ensure `pacman_conf` carries the canonical `[archzfs]` block.
+///
+/// A missing block is appended with a single write instead of rewriting the
+/// whole file; an existing block is only rewritten when it differs, so
+/// re-running the installer leaves an up-to-date config untouched.
+fn write_archzfs_block(pacman_conf: &Path) -> Result<()> {
+    use std::io::Write;
+
+    let content = std::fs::read_to_string(pacman_conf)?;
+    if content.contains("[archzfs]") {
+        let new_content = rewrite_archzfs_block(&content);
+        if new_content == content {
+            tracing::debug!(path = %pacman_conf.display(), "archzfs repo block already up to date");
+            return Ok(());
+        }
+        std::fs::write(pacman_conf, new_content)?;
+        tracing::info!("updated existing archzfs repo block");
+    } else {
+        let mut file = std::fs::OpenOptions::new().append(true).open(pacman_conf)?;
+        file.write_all(ARCHZFS_REPO_BLOCK.as_bytes())?;
+        tracing::info!(path = %pacman_conf.display(), "added archzfs repo to pacman.conf");
+    }
+    Ok(())
+}
+
 fn rewrite_archzfs_block(content: &str) -> String {
     let mut result = String::new();
     let mut in_archzfs_block = false;
@@ -135,6 +218,10 @@ fn rewrite_archzfs_block(content: &str) -> String {
         result.push('\n');
     }
 
+    // Drop the blank lines left behind by the removed block so that repeated
+    // rewrites converge instead of growing the file.
+    result.truncate(result.trim_end_matches('\n').len());
+    result.push('\n');
     result.push_str(ARCHZFS_REPO_BLOCK);
     result
 }
@@ -187,4 +274,122 @@ mod tests {
         assert!(content.contains("ParallelDownloads = 10"));
         assert!(!content.contains("#ParallelDownloads"));
     }
+
+    #[test]
+    fn test_add_archzfs_repo_target_single_keyring_chroot() {
+        use crate::system::cmd::tests::RecordingRunner;
+
+        let dir = tempfile::tempdir().unwrap();
+        let conf_path = dir.path().join("etc/pacman.conf");
+        std::fs::create_dir_all(conf_path.parent().unwrap()).unwrap();
+        std::fs::write(&conf_path, "[core]\nInclude = x\n").unwrap();
+
+        let runner = RecordingRunner::new(vec![]);
+        add_archzfs_repo(&runner, Some(dir.path())).unwrap();
+
+        let calls = runner.calls();
+        let keyring_calls: Vec<_> = calls
+            .iter()
+            .filter(|c| c.args.iter().any(|a| a.contains("--init")))
+            .collect();
+        assert_eq!(keyring_calls.len(), 1);
+        assert_eq!(keyring_calls[0].program, "arch-chroot");
+        assert!(
+            keyring_calls[0]
+                .args
+                .contains(&"pacman-key --init && pacman-key --populate archlinux".to_string())
+        );
+    }
+
+    #[test]
+    fn test_add_archzfs_repo_target_reuses_host_keys() {
+        use crate::system::cmd::tests::{CannedResponse, RecordingRunner};
+
+        let dir = tempfile::tempdir().unwrap();
+        let conf_path = dir.path().join("etc/pacman.conf");
+        std::fs::create_dir_all(conf_path.parent().unwrap()).unwrap();
+        std::fs::write(&conf_path, "[core]\nInclude = x\n").unwrap();
+
+        let runner = RecordingRunner::new(vec![
+            CannedResponse::default(), // keyring init + populate
+            CannedResponse {
+                stdout: "-----BEGIN PGP PUBLIC KEY BLOCK-----\n".into(),
+                ..Default::default()
+            }, // host export
+            CannedResponse::default(), // add + lsign in the target
+        ]);
+        add_archzfs_repo(&runner, Some(dir.path())).unwrap();
+
+        let calls = runner.calls();
+        assert_eq!(calls.len(), 3);
+        assert_eq!(calls[1].program, "pacman-key");
+        assert_eq!(calls[1].args[0], "--export");
+        assert!(calls[2].args.last().unwrap().contains("--lsign-key"));
+        assert!(
+            !calls
+                .iter()
+                .any(|c| c.args.iter().any(|a| a == "--keyserver"))
+        );
+        assert!(!dir.path().join(STAGED_KEYS).exists());
+    }
+
+    #[test]
+    fn test_add_archzfs_repo_skips_keyring_when_keys_present() {
+        use crate::system::cmd::tests::RecordingRunner;
+
+        let dir = tempfile::tempdir().unwrap();
+        let conf_path = dir.path().join("etc/pacman.conf");
+        std::fs::create_dir_all(dir.path().join("etc/pacman.d/gnupg")).unwrap();
+        std::fs::write(&conf_path, "[core]\nInclude = x\n").unwrap();
+
+        let runner = RecordingRunner::new(vec![]);
+        add_archzfs_repo(&runner, Some(dir.path())).unwrap();
+
+        let calls = runner.calls();
+        assert_eq!(calls.len(), 1);
+        assert_eq!(calls[0].program, "gpg");
+        assert!(calls[0].args.contains(&"--list-keys".to_string()));
+        assert!(
+            std::fs::read_to_string(&conf_path)
+                .unwrap()
+                .contains("[archzfs]")
+        );
+    }
+
+    #[test]
+    fn test_write_archzfs_block_idempotent() {
+        let dir = tempfile::tempdir().unwrap();
+        let conf_path = dir.path().join("pacman.conf");
+        std::fs::write(
+            &conf_path,
+            "[options]\nHoldPkg = pacman\n\n[core]\nInclude = x\n",
+        )
+        .unwrap();
+
+        write_archzfs_block(&conf_path).unwrap();
+        let first = std::fs::read_to_string(&conf_path).unwrap();
+        assert!(first.starts_with("[options]\nHoldPkg = pacman\n"));
+        assert!(first.ends_with(ARCHZFS_REPO_BLOCK));
+
+        write_archzfs_block(&conf_path).unwrap();
+        let second = std::fs::read_to_string(&conf_path).unwrap();
+        assert_eq!(first, second);
+        assert_eq!(second.matches("[archzfs]").count(), 1);
+    }
+
+    #[test]
+    fn test_write_archzfs_block_replaces_stale_server() {
+        let dir = tempfile::tempdir().unwrap();
+        let conf_path = dir.path().join("pacman.conf");
+        std::fs::write(
+            &conf_path,
+            "[core]\nInclude = x\n\n[archzfs]\nServer = http://archzfs.com/$repo/x86_64\n",
+        )
+        .unwrap();
+
+        write_archzfs_block(&conf_path).unwrap();
+        let content = std::fs::read_to_string(&conf_path).unwrap();
+        assert!(!content.contains("archzfs.com"));
+        assert_eq!(content.matches("[archzfs]").count(), 1);
+    }
 }
@@ -1,4 +1,13 @@
+use std::sync::OnceLock;
+
+/// The CPU vendor of the live host. Detected once per process: the answer
+/// can't change while the installer runs.
 pub fn cpu_vendor() -> CpuVendor {
+    static VENDOR: OnceLock<CpuVendor> = OnceLock::new();
+    *VENDOR.get_or_init(detect_cpu_vendor)
+}
+
+fn detect_cpu_vendor() -> CpuVendor {
     let info = sysinfo::System::new_with_specifics(
         sysinfo::RefreshKind::nothing().with_cpu(sysinfo::CpuRefreshKind::nothing()),
     );
@@ -34,8 +43,12 @@ impl CpuVendor {
     }
 }
 
+/// True when booted via UEFI. The kernel only creates `/sys/firmware/efi`
+/// on EFI boots, so this is a single `stat` with no subprocess involved,
+/// done once per process.
 pub fn has_uefi() -> bool {
-    std::path::Path::new("/sys/firmware/efi").exists()
+    static UEFI: OnceLock<bool> = OnceLock::new();
+    *UEFI.get_or_init(|| std::path::Path::new("/sys/firmware/efi").is_dir())
 }
 
 /// What kind of storage a device is, used to pick the right TRIM strategy.
@@ -70,7 +83,7 @@ pub enum StorageType {
 /// Detect the storage type for a device path (may be a partition or disk,
 /// raw `/dev/…` node, or a `/dev/disk/by-id/…` symlink).
 pub fn detect_storage_type(dev_path: &std::path::Path) -> StorageType {
-    let real = std::fs::canonicalize(dev_path).unwrap_or_else(|_| dev_path.to_path_buf());
+    let real = crate::disk::device::device_node(dev_path);
     let dev_name = real
         .file_name()
         .and_then(|n| n.to_str())
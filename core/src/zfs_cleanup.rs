@@ -19,6 +19,10 @@ use color_eyre::eyre::Result;
 ///   3. `zfs umount -af` — bulk + force
 ///   4. `zfs umount -f <root>` — explicit + force
 ///
+/// Escalation stops once a bulk unmount (step 1 or 3) succeeds: everything is
+/// down by then, so a clean run pays for one settle pause instead of four.
+/// The per-dataset steps only cover the root, so they never end it early.
+///
 /// After unmount attempts, `zpool export` with a `-f` retry on failure.
 ///
 /// Errors from individual ZFS commands are intentionally swallowed; only the
@@ -30,7 +34,7 @@ pub async fn cleanup_pool_after_install(pool_name: &str, root_dataset: &str) ->
     let root_handle = zfs.dataset(root_dataset)?;
 
     for attempt in 1..=4 {
-        let _ = match attempt {
+        let result = match attempt {
             1 => zfs.unmount_all(false).await,
             2 => {
                 root_handle
@@ -47,6 +51,10 @@ pub async fn cleanup_pool_after_install(pool_name: &str, root_dataset: &str) ->
         };
         tokio::time::sleep(std::time::Duration::from_secs(1)).await;
         let _ = tokio::task::spawn_blocking(nix::unistd::sync).await;
+        let bulk = matches!(attempt, 1 | 3);
+        if bulk && result.is_ok() {
+            break;
+        }
     }
 
     let pool = zfs.pool(pool_name)?;
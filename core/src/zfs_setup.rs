@@ -15,19 +15,63 @@ pub const ZFS_SERVICES: &[&str] = &[
     "zfs-zed.service",
 ];
 
+/// Every loaded module has a directory under `/sys/module`, so a single
+/// `stat` answers the common case without forking `lsmod`/`modprobe`.
+const ZFS_SYSFS_MODULE: &str = "/sys/module/zfs";
+
 pub fn load_zfs_module(runner: &dyn CommandRunner) -> Result<bool> {
+    load_zfs_module_at(runner, Path::new(ZFS_SYSFS_MODULE))
+}
+
+fn load_zfs_module_at(runner: &dyn CommandRunner, sysfs_module: &Path) -> Result<bool> {
+    if sysfs_module.is_dir() {
+        tracing::debug!("zfs module already loaded, skipping modprobe");
+        return Ok(true);
+    }
     let output = runner.run("modprobe", &["zfs"])?;
     Ok(output.success())
 }
 
 pub fn check_zfs_module(runner: &dyn CommandRunner) -> Result<bool> {
+    check_zfs_module_at(runner, Path::new(ZFS_SYSFS_MODULE))
+}
+
+fn check_zfs_module_at(runner: &dyn CommandRunner, sysfs_module: &Path) -> Result<bool> {
+    if sysfs_module.is_dir() {
+        tracing::info!(found = true, "check_zfs_module (sysfs)");
+        return Ok(true);
+    }
+
+    // Match the module name column exactly; a substring test would also
+    // accept unrelated modules such as `zfs_fuse` or `vzfs`.
     let output = runner.run("lsmod", &[])?;
-    let found = output.success() && output.stdout.contains("zfs");
+    let found = output.success()
+        && output
+            .stdout
+            .lines()
+            .any(|line| line.split_whitespace().next() == Some("zfs"));
     tracing::info!(found, "check_zfs_module");
     Ok(found)
 }
 
+/// Look `name` up on `$PATH` in-process, without spawning a shell.
+fn find_in_path(name: &str) -> bool {
+    use std::os::unix::fs::PermissionsExt;
+
+    std::env::var_os("PATH").is_some_and(|paths| {
+        std::env::split_paths(&paths).any(|dir| {
+            std::fs::metadata(dir.join(name))
+                .is_ok_and(|m| m.is_file() && m.permissions().mode() & 0o111 != 0)
+        })
+    })
+}
+
 pub fn check_zfs_utils(runner: &dyn CommandRunner) -> Result<bool> {
+    if find_in_path("zpool") && find_in_path("zfs") {
+        tracing::info!(found = true, "check_zfs_utils (PATH)");
+        return Ok(true);
+    }
+
     // Use 'command -v' via bash since 'which' may be a shell builtin
     let zpool = runner.run("bash", &["-c", "command -v zpool"])?;
     let zfs = runner.run("bash", &["-c", "command -v zfs"])?;
@@ -88,11 +132,9 @@ pub fn ensure_reflector_finished_and_stopped(runner: &dyn CommandRunner) -> Resu
 /// pacman downloads will be extremely slow or fail entirely.
 pub fn refresh_mirrors_if_stale(runner: &dyn CommandRunner) -> Result<()> {
     let mirrorlist = std::path::Path::new("/etc/pacman.d/mirrorlist");
-    if !mirrorlist.exists() {
-        return Ok(());
-    }
 
-    // Check the age of the mirrorlist
+    // Check the age of the mirrorlist. One stat answers both "does it exist"
+    // and "how old is it".
     let stale = match std::fs::metadata(mirrorlist) {
         Ok(meta) => match meta.modified() {
             Ok(mtime) => {
@@ -104,6 +146,7 @@ pub fn refresh_mirrors_if_stale(runner: &dyn CommandRunner) -> Result<()> {
             }
             Err(_) => true,
         },
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(()),
         Err(_) => true,
     };
 
@@ -113,7 +156,7 @@ pub fn refresh_mirrors_if_stale(runner: &dyn CommandRunner) -> Result<()> {
     }
 
     tracing::info!("mirrorlist is stale, refreshing with reflector...");
-    let output = runner.run(
+    let output = runner.run_quiet(
         "reflector",
         &[
             "--latest",
@@ -173,26 +216,71 @@ pub fn initialize_zfs(
     // 1. Wait for reflector and stop it
     ensure_reflector_finished_and_stopped(runner)?;
 
-    // 2. Refresh mirrors if the mirrorlist is stale
-    refresh_mirrors_if_stale(runner)?;
+    if zfs_available(runner) {
+        // 2. Refresh mirrors if the mirrorlist is stale
+        return refresh_mirrors_if_stale(runner);
+    }
+
+    // 2-3. The mirror refresh and the archzfs repo/keyring setup are both
+    // network-bound and independent (the keys come from keyservers, not the
+    // mirrors), so they overlap. The package install needs both.
+    std::thread::scope(|s| {
+        let mirrors = s.spawn(|| refresh_mirrors_if_stale(runner));
+        let repo = prepare_host_repo(runner);
+        let mirrors = mirrors.join().expect("mirror refresh thread panicked");
+        mirrors.and(repo)
+    })?;
+
+    install_and_load_zfs(runner, kernel, mode, cancel, download_config)
+}
+
+/// Install and load ZFS on the live host unless it is already available.
+///
+/// This is `initialize_zfs` without the reflector/mirrorlist preparation, for
+/// callers that already ran those steps themselves (e.g. to report progress
+/// for each one separately).
+pub fn ensure_zfs_on_host(
+    runner: &dyn CommandRunner,
+    kernel: &str,
+    mode: ZfsModuleMode,
+    cancel: &tokio_util::sync::CancellationToken,
+    download_config: DownloadConfig,
+) -> Result<()> {
+    if zfs_available(runner) {
+        return Ok(());
+    }
+    prepare_host_repo(runner)?;
+    install_and_load_zfs(runner, kernel, mode, cancel, download_config)
+}
 
-    // 3. Check if ZFS is already available
+/// Whether both the ZFS module and the userland tools are already present.
+fn zfs_available(runner: &dyn CommandRunner) -> bool {
     let module_ok = check_zfs_module(runner).unwrap_or(false);
     let utils_ok = check_zfs_utils(runner).unwrap_or(false);
     if module_ok && utils_ok {
         tracing::info!("ZFS already available on host");
-        return Ok(());
+        return true;
     }
-
     tracing::info!("preparing live system for ZFS support");
+    false
+}
 
-    // 4. Add archzfs repo on host
+/// Add the archzfs repo and its keys on the host, and grow the live ISO's
+/// cowspace to make room for the packages.
+fn prepare_host_repo(runner: &dyn CommandRunner) -> Result<()> {
     crate::system::pacman::add_archzfs_repo(runner, None)?;
+    increase_cowspace(runner)
+}
 
-    // 5. Increase cowspace
-    increase_cowspace(runner)?;
-
-    // 6. Install ZFS packages (precompiled first, fallback to DKMS)
+/// Install ZFS packages (precompiled first, fallback to DKMS) and load the
+/// module.
+fn install_and_load_zfs(
+    runner: &dyn CommandRunner,
+    kernel: &str,
+    mode: ZfsModuleMode,
+    cancel: &tokio_util::sync::CancellationToken,
+    download_config: DownloadConfig,
+) -> Result<()> {
     let precompiled = mode == ZfsModuleMode::Precompiled;
     if let Err(e) = install_zfs_on_host(kernel, precompiled, cancel, download_config.clone()) {
         if precompiled {
@@ -203,7 +291,6 @@ pub fn initialize_zfs(
         }
     }
 
-    // 6. Load ZFS module
     let loaded = load_zfs_module(runner)?;
     if !loaded {
         color_eyre::eyre::bail!("failed to load ZFS kernel module");
@@ -220,14 +307,34 @@ mod tests {
 
     #[test]
     fn test_load_zfs_module() {
+        let dir = tempfile::tempdir().unwrap();
         let runner = RecordingRunner::new(vec![CannedResponse::default()]);
-        assert!(load_zfs_module(&runner).unwrap());
+        assert!(load_zfs_module_at(&runner, &dir.path().join("zfs")).unwrap());
 
         let calls = runner.calls();
         assert_eq!(calls[0].program, "modprobe");
         assert_eq!(calls[0].args, vec!["zfs"]);
     }
 
+    #[test]
+    fn test_check_zfs_module_exact_name() {
+        let dir = tempfile::tempdir().unwrap();
+        let runner = RecordingRunner::new(vec![CannedResponse {
+            stdout: "Module  Size  Used by\nzfs_fuse  1234  0\nspl  5678  0\n".into(),
+            ..Default::default()
+        }]);
+        assert!(!check_zfs_module_at(&runner, &dir.path().join("zfs")).unwrap());
+        assert_eq!(runner.calls()[0].program, "lsmod");
+    }
+
+    #[test]
+    fn test_load_zfs_module_already_loaded() {
+        let dir = tempfile::tempdir().unwrap();
+        let runner = RecordingRunner::new(vec![]);
+        assert!(load_zfs_module_at(&runner, dir.path()).unwrap());
+        assert!(runner.calls().is_empty());
+    }
+
     // Note: install_zfs_on_host now uses AlpmContext directly (libalpm),
     // so it can only be tested with a real pacman environment (QEMU).
     // The old RecordingRunner-based tests are removed.
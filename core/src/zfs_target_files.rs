@@ -4,13 +4,19 @@ use std::path::Path;
 use color_eyre::eyre::{Context, Result};
 
 use crate::bootmenu::HOSTID_VALUE;
-use crate::system::cmd::{CommandRunner, check_exit, chroot_cmd};
+use crate::system::cmd::{CommandRunner, check_exit};
 
 /// Custom ZED hook that filters zfs-list.cache to only include datasets from
 /// the currently booted boot environment. Prevents cross-BE mount issues.
 /// Installed as immutable to prevent ZFS package updates from overwriting it.
 const ZED_HISTORY_CACHER: &str = include_str!("../../assets/history_event-zfs-list-cacher.sh");
 
+/// Where the hook lives, relative to the root of the target.
+const ZED_HOOK_PATH: &str = "etc/zfs/zed.d/history_event-zfs-list-cacher.sh";
+
+/// Directory ZED keeps the per-pool dataset lists in, relative to a root.
+const ZFS_LIST_CACHE_DIR: &str = "etc/zfs/zfs-list.cache";
+
 pub fn create_hostid(runner: &dyn CommandRunner) -> Result<()> {
     let output = runner.run("zgenhostid", &["-f", HOSTID_VALUE])?;
     check_exit(&output, "zgenhostid")?;
@@ -18,7 +24,7 @@ pub fn create_hostid(runner: &dyn CommandRunner) -> Result<()> {
 }
 
 pub fn prepare_zfs_cache(target: &Path, pool_name: &str) -> Result<()> {
-    let cache_dir = target.join("etc/zfs/zfs-list.cache");
+    let cache_dir = target.join(ZFS_LIST_CACHE_DIR);
     fs::create_dir_all(&cache_dir)
         .wrap_err_with(|| format!("failed to create cache dir: {}", cache_dir.display()))?;
 
@@ -37,24 +43,29 @@ pub fn copy_hostid(target: &Path) -> Result<()> {
         if let Some(parent) = dst.parent() {
             fs::create_dir_all(parent)?;
         }
-        fs::copy(src, &dst).wrap_err("failed to copy hostid to target")?;
+        crate::system::fs::copy_if_changed(src, &dst)
+            .wrap_err("failed to copy hostid to target")?;
     }
     Ok(())
 }
 
 pub fn copy_zfs_cache(target: &Path, pool_name: &str, mountpoint: &Path) -> Result<()> {
-    let src_cache = Path::new("/etc/zfs/zfs-list.cache").join(pool_name);
-    let dst_cache = target.join("etc/zfs/zfs-list.cache").join(pool_name);
-    if src_cache.exists() {
-        if let Some(parent) = dst_cache.parent() {
-            fs::create_dir_all(parent)?;
-        }
-        // Read cache content and rewrite mountpoints: strip the temporary
-        // mountpoint prefix (e.g. /mnt) so paths are correct on the target.
-        let content = fs::read_to_string(&src_cache).wrap_err("failed to read ZFS cache file")?;
-        let modified = rewrite_cache_mountpoints(&content, mountpoint);
-        fs::write(&dst_cache, modified).wrap_err("failed to write ZFS cache to target")?;
+    let src_cache = Path::new("/").join(ZFS_LIST_CACHE_DIR).join(pool_name);
+    let dst_cache = target.join(ZFS_LIST_CACHE_DIR).join(pool_name);
+    // Read straight away instead of checking for the file first; a missing
+    // cache (ZED never wrote one) is simply skipped.
+    let content = match fs::read_to_string(&src_cache) {
+        Ok(content) => content,
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(()),
+        Err(e) => return Err(e).wrap_err("failed to read ZFS cache file"),
+    };
+    if let Some(parent) = dst_cache.parent() {
+        fs::create_dir_all(parent)?;
     }
+    // Rewrite mountpoints: strip the temporary mountpoint prefix (e.g. /mnt)
+    // so paths are correct on the target.
+    let modified = rewrite_cache_mountpoints(&content, mountpoint);
+    fs::write(&dst_cache, modified).wrap_err("failed to write ZFS cache to target")?;
     Ok(())
 }
 
@@ -62,79 +73,94 @@ pub fn copy_zfs_cache(target: &Path, pool_name: &str, mountpoint: &Path) -> Resu
 /// mountpoint prefix. The cache is tab-separated; the second field is the
 /// mountpoint. For example, `/mnt/home` becomes `/home`.
 fn rewrite_cache_mountpoints(content: &str, mountpoint: &Path) -> String {
-    let prefix = mountpoint.to_str().unwrap_or("/mnt").trim_end_matches('/');
-    let mut result = Vec::new();
-    for line in content.lines() {
-        let fields: Vec<&str> = line.split('\t').collect();
-        if fields.len() > 1 {
-            let path = fields[1];
-            let rewritten = if path == prefix {
-                "/".to_string()
-            } else if let Some(rest) = path.strip_prefix(&format!("{prefix}/")) {
-                format!("/{rest}")
-            } else {
-                path.to_string()
-            };
-            // Rebuild the line with the rewritten mountpoint
-            let owned_fields: Vec<String> = fields
-                .iter()
-                .enumerate()
-                .map(|(i, f)| {
-                    if i == 1 {
-                        rewritten.clone()
-                    } else {
-                        f.to_string()
-                    }
-                })
-                .collect();
-            result.push(owned_fields.join("\t"));
+    let prefix = mountpoint
+        .to_str()
+        .unwrap_or(crate::installer::MOUNTPOINT)
+        .trim_end_matches('/');
+    let nested = format!("{prefix}/");
+    let mut result = String::with_capacity(content.len());
+    for (n, line) in content.lines().enumerate() {
+        if n > 0 {
+            result.push('\n');
+        }
+        let Some((name, rest)) = line.split_once('\t') else {
+            result.push_str(line);
+            continue;
+        };
+        let (path, tail) = match rest.split_once('\t') {
+            Some((path, tail)) => (path, Some(tail)),
+            None => (rest, None),
+        };
+        // Rebuild the line with the rewritten mountpoint
+        result.push_str(name);
+        result.push('\t');
+        if path == prefix {
+            result.push('/');
+        } else if let Some(sub) = path.strip_prefix(&nested) {
+            result.push('/');
+            result.push_str(sub);
         } else {
-            result.push(line.to_string());
+            result.push_str(path);
+        }
+        if let Some(tail) = tail {
+            result.push('\t');
+            result.push_str(tail);
         }
     }
-    result.join("\n")
+    result
 }
 
 /// Install the custom boot-environment-aware ZED cache hook on the target.
 /// This replaces the default zfs-list.cache updater with one that filters
 /// datasets to only include the currently booted BE, preventing cross-BE
 /// mount issues. The file is marked immutable to survive ZFS package updates.
+/// chattr runs on the host against the target path: the flag is a property
+/// of the file, so there is no need to set up a chroot for it.
 pub fn install_zed_cache_hook(runner: &dyn CommandRunner, target: &Path) -> Result<()> {
-    let zed_dir = target.join("etc/zfs/zed.d");
-    fs::create_dir_all(&zed_dir)?;
-
-    let hook_path = zed_dir.join("history_event-zfs-list-cacher.sh");
-
-    // Remove immutable flag if file already exists (e.g., from ZFS package)
-    let _ = chroot_cmd(
-        runner,
-        target,
-        "chattr",
-        &["-i", "/etc/zfs/zed.d/history_event-zfs-list-cacher.sh"],
-    );
-
-    // Remove existing file
-    if hook_path.exists() {
-        fs::remove_file(&hook_path).wrap_err("failed to remove existing ZED hook")?;
+    let hook_path = target.join(ZED_HOOK_PATH);
+    let hook_str = hook_path.to_string_lossy();
+    if let Some(zed_dir) = hook_path.parent() {
+        fs::create_dir_all(zed_dir)?;
     }
 
-    // Write our custom hook
-    fs::write(&hook_path, ZED_HISTORY_CACHER).wrap_err("failed to write ZED cache hook")?;
+    // symlink_metadata: the ZFS package may ship the hook as a symlink, which
+    // has to be replaced rather than written through.
+    if let Ok(meta) = fs::symlink_metadata(&hook_path) {
+        // Our hook is already in place (a re-run over the same target): it
+        // was made immutable back then, so there is nothing to do and no
+        // reason for the chattr round-trip.
+        if meta.is_file()
+            && fs::read(&hook_path).is_ok_and(|content| content == ZED_HISTORY_CACHER.as_bytes())
+        {
+            tracing::info!("ZED boot-environment-aware cache hook already installed");
+            return Ok(());
+        }
+
+        // Only an older hook of ours carries the immutable flag, so try a
+        // plain unlink first and clear the flag only when that is refused.
+        if let Err(e) = fs::remove_file(&hook_path) {
+            if e.kind() != std::io::ErrorKind::PermissionDenied {
+                return Err(e).wrap_err("failed to remove existing ZED hook");
+            }
+            let _ = runner.run("chattr", &["-i", &hook_str]);
+            fs::remove_file(&hook_path).wrap_err("failed to remove existing ZED hook")?;
+        }
+    }
 
-    // Make executable
-    #[cfg(unix)]
+    // Write our custom hook, made executable through the open handle rather
+    // than a second lookup of the path.
     {
+        use std::io::Write;
         use std::os::unix::fs::PermissionsExt;
-        fs::set_permissions(&hook_path, fs::Permissions::from_mode(0o755))?;
+
+        let mut file = fs::File::create(&hook_path).wrap_err("failed to create ZED cache hook")?;
+        file.set_permissions(fs::Permissions::from_mode(0o755))?;
+        file.write_all(ZED_HISTORY_CACHER.as_bytes())
+            .wrap_err("failed to write ZED cache hook")?;
     }
 
     // Mark immutable so ZFS package updates don't overwrite it
-    let output = chroot_cmd(
-        runner,
-        target,
-        "chattr",
-        &["+i", "/etc/zfs/zed.d/history_event-zfs-list-cacher.sh"],
-    )?;
+    let output = runner.run("chattr", &["+i", &hook_str])?;
     if !output.success() {
         tracing::warn!("failed to set immutable flag on ZED hook (non-fatal)");
     }
@@ -143,18 +169,6 @@ pub fn install_zed_cache_hook(runner: &dyn CommandRunner, target: &Path) -> Resu
     Ok(())
 }
 
-pub fn copy_misc_files(
-    runner: &dyn CommandRunner,
-    target: &Path,
-    pool_name: &str,
-    mountpoint: &Path,
-) -> Result<()> {
-    copy_hostid(target)?;
-    copy_zfs_cache(target, pool_name, mountpoint)?;
-    install_zed_cache_hook(runner, target)?;
-    Ok(())
-}
-
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -210,7 +224,6 @@ mod tests {
     fn test_install_zed_cache_hook() {
         let dir = tempfile::tempdir().unwrap();
         let runner = RecordingRunner::new(vec![
-            CannedResponse::default(), // chattr -i (remove old immutable)
             CannedResponse::default(), // chattr +i (set immutable)
         ]);
 
@@ -225,6 +238,11 @@ mod tests {
         assert!(content.contains("boot environment aware"));
         assert!(content.contains("get_current_root"));
         assert!(content.contains("filter_datasets"));
+        {
+            use std::os::unix::fs::PermissionsExt;
+            let mode = fs::metadata(&hook_path).unwrap().permissions().mode();
+            assert_eq!(mode & 0o777, 0o755);
+        }
 
         // Verify chattr +i was called
         let calls = runner.calls();
@@ -232,7 +250,25 @@ mod tests {
             .iter()
             .find(|c| c.args.contains(&"+i".to_string()))
             .expect("should call chattr +i");
-        assert_eq!(chattr_call.program, "arch-chroot");
-        assert!(chattr_call.args.contains(&"chattr".to_string()));
+        assert_eq!(chattr_call.program, "chattr");
+        assert_eq!(chattr_call.args[1], hook_path.to_string_lossy());
+    }
+
+    #[test]
+    fn test_install_zed_cache_hook_replaces_stale_and_skips_current() {
+        let dir = tempfile::tempdir().unwrap();
+        let zed_dir = dir.path().join("etc/zfs/zed.d");
+        fs::create_dir_all(&zed_dir).unwrap();
+        let hook_path = zed_dir.join("history_event-zfs-list-cacher.sh");
+        fs::write(&hook_path, "#!/bin/sh\n# upstream hook\n").unwrap();
+
+        let runner = RecordingRunner::new(vec![]);
+        install_zed_cache_hook(&runner, dir.path()).unwrap();
+        assert_eq!(fs::read_to_string(&hook_path).unwrap(), ZED_HISTORY_CACHER);
+        let first_run = runner.calls().len();
+        assert_eq!(first_run, 1); // chattr +i; the packaged hook wasn't immutable
+
+        install_zed_cache_hook(&runner, dir.path()).unwrap();
+        assert_eq!(runner.calls().len(), first_run);
     }
 }
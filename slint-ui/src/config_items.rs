@@ -163,10 +163,7 @@ fn build_disk_items(c: &GlobalConfig) -> Vec<ConfigItem> {
 
 fn build_zfs_items(c: &GlobalConfig) -> Vec<ConfigItem> {
     let mode = c.installation_mode;
-    let has_swap_partition = matches!(
-        c.swap_mode,
-        SwapMode::ZswapPartition | SwapMode::ZswapPartitionEncrypted
-    );
+    let has_swap_partition = c.swap_mode.uses_partition();
 
     let mut items = vec![
         section_header("Pool"),
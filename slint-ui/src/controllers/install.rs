@@ -236,19 +236,23 @@ fn spawn_install_thread(
         let ui_filter = tracing_subscriber::EnvFilter::try_from_default_env()
             .unwrap_or_else(|_| tracing_subscriber::EnvFilter::new("info"));
 
-        let file_appender = tracing_appender::rolling::never("/tmp", "archinstall-zfs.log");
-        let file_filter = tracing_subscriber::EnvFilter::new(
-            "trace,h2=warn,hyper=warn,reqwest=warn,rustls=warn,pacman=info",
+        let file_appender = tracing_appender::rolling::never(
+            archinstall_zfs_core::metrics::LOG_DIR,
+            archinstall_zfs_core::metrics::LOG_FILE_NAME,
         );
+        let file_filter =
+            tracing_subscriber::EnvFilter::new(archinstall_zfs_core::metrics::LOG_FILE_FILTER);
         let file_layer = tracing_subscriber::fmt::layer()
             .with_writer(file_appender)
             .with_ansi(false)
             .with_target(true)
             .with_filter(file_filter);
 
-        let metrics_layer =
-            archinstall_zfs_core::metrics::MetricsLayer::open("/tmp/archinstall-metrics.jsonl")
-                .expect("failed to open metrics file");
+        let metrics_layer = archinstall_zfs_core::metrics::MetricsLayer::open(
+            archinstall_zfs_core::metrics::METRICS_PATH,
+        )
+        .expect("failed to open metrics file")
+        .with_filter(archinstall_zfs_core::metrics::MetricsLayer::filter());
 
         let subscriber = tracing_subscriber::registry()
             .with(layer.with_filter(ui_filter))
@@ -258,7 +262,7 @@ fn spawn_install_thread(
 
         let runner: Arc<dyn archinstall_zfs_core::system::cmd::CommandRunner> =
             Arc::new(archinstall_zfs_core::system::cmd::RealRunner);
-        let result = install::run_install(runner, &config, Some(download_tx));
+        let result = install::run_install(runner, Arc::new(config), Some(download_tx));
 
         let state = if result.is_ok() { 2 } else { 3 };
         let _ = weak.upgrade_in_event_loop(move |app| {
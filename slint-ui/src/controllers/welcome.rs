@@ -4,9 +4,10 @@
 
 use std::cell::RefCell;
 use std::rc::Rc;
+use std::sync::atomic::{AtomicBool, Ordering};
 use std::sync::{Arc, Mutex};
 
-use archinstall_zfs_core::config::types::GlobalConfig;
+use archinstall_zfs_core::config::types::{GlobalConfig, ZfsModuleMode};
 use archinstall_zfs_core::kernel::scanner::CompatibilityResult;
 use slint::{ComponentHandle, SharedString};
 
@@ -18,6 +19,7 @@ use crate::ui::{App, WelcomeState};
 #[derive(Clone, Default)]
 pub struct KernelScan {
     inner: Arc<Mutex<Option<Vec<CompatibilityResult>>>>,
+    started: Arc<AtomicBool>,
 }
 
 impl KernelScan {
@@ -25,8 +27,10 @@ impl KernelScan {
         Self::default()
     }
 
-    pub fn is_some(&self) -> bool {
-        self.inner.lock().unwrap().is_some()
+    /// Claim the scan. True only for the first caller, so a retry click
+    /// while the scan is still running doesn't start a second one.
+    fn claim(&self) -> bool {
+        !self.started.swap(true, Ordering::AcqRel)
     }
 
     /// Borrow the cached results for the duration of `f`. `None` if the scan
@@ -42,62 +46,112 @@ impl KernelScan {
 }
 
 pub fn setup(app: &App, config: &Rc<RefCell<GlobalConfig>>, kernel_scan: &KernelScan) {
-    run_initial_checks(app, config, kernel_scan);
+    // Set until the initial checks report: `zfs_ok` isn't known before then,
+    // so a retry click must not start ZFS init on a host that may have ZFS.
+    let checks_pending = Arc::new(AtomicBool::new(true));
+    run_initial_checks(app, config, kernel_scan, &checks_pending);
 
     let weak = app.as_weak();
     let cfg = config.clone();
     let kscan = kernel_scan.clone();
     app.global::<WelcomeState>().on_check_internet(move || {
         let Some(app) = weak.upgrade() else { return };
-        let net = archinstall_zfs_core::system::net::check_internet();
-        app.global::<WelcomeState>().set_net_ok(net);
-        if net {
-            if !app.global::<WelcomeState>().get_zfs_ok()
-                && !app.global::<WelcomeState>().get_zfs_installing()
-            {
-                start_zfs_init(&app, &cfg.borrow());
-            }
-            if !kscan.is_some() {
-                start_kernel_scan(&kscan);
-            }
-        }
+        probe_internet(&app, &cfg.borrow(), &kscan, &checks_pending);
     });
 }
 
-fn run_initial_checks(app: &App, config: &Rc<RefCell<GlobalConfig>>, kernel_scan: &KernelScan) {
-    let net = archinstall_zfs_core::system::net::check_internet();
-    let uefi = archinstall_zfs_core::system::sysinfo::has_uefi();
-    let zfs_mod = archinstall_zfs_core::zfs_setup::check_zfs_module(
-        &archinstall_zfs_core::system::cmd::RealRunner,
-    )
-    .unwrap_or(false);
-    let zfs_utils = archinstall_zfs_core::zfs_setup::check_zfs_utils(
-        &archinstall_zfs_core::system::cmd::RealRunner,
-    )
-    .unwrap_or(false);
-
+fn run_initial_checks(
+    app: &App,
+    config: &Rc<RefCell<GlobalConfig>>,
+    kernel_scan: &KernelScan,
+    checks_pending: &Arc<AtomicBool>,
+) {
     let welcome = app.global::<WelcomeState>();
     welcome.set_app_version(env!("CARGO_PKG_VERSION").into());
-    welcome.set_net_ok(net);
-    welcome.set_uefi_ok(uefi);
-    welcome.set_zfs_ok(zfs_mod && zfs_utils);
+    welcome.set_uefi_ok(archinstall_zfs_core::system::sysinfo::has_uefi());
 
-    if net {
-        if !(zfs_mod && zfs_utils) {
-            start_zfs_init(app, &config.borrow());
-        }
-        start_kernel_scan(kernel_scan);
+    // The ZFS presence check (lsmod / `command -v` fallbacks on an ISO
+    // without ZFS) and the connectivity probe don't depend on each other, so
+    // both run at once off the UI thread. ZFS init needs both answers; the
+    // kernel scan only needs the network.
+    let weak = app.as_weak();
+    let kernel = config.borrow().primary_kernel().to_string();
+    let zfs_mode = config.borrow().zfs_module_mode;
+    let kscan = kernel_scan.clone();
+    let pending = Arc::clone(checks_pending);
+    tokio::task::spawn(async move {
+        let zfs = tokio::task::spawn_blocking(|| {
+            let runner = archinstall_zfs_core::system::cmd::RealRunner;
+            archinstall_zfs_core::zfs_setup::check_zfs_module(&runner).unwrap_or(false)
+                && archinstall_zfs_core::zfs_setup::check_zfs_utils(&runner).unwrap_or(false)
+        });
+        let net = tokio::task::spawn_blocking(archinstall_zfs_core::system::net::check_internet);
+        let zfs = zfs.await.unwrap_or(false);
+        let net = net.await.unwrap_or(false);
+        let _ = weak.upgrade_in_event_loop(move |app| {
+            let welcome = app.global::<WelcomeState>();
+            welcome.set_zfs_ok(zfs);
+            pending.store(false, Ordering::Release);
+            // A retry that got through while these were running only set
+            // `net_ok`; it still counts.
+            let net = net || welcome.get_net_ok();
+            publish_net(&app, net, kernel, zfs_mode, &kscan);
+        });
+    });
+}
+
+/// Run the connectivity probe off the UI thread, then publish the result.
+/// The probe is a blocking TCP connect that can take up to its timeout on a
+/// bad network; doing it inline would freeze the window for that long.
+/// While the initial checks are pending only `net_ok` is set; they start
+/// the network-gated jobs themselves once `zfs_ok` is known.
+fn probe_internet(
+    app: &App,
+    config: &GlobalConfig,
+    kernel_scan: &KernelScan,
+    checks_pending: &Arc<AtomicBool>,
+) {
+    let weak = app.as_weak();
+    let kernel = config.primary_kernel().to_string();
+    let zfs_mode = config.zfs_module_mode;
+    let kscan = kernel_scan.clone();
+    let pending = Arc::clone(checks_pending);
+    tokio::task::spawn(async move {
+        let net = tokio::task::spawn_blocking(archinstall_zfs_core::system::net::check_internet)
+            .await
+            .unwrap_or(false);
+        let _ = weak.upgrade_in_event_loop(move |app| {
+            if pending.load(Ordering::Acquire) {
+                app.global::<WelcomeState>().set_net_ok(net);
+            } else {
+                publish_net(&app, net, kernel, zfs_mode, &kscan);
+            }
+        });
+    });
+}
+
+/// Set `net_ok` and start the network-gated jobs (ZFS init, kernel scan)
+/// that haven't run yet.
+fn publish_net(app: &App, net: bool, kernel: String, zfs_mode: ZfsModuleMode, kscan: &KernelScan) {
+    let welcome = app.global::<WelcomeState>();
+    welcome.set_net_ok(net);
+    if !net {
+        return;
+    }
+    if !welcome.get_zfs_ok() && !welcome.get_zfs_installing() {
+        start_zfs_init(app, kernel, zfs_mode);
+    }
+    if kscan.claim() {
+        start_kernel_scan(kscan);
     }
 }
 
-fn start_zfs_init(app: &App, config: &GlobalConfig) {
+fn start_zfs_init(app: &App, kernel: String, zfs_mode: ZfsModuleMode) {
     app.global::<WelcomeState>().set_zfs_installing(true);
     app.global::<WelcomeState>()
         .set_zfs_install_status(SharedString::from("Initializing..."));
 
     let weak = app.as_weak();
-    let kernel = config.primary_kernel().to_string();
-    let zfs_mode = config.zfs_module_mode;
 
     tokio::task::spawn_blocking(move || {
         let runner: Arc<dyn archinstall_zfs_core::system::cmd::CommandRunner> =
@@ -120,7 +174,9 @@ fn start_zfs_init(app: &App, config: &GlobalConfig) {
             app.global::<WelcomeState>().set_zfs_install_pct(30);
         });
 
-        let result = archinstall_zfs_core::zfs_setup::initialize_zfs(
+        // Reflector and the mirrorlist were handled above; skip straight to
+        // the package work instead of repeating them via initialize_zfs.
+        let result = archinstall_zfs_core::zfs_setup::ensure_zfs_on_host(
             &*runner,
             &kernel,
             zfs_mode,
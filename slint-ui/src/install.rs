@@ -4,7 +4,7 @@ use std::sync::Arc;
 use color_eyre::eyre::{Result, eyre};
 use tokio_util::sync::CancellationToken;
 
-use archinstall_zfs_core::config::types::{GlobalConfig, SwapMode};
+use archinstall_zfs_core::config::types::GlobalConfig;
 use archinstall_zfs_core::system::async_download::DownloadProgress;
 use archinstall_zfs_core::system::cmd::CommandRunner;
 
@@ -12,12 +12,12 @@ use archinstall_zfs_core::system::cmd::CommandRunner;
 /// Must be called from a thread with tokio runtime context (Handle::current() must work).
 pub fn run_install(
     runner: Arc<dyn CommandRunner>,
-    config: &GlobalConfig,
+    config: Arc<GlobalConfig>,
     download_progress_tx: Option<Arc<tokio::sync::watch::Sender<DownloadProgress>>>,
 ) -> Result<()> {
     let cancel = CancellationToken::new();
     let rt = tokio::runtime::Handle::current();
-    let mountpoint = PathBuf::from("/mnt");
+    let mountpoint = PathBuf::from(archinstall_zfs_core::installer::MOUNTPOINT);
     let pool_name = config
         .pool_name
         .as_deref()
@@ -28,7 +28,7 @@ pub fn run_install(
 
     tracing::info!("Phase 1: Disk preparation");
     tracing::info!(target: "metrics", event = "phase_start", num = 1u32, name = "Disk preparation");
-    let parts = archinstall_zfs_core::prepare::prepare_disk(&*runner, config)?;
+    let parts = archinstall_zfs_core::prepare::prepare_disk(&*runner, &config)?;
     let efi_partition = parts.efi;
     let zfs_partition = parts.zfs;
     let swap_partition = parts.swap;
@@ -37,7 +37,7 @@ pub fn run_install(
     tracing::info!(target: "metrics", event = "phase_start", num = 2u32, name = "ZFS pool and datasets");
     rt.block_on(archinstall_zfs_core::prepare::prepare_zfs(
         &*runner,
-        config,
+        &config,
         zfs_partition.as_deref(),
         &mountpoint,
     ))?;
@@ -64,15 +64,12 @@ pub fn run_install(
         &*runner,
         &mountpoint,
         pool_name,
-        config,
+        &config,
     ))?;
 
     tracing::info!("Phase 13: Setting up ZFSBootMenu");
     tracing::info!(target: "metrics", event = "phase_start", num = 13u32, name = "Setting up ZFSBootMenu");
-    let zswap_on = matches!(
-        config.swap_mode,
-        SwapMode::ZswapPartition | SwapMode::ZswapPartitionEncrypted
-    );
+    let zswap_on = config.swap_mode.uses_partition();
     rt.block_on(archinstall_zfs_core::bootmenu::set_zbm_properties(
         pool_name,
         prefix,
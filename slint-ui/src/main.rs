@@ -43,9 +43,10 @@ struct Cli {
     ui_scale: Option<f32>,
 }
 
-#[tokio::main]
-async fn main() -> Result<()> {
+fn main() -> Result<()> {
     color_eyre::install()?;
+    // --help and usage errors exit here, before the tokio runtime and its
+    // worker threads are started.
     let cli = Cli::parse();
 
     if let Some(scale) = cli.ui_scale
@@ -58,14 +59,22 @@ async fn main() -> Result<()> {
         }
     }
 
-    let config = if let Some(ref path) = cli.config {
-        GlobalConfig::load_from_file(path)?
-    } else {
-        GlobalConfig::default()
+    // Load (and for --silent, validate) the config before the runtime too,
+    // so a bad config file fails fast.
+    let config = load_config(&cli)?;
+
+    tokio::runtime::Runtime::new()?.block_on(run(cli, config))
+}
+
+fn load_config(cli: &Cli) -> Result<GlobalConfig> {
+    use color_eyre::eyre::bail;
+
+    let config = match cli.config {
+        Some(ref path) => GlobalConfig::load_from_file(path)?,
+        None => GlobalConfig::default(),
     };
 
     if cli.silent {
-        use color_eyre::eyre::bail;
         if cli.config.is_none() {
             bail!("--silent requires --config");
         }
@@ -73,14 +82,53 @@ async fn main() -> Result<()> {
         if !errors.is_empty() {
             bail!("Config validation failed:\n  {}", errors.join("\n  "));
         }
-        let runner: Arc<dyn archinstall_zfs_core::system::cmd::CommandRunner> =
-            Arc::new(archinstall_zfs_core::system::cmd::RealRunner);
-        install::run_install(runner, &config, None)
+    }
+    Ok(config)
+}
+
+async fn run(cli: Cli, config: GlobalConfig) -> Result<()> {
+    if cli.silent {
+        run_silent(config).await
     } else {
         run_gui(config)
     }
 }
 
+/// `--silent`: no window is ever created, so the host checks and ZFS setup
+/// the welcome screen normally drives happen here, and the pipeline runs on
+/// a blocking thread like the GUI's install thread (`run_install` bridges
+/// into the runtime with `block_on`, which can't be done from this task).
+async fn run_silent(config: GlobalConfig) -> Result<()> {
+    use color_eyre::eyre::bail;
+
+    let online = tokio::task::spawn_blocking(archinstall_zfs_core::system::net::check_internet);
+    let uefi = archinstall_zfs_core::system::sysinfo::has_uefi();
+    if !online.await? {
+        bail!("No internet connectivity. Connect to the network and retry.");
+    }
+    if !uefi {
+        bail!("UEFI boot required. This installer only supports UEFI systems.");
+    }
+
+    let runner: Arc<dyn archinstall_zfs_core::system::cmd::CommandRunner> =
+        Arc::new(archinstall_zfs_core::system::cmd::RealRunner);
+    let config = Arc::new(config);
+    tokio::task::spawn_blocking(move || {
+        archinstall_zfs_core::zfs_setup::initialize_zfs(
+            &*runner,
+            config.primary_kernel(),
+            config.zfs_module_mode,
+            &tokio_util::sync::CancellationToken::new(),
+            archinstall_zfs_core::system::async_download::DownloadConfig {
+                concurrency: config.parallel_downloads as usize,
+                ..Default::default()
+            },
+        )?;
+        install::run_install(runner, config, None)
+    })
+    .await?
+}
+
 fn run_gui(config: GlobalConfig) -> Result<()> {
     let app = App::new()?;
     let config = Rc::new(RefCell::new(config));
@@ -4,20 +4,18 @@ use std::sync::Arc;
 use color_eyre::eyre::{Result, bail, eyre};
 use tokio_util::sync::CancellationToken;
 
-use archinstall_zfs_core::config::types::{GlobalConfig, SwapMode};
+use archinstall_zfs_core::config::types::GlobalConfig;
 use archinstall_zfs_core::system::cmd::{CommandRunner, RealRunner};
 
 use crate::Cli;
 
-pub async fn run(
-    cli: Cli,
-    ui_log_rx: tokio::sync::mpsc::UnboundedReceiver<(String, i32)>,
-) -> Result<()> {
-    let config = if let Some(ref path) = cli.config {
-        tracing::info!(path = %path.display(), "loading config from file");
-        GlobalConfig::load_from_file(path)?
-    } else {
-        GlobalConfig::default()
+/// Load the config and, for `--silent`, check it is complete. Runs before
+/// the tokio runtime, logging and metrics files are set up, so a missing or
+/// invalid config is reported without starting any of them.
+pub fn load_config(cli: &Cli) -> Result<GlobalConfig> {
+    let config = match cli.config {
+        Some(ref path) => GlobalConfig::load_from_file(path)?,
+        None => GlobalConfig::default(),
     };
 
     if cli.silent {
@@ -28,6 +26,29 @@ pub async fn run(
         if !errors.is_empty() {
             bail!("Config validation failed:\n  {}", errors.join("\n  "));
         }
+    }
+    Ok(config)
+}
+
+pub async fn run(
+    cli: Cli,
+    config: GlobalConfig,
+    ui_log_rx: tokio::sync::mpsc::UnboundedReceiver<(String, i32)>,
+) -> Result<()> {
+    if let Some(ref path) = cli.config {
+        tracing::info!(path = %path.display(), "loaded config from file");
+    }
+
+    if cli.silent {
+        if cli.dry_run {
+            // Stop before Phase 0: nothing is probed, partitioned or imported,
+            // so there is no pool or mount left behind to clean up.
+            tracing::info!("dry run: config valid, skipping installation");
+            let mut out = std::io::BufWriter::new(std::io::stdout().lock());
+            config.write_json(&mut out)?;
+            std::io::Write::flush(&mut out)?;
+            return Ok(());
+        }
         tracing::info!("silent mode: config valid, starting installation");
         let runner: Arc<dyn CommandRunner> = Arc::new(RealRunner);
         let cancel = CancellationToken::new();
@@ -55,54 +76,64 @@ pub async fn run_install(
         >,
     >,
 ) -> Result<()> {
-    let mountpoint = PathBuf::from("/mnt");
+    let mountpoint = PathBuf::from(archinstall_zfs_core::installer::MOUNTPOINT);
+    let config = Arc::new(config);
+    // Borrowed from the shared config for the whole install rather than
+    // copied out of it.
     let pool_name = config
         .pool_name
         .as_deref()
-        .ok_or_else(|| eyre!("pool name not set"))?
-        .to_string();
-    let prefix = config.dataset_prefix.clone();
+        .ok_or_else(|| eyre!("pool name not set"))?;
+    let prefix = config.dataset_prefix.as_str();
     let kernel = config.primary_kernel().to_string();
-    let config = Arc::new(config);
+    // Host ZFS setup (Phase 0) and the ZFSBootMenu install (Phase 13) use
+    // the same download settings.
+    let dl_config = archinstall_zfs_core::system::async_download::DownloadConfig {
+        concurrency: config.parallel_downloads as usize,
+        ..Default::default()
+    };
 
     // ── Phase 0: Pre-installation checks ───────────────────────
     tracing::info!("Phase 0: Pre-installation checks");
 
-    if !archinstall_zfs_core::system::net::check_internet() {
+    // The connectivity probe (blocking TCP connect) runs while the UEFI
+    // check stats /sys; errors are still reported network first.
+    let online = tokio::task::spawn_blocking(archinstall_zfs_core::system::net::check_internet);
+    let uefi = archinstall_zfs_core::system::sysinfo::has_uefi();
+    if !online.await? {
         bail!("No internet connectivity. Connect to the network and retry.");
     }
     tracing::info!("Internet connectivity OK");
 
-    if !archinstall_zfs_core::system::sysinfo::has_uefi() {
+    if !uefi {
         bail!("UEFI boot required. This installer only supports UEFI systems.");
     }
     tracing::info!("UEFI boot detected");
 
-    // Async: HTTP calls to validate kernel/ZFS compatibility
-    let warnings = archinstall_zfs_core::kernel::scanner::validate_kernel_zfs_plan(
-        &kernel,
-        config.zfs_module_mode,
-    )
-    .await;
-    for w in &warnings {
-        tracing::warn!("kernel compatibility: {w}");
-    }
-
-    // Sync: initialize ZFS on host (runner + alpm)
-    {
+    // Sync: initialize ZFS on host (runner + alpm). Started before the
+    // kernel/ZFS compatibility check so the two network-bound steps overlap.
+    let zfs_init = {
         let r = runner.clone();
         let k = kernel.clone();
         let zfs_mode = config.zfs_module_mode;
         let c = cancel.clone();
-        let dl_config = archinstall_zfs_core::system::async_download::DownloadConfig {
-            concurrency: config.parallel_downloads as usize,
-            ..Default::default()
-        };
+        let dl_config = dl_config.clone();
         tokio::task::spawn_blocking(move || {
             archinstall_zfs_core::zfs_setup::initialize_zfs(&*r, &k, zfs_mode, &c, dl_config)
         })
-        .await??;
+    };
+
+    // Async: HTTP calls to validate kernel/ZFS compatibility
+    let warnings = archinstall_zfs_core::kernel::scanner::validate_kernel_zfs_plan(
+        &kernel,
+        config.zfs_module_mode,
+    )
+    .await;
+    if !warnings.is_empty() {
+        tracing::warn!("kernel compatibility:\n  {}", warnings.join("\n  "));
     }
+
+    zfs_init.await??;
     tracing::info!("ZFS initialized on host");
 
     // ── Phase 1: Disk preparation (sync) ──────────────────────
@@ -152,7 +183,7 @@ pub async fn run_install(
         tokio::task::spawn_blocking(move || -> Result<()> {
             let mut installer = archinstall_zfs_core::installer::Installer::new(
                 r,
-                (*config).clone(),
+                config,
                 &mountpoint,
                 cancel,
                 download_tx,
@@ -168,19 +199,16 @@ pub async fn run_install(
     // TRIM strategy: post-install ZFS-side configuration (no Alpm involved).
     // Called outside Installer so the zfskit setter can be a regular
     // .await rather than a block_on bridge.
-    archinstall_zfs_core::zfs_trim::configure_zfs_trim(&*runner, &mountpoint, &pool_name, &config)
+    archinstall_zfs_core::zfs_trim::configure_zfs_trim(&*runner, &mountpoint, pool_name, &config)
         .await?;
 
     // ── Phase 13: ZFSBootMenu ──────────────────────────────────
     tracing::info!("Phase 13: Setting up ZFSBootMenu");
 
-    let zswap_on = matches!(
-        config.swap_mode,
-        SwapMode::ZswapPartition | SwapMode::ZswapPartitionEncrypted
-    );
+    let zswap_on = config.swap_mode.uses_partition();
     archinstall_zfs_core::bootmenu::set_zbm_properties(
-        &pool_name,
-        &prefix,
+        pool_name,
+        prefix,
         config.init_system,
         zswap_on,
         config.set_bootfs,
@@ -192,10 +220,7 @@ pub async fn run_install(
         &mountpoint,
         config.init_system,
         &cancel,
-        archinstall_zfs_core::system::async_download::DownloadConfig {
-            concurrency: config.parallel_downloads as usize,
-            ..Default::default()
-        },
+        dl_config,
     )
     .await?;
     tracing::info!("ZFSBootMenu built and installed");
@@ -226,8 +251,7 @@ pub async fn run_install(
         .await??;
     }
 
-    archinstall_zfs_core::zfs_cleanup::cleanup_pool_after_install(&pool_name, &root_ds_full)
-        .await?;
+    archinstall_zfs_core::zfs_cleanup::cleanup_pool_after_install(pool_name, &root_ds_full).await?;
 
     tracing::info!("Installation complete!");
     Ok(())
@@ -34,18 +34,22 @@ fn setup_logging(ui_log_tx: tokio::sync::mpsc::UnboundedSender<(String, i32)>) -
     let ui_filter = EnvFilter::try_from_default_env().unwrap_or_else(|_| EnvFilter::new("info"));
 
     // File layer — trace for our code, warn for noisy deps
-    let file_appender = tracing_appender::rolling::never("/tmp", "archinstall-zfs.log");
-    let file_filter =
-        EnvFilter::new("trace,h2=warn,hyper=warn,reqwest=warn,rustls=warn,pacman=info");
+    let file_appender = tracing_appender::rolling::never(
+        archinstall_zfs_core::metrics::LOG_DIR,
+        archinstall_zfs_core::metrics::LOG_FILE_NAME,
+    );
+    let file_filter = EnvFilter::new(archinstall_zfs_core::metrics::LOG_FILE_FILTER);
     let file_layer = fmt::layer()
         .with_writer(file_appender)
         .with_ansi(false)
         .with_target(true)
         .with_filter(file_filter);
 
-    let metrics_layer =
-        archinstall_zfs_core::metrics::MetricsLayer::open("/tmp/archinstall-metrics.jsonl")
-            .wrap_err("failed to open metrics file")?;
+    let metrics_layer = archinstall_zfs_core::metrics::MetricsLayer::open(
+        archinstall_zfs_core::metrics::METRICS_PATH,
+    )
+    .wrap_err("failed to open metrics file")?
+    .with_filter(archinstall_zfs_core::metrics::MetricsLayer::filter());
 
     tracing_subscriber::registry()
         .with(channel_layer.with_filter(ui_filter))
@@ -56,14 +60,24 @@ fn setup_logging(ui_log_tx: tokio::sync::mpsc::UnboundedSender<(String, i32)>) -
     Ok(())
 }
 
-#[tokio::main]
-async fn main() -> Result<()> {
+fn main() -> Result<()> {
     color_eyre::install()?;
+    // Parse first: --help, --version and usage errors exit here without
+    // starting the tokio runtime and its worker threads, creating the log
+    // and metrics files or installing the subscriber.
+    let cli = Cli::parse();
+    let config = app::load_config(&cli)?;
+
+    tokio::runtime::Runtime::new()
+        .wrap_err("failed to start tokio runtime")?
+        .block_on(run(cli, config))
+}
+
+async fn run(cli: Cli, config: archinstall_zfs_core::config::types::GlobalConfig) -> Result<()> {
     let (ui_log_tx, ui_log_rx) = tokio::sync::mpsc::unbounded_channel();
     setup_logging(ui_log_tx)?;
 
-    let cli = Cli::parse();
     tracing::info!(?cli, "starting archinstall-zfs");
 
-    app::run(cli, ui_log_rx).await
+    app::run(cli, config, ui_log_rx).await
 }
@@ -22,13 +22,20 @@ use self::screens::wizard::Wizard;
 
 pub async fn run_tui(
     config: GlobalConfig,
-    _dry_run: bool,
+    dry_run: bool,
     ui_log_rx: tokio::sync::mpsc::UnboundedReceiver<(String, i32)>,
 ) -> Result<()> {
     let mut terminal = setup_terminal()?;
-    let result = run_app(&mut terminal, config, ui_log_rx).await;
+    let result = run_app(&mut terminal, config, dry_run, ui_log_rx).await;
     restore_terminal()?;
-    result
+    // A dry run hands back the config the wizard produced instead of
+    // installing it; print it once the terminal is back to normal.
+    if let Some(config) = result? {
+        let mut out = std::io::BufWriter::new(std::io::stdout().lock());
+        config.write_json(&mut out)?;
+        std::io::Write::flush(&mut out)?;
+    }
+    Ok(())
 }
 
 fn setup_terminal() -> Result<DefaultTerminal> {
@@ -57,8 +64,9 @@ pub enum Action {
 async fn run_app(
     terminal: &mut DefaultTerminal,
     mut config: GlobalConfig,
+    dry_run: bool,
     ui_log_rx: tokio::sync::mpsc::UnboundedReceiver<(String, i32)>,
-) -> Result<()> {
+) -> Result<Option<GlobalConfig>> {
     // Check connectivity before the wizard. If the user connects via WiFi,
     // automatically enable network_copy_iso so the iwd profile is copied to
     // the installed system (saved at /var/lib/iwd/<ssid>.psk by iwd).
@@ -70,33 +78,40 @@ async fn run_app(
     let mut wizard = Wizard::new(config);
     let mut events = EventStream::new();
 
+    // The wizard renders purely from its own state, so it only needs a
+    // frame after an event (keys, mouse, resize) rather than on a timer.
     loop {
         terminal.draw(|frame| wizard.render(frame))?;
 
-        match tokio::time::timeout(Duration::from_millis(50), events.next()).await {
-            Ok(Some(Ok(ev))) => match wizard.handle_event(ev, terminal).await? {
+        match events.next().await {
+            Some(Ok(ev)) => match wizard.handle_event(ev, terminal).await? {
                 Action::Continue => {}
                 Action::Install => {
                     let config = wizard.into_config();
-                    run_install_screen(terminal, config, ui_log_rx).await?;
-                    return Ok(());
+                    if dry_run {
+                        tracing::info!("dry run: skipping installation");
+                        return Ok(Some(config));
+                    }
+                    run_install_screen(terminal, &mut events, config, ui_log_rx).await?;
+                    return Ok(None);
                 }
-                Action::Quit => return Ok(()),
+                Action::Quit => return Ok(None),
             },
-            Ok(Some(Err(e))) => return Err(e.into()),
-            Ok(None) => return Ok(()), // stream ended
-            Err(_) => {}               // timeout, continue loop
+            Some(Err(e)) => return Err(e.into()),
+            None => return Ok(None), // stream ended
         }
     }
 }
 
+/// Reuses the wizard's `EventStream` rather than opening a second reader on
+/// the same terminal while the first one is still alive.
 async fn run_install_screen(
     terminal: &mut DefaultTerminal,
+    events: &mut EventStream,
     config: GlobalConfig,
     ui_log_rx: tokio::sync::mpsc::UnboundedReceiver<(String, i32)>,
 ) -> Result<()> {
     let mut progress = InstallProgress::start(config, ui_log_rx);
-    let mut events = EventStream::new();
 
     loop {
         progress.tick();
@@ -29,47 +29,47 @@ pub fn run_edit(
             render_edit(frame, title, &value, cursor, mask);
         })?;
 
-        if crossterm::event::poll(std::time::Duration::from_millis(50))? {
-            let ev = crossterm::event::read()?;
-            if let Event::Key(key) = ev {
-                match (key.code, key.modifiers) {
-                    (KeyCode::Esc, _) | (KeyCode::Char('c'), KeyModifiers::CONTROL) => {
-                        return Ok(EditResult { value: None });
-                    }
-                    (KeyCode::Enter, _) => {
-                        return Ok(EditResult { value: Some(value) });
-                    }
-                    (KeyCode::Char(c), KeyModifiers::NONE | KeyModifiers::SHIFT) => {
-                        let byte_pos = char_to_byte(&value, cursor);
-                        value.insert(byte_pos, c);
-                        cursor += 1;
-                    }
-                    (KeyCode::Backspace, _) if cursor > 0 => {
-                        cursor -= 1;
+        // Nothing here changes without input, so block for the next event
+        // instead of redrawing on a timer.
+        let ev = crossterm::event::read()?;
+        if let Event::Key(key) = ev {
+            match (key.code, key.modifiers) {
+                (KeyCode::Esc, _) | (KeyCode::Char('c'), KeyModifiers::CONTROL) => {
+                    return Ok(EditResult { value: None });
+                }
+                (KeyCode::Enter, _) => {
+                    return Ok(EditResult { value: Some(value) });
+                }
+                (KeyCode::Char(c), KeyModifiers::NONE | KeyModifiers::SHIFT) => {
+                    let byte_pos = char_to_byte(&value, cursor);
+                    value.insert(byte_pos, c);
+                    cursor += 1;
+                }
+                (KeyCode::Backspace, _) if cursor > 0 => {
+                    cursor -= 1;
+                    let byte_pos = char_to_byte(&value, cursor);
+                    value.remove(byte_pos);
+                }
+                (KeyCode::Delete, _) => {
+                    let char_count = value.chars().count();
+                    if cursor < char_count {
                         let byte_pos = char_to_byte(&value, cursor);
                         value.remove(byte_pos);
                     }
-                    (KeyCode::Delete, _) => {
-                        let char_count = value.chars().count();
-                        if cursor < char_count {
-                            let byte_pos = char_to_byte(&value, cursor);
-                            value.remove(byte_pos);
-                        }
-                    }
-                    (KeyCode::Left, _) => {
-                        cursor = cursor.saturating_sub(1);
-                    }
-                    (KeyCode::Right, _) => {
-                        cursor = (cursor + 1).min(value.chars().count());
-                    }
-                    (KeyCode::Home, _) => cursor = 0,
-                    (KeyCode::End, _) => cursor = value.chars().count(),
-                    (KeyCode::Char('u'), KeyModifiers::CONTROL) => {
-                        value.clear();
-                        cursor = 0;
-                    }
-                    _ => {}
                 }
+                (KeyCode::Left, _) => {
+                    cursor = cursor.saturating_sub(1);
+                }
+                (KeyCode::Right, _) => {
+                    cursor = (cursor + 1).min(value.chars().count());
+                }
+                (KeyCode::Home, _) => cursor = 0,
+                (KeyCode::End, _) => cursor = value.chars().count(),
+                (KeyCode::Char('u'), KeyModifiers::CONTROL) => {
+                    value.clear();
+                    cursor = 0;
+                }
+                _ => {}
             }
         }
     }
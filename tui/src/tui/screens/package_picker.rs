@@ -60,137 +60,137 @@ pub async fn run_package_picker(
             );
         })?;
 
-        if crossterm::event::poll(std::time::Duration::from_millis(50))? {
-            let ev = crossterm::event::read()?;
-            if let Event::Key(key) = ev {
-                if key.kind != KeyEventKind::Press {
-                    continue;
+        // Nothing here changes without input, so block for the next event
+        // instead of redrawing on a timer.
+        let ev = crossterm::event::read()?;
+        if let Event::Key(key) = ev {
+            if key.kind != KeyEventKind::Press {
+                continue;
+            }
+            match (&focus, key.code, key.modifiers) {
+                // Global: Esc to cancel, Ctrl+C to cancel
+                (_, KeyCode::Esc, _) | (_, KeyCode::Char('c'), KeyModifiers::CONTROL) => {
+                    return Ok(None);
                 }
-                match (&focus, key.code, key.modifiers) {
-                    // Global: Esc to cancel, Ctrl+C to cancel
-                    (_, KeyCode::Esc, _) | (_, KeyCode::Char('c'), KeyModifiers::CONTROL) => {
-                        return Ok(None);
-                    }
 
-                    // Search mode
-                    (Focus::Search, KeyCode::Char(c), KeyModifiers::NONE | KeyModifiers::SHIFT) => {
-                        search_text.push(c);
-                        status_msg.clear();
-                        // Search repo
+                // Search mode
+                (Focus::Search, KeyCode::Char(c), KeyModifiers::NONE | KeyModifiers::SHIFT) => {
+                    search_text.push(c);
+                    status_msg.clear();
+                    // Search repo
+                    results = do_repo_search(&search_text).await;
+                    searching_aur = false;
+                    list_state.select(if results.is_empty() { None } else { Some(0) });
+                }
+                (Focus::Search, KeyCode::Backspace, _) => {
+                    search_text.pop();
+                    status_msg.clear();
+                    if search_text.is_empty() {
+                        results.clear();
+                        list_state.select(None);
+                    } else {
                         results = do_repo_search(&search_text).await;
                         searching_aur = false;
                         list_state.select(if results.is_empty() { None } else { Some(0) });
                     }
-                    (Focus::Search, KeyCode::Backspace, _) => {
-                        search_text.pop();
-                        status_msg.clear();
-                        if search_text.is_empty() {
-                            results.clear();
-                            list_state.select(None);
-                        } else {
-                            results = do_repo_search(&search_text).await;
-                            searching_aur = false;
-                            list_state.select(if results.is_empty() { None } else { Some(0) });
-                        }
-                    }
-                    // Tab: search AUR instead
-                    (Focus::Search, KeyCode::Tab, _) if !search_text.is_empty() => {
-                        status_msg = "Searching AUR...".to_string();
-                        // Render the status before blocking on HTTP
-                        terminal.draw(|frame| {
-                            render_picker(
-                                frame,
-                                &search_text,
-                                &results,
-                                &mut list_state,
-                                &all_selected,
-                                &focus,
-                                true,
-                                &status_msg,
-                            );
-                        })?;
-                        match archinstall_zfs_core::packages::search_aur(&search_text, 20).await {
-                            Ok(aur_results) => {
-                                results = aur_results;
-                                searching_aur = true;
-                                status_msg.clear();
-                            }
-                            Err(e) => {
-                                status_msg = format!("AUR error: {e}");
-                                results.clear();
-                            }
-                        }
-                        list_state.select(if results.is_empty() { None } else { Some(0) });
-                    }
-                    // Down arrow: move to results
-                    (Focus::Search, KeyCode::Down, _) if !results.is_empty() => {
-                        focus = Focus::Results;
-                        if list_state.selected().is_none() {
-                            list_state.select(Some(0));
+                }
+                // Tab: search AUR instead
+                (Focus::Search, KeyCode::Tab, _) if !search_text.is_empty() => {
+                    status_msg = "Searching AUR...".to_string();
+                    // Render the status before blocking on HTTP
+                    terminal.draw(|frame| {
+                        render_picker(
+                            frame,
+                            &search_text,
+                            &results,
+                            &mut list_state,
+                            &all_selected,
+                            &focus,
+                            true,
+                            &status_msg,
+                        );
+                    })?;
+                    match archinstall_zfs_core::packages::search_aur(&search_text, 20).await {
+                        Ok(aur_results) => {
+                            results = aur_results;
+                            searching_aur = true;
+                            status_msg.clear();
                         }
-                    }
-                    // Enter in search: add typed text directly as package
-                    (Focus::Search, KeyCode::Enter, _) if !search_text.is_empty() => {
-                        // If there are results and top one matches, add it
-                        if let Some(0) = list_state.selected()
-                            && let Some(pkg) = results.first()
-                        {
-                            add_package(pkg, &mut selected_repo, &mut selected_aur);
-                            search_text.clear();
+                        Err(e) => {
+                            status_msg = format!("AUR error: {e}");
                             results.clear();
-                            list_state.select(None);
-                            continue;
                         }
                     }
-                    // Ctrl+D: done
-                    (_, KeyCode::Char('d'), KeyModifiers::CONTROL) => {
-                        return Ok(Some(PackagePickerResult {
-                            repo_packages: selected_repo,
-                            aur_packages: selected_aur,
-                        }));
+                    list_state.select(if results.is_empty() { None } else { Some(0) });
+                }
+                // Down arrow: move to results
+                (Focus::Search, KeyCode::Down, _) if !results.is_empty() => {
+                    focus = Focus::Results;
+                    if list_state.selected().is_none() {
+                        list_state.select(Some(0));
                     }
-
-                    // Results mode
-                    (Focus::Results, KeyCode::Up, _) => {
-                        let i = list_state.selected().unwrap_or(0);
-                        if i == 0 {
-                            focus = Focus::Search;
-                        } else {
-                            list_state.select(Some(i - 1));
-                        }
+                }
+                // Enter in search: add typed text directly as package
+                (Focus::Search, KeyCode::Enter, _) if !search_text.is_empty() => {
+                    // If there are results and top one matches, add it
+                    if let Some(0) = list_state.selected()
+                        && let Some(pkg) = results.first()
+                    {
+                        add_package(pkg, &mut selected_repo, &mut selected_aur);
+                        search_text.clear();
+                        results.clear();
+                        list_state.select(None);
+                        continue;
                     }
-                    (Focus::Results, KeyCode::Down, _) => {
-                        let i = list_state.selected().unwrap_or(0);
-                        if i < results.len().saturating_sub(1) {
-                            list_state.select(Some(i + 1));
-                        }
+                }
+                // Ctrl+D: done
+                (_, KeyCode::Char('d'), KeyModifiers::CONTROL) => {
+                    return Ok(Some(PackagePickerResult {
+                        repo_packages: selected_repo,
+                        aur_packages: selected_aur,
+                    }));
+                }
+
+                // Results mode
+                (Focus::Results, KeyCode::Up, _) => {
+                    let i = list_state.selected().unwrap_or(0);
+                    if i == 0 {
+                        focus = Focus::Search;
+                    } else {
+                        list_state.select(Some(i - 1));
                     }
-                    (Focus::Results, KeyCode::Enter, _) => {
-                        if let Some(idx) = list_state.selected()
-                            && let Some(pkg) = results.get(idx)
-                        {
-                            add_package(pkg, &mut selected_repo, &mut selected_aur);
-                            search_text.clear();
-                            results.clear();
-                            list_state.select(None);
-                            focus = Focus::Search;
-                        }
+                }
+                (Focus::Results, KeyCode::Down, _) => {
+                    let i = list_state.selected().unwrap_or(0);
+                    if i < results.len().saturating_sub(1) {
+                        list_state.select(Some(i + 1));
                     }
-
-                    // Delete selected packages with Ctrl+X
-                    (_, KeyCode::Char('x'), KeyModifiers::CONTROL)
-                        if !selected_repo.is_empty() || !selected_aur.is_empty() =>
+                }
+                (Focus::Results, KeyCode::Enter, _) => {
+                    if let Some(idx) = list_state.selected()
+                        && let Some(pkg) = results.get(idx)
                     {
-                        // Remove last added
-                        if !selected_aur.is_empty() {
-                            selected_aur.pop();
-                        } else {
-                            selected_repo.pop();
-                        }
+                        add_package(pkg, &mut selected_repo, &mut selected_aur);
+                        search_text.clear();
+                        results.clear();
+                        list_state.select(None);
+                        focus = Focus::Search;
                     }
+                }
 
-                    _ => {}
+                // Delete selected packages with Ctrl+X
+                (_, KeyCode::Char('x'), KeyModifiers::CONTROL)
+                    if !selected_repo.is_empty() || !selected_aur.is_empty() =>
+                {
+                    // Remove last added
+                    if !selected_aur.is_empty() {
+                        selected_aur.pop();
+                    } else {
+                        selected_repo.pop();
+                    }
                 }
+
+                _ => {}
             }
         }
     }
@@ -6,6 +6,7 @@ use archinstall_zfs_core::config::types::{
     AudioServer, CompressionAlgo, GlobalConfig, InitSystem, InstallationMode, ProfileSelection,
     SeatAccess, SwapMode, UserConfig, ZfsEncryptionMode, ZfsModuleMode,
 };
+use archinstall_zfs_core::kernel::scanner::CompatibilityResult;
 use archinstall_zfs_core::profile::{DisplayManager, OptionalPackage};
 use archinstall_zfs_core::system::gpu::{GfxDriver, detect_gpus, suggested_driver};
 
@@ -214,18 +215,18 @@ pub async fn pick_existing_pool(
 }
 
 /// Returns (kernel_name, zfs_mode) if user selected a kernel, None if cancelled.
-pub async fn pick_kernel(
+/// `results` are the compatibility scan results, one per entry of
+/// `AVAILABLE_KERNELS`.
+pub fn pick_kernel(
     config: &GlobalConfig,
+    results: &[CompatibilityResult],
     terminal: &mut ratatui::DefaultTerminal,
 ) -> Result<Option<(String, ZfsModuleMode)>> {
     use archinstall_zfs_core::kernel::AVAILABLE_KERNELS;
-    use archinstall_zfs_core::kernel::scanner::scan_all_kernels;
-
-    let results = scan_all_kernels().await;
 
     let mut options = Vec::new();
     let mut selectable: Vec<(usize, &str, ZfsModuleMode)> = Vec::new();
-    for (i, (info, result)) in AVAILABLE_KERNELS.iter().zip(&results).enumerate() {
+    for (i, (info, result)) in AVAILABLE_KERNELS.iter().zip(results).enumerate() {
         let ver = result.kernel_version.as_deref().unwrap_or("?");
         if let Some(mode) = result.best_mode() {
             options.push(format!(
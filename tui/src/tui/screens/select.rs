@@ -37,54 +37,54 @@ pub fn run_multiselect(
     loop {
         terminal.draw(|frame| render_multiselect(frame, title, items, &list_state, &checked))?;
 
-        if crossterm::event::poll(std::time::Duration::from_millis(50))? {
-            let ev = crossterm::event::read()?;
-            if let Event::Key(key) = ev {
-                let selected = list_state.selected().unwrap_or(0);
-                match (key.code, key.modifiers) {
-                    (KeyCode::Esc, _)
-                    | (KeyCode::Char('q'), _)
-                    | (KeyCode::Char('c'), KeyModifiers::CONTROL) => {
-                        return Ok(MultiSelectResult { selected: None });
-                    }
-                    (KeyCode::Enter, _) => {
-                        let indices = checked
-                            .iter()
-                            .enumerate()
-                            .filter(|(_, c)| **c)
-                            .map(|(i, _)| i)
-                            .collect();
-                        return Ok(MultiSelectResult {
-                            selected: Some(indices),
-                        });
-                    }
-                    (KeyCode::Up | KeyCode::Char('k'), _) => {
-                        let i = if selected == 0 {
-                            items.len() - 1
-                        } else {
-                            selected - 1
-                        };
-                        list_state.select(Some(i));
-                    }
-                    (KeyCode::Down | KeyCode::Char('j'), _) => {
-                        let i = if selected >= items.len() - 1 {
-                            0
-                        } else {
-                            selected + 1
-                        };
-                        list_state.select(Some(i));
-                    }
-                    (KeyCode::Char(' '), _) if selected < checked.len() => {
-                        checked[selected] = !checked[selected];
-                    }
-                    (KeyCode::Char('a'), KeyModifiers::NONE) => {
-                        checked.iter_mut().for_each(|c| *c = true);
-                    }
-                    (KeyCode::Char('A'), _) => {
-                        checked.iter_mut().for_each(|c| *c = false);
-                    }
-                    _ => {}
+        // Nothing here changes without input, so block for the next event
+        // instead of redrawing on a timer.
+        let ev = crossterm::event::read()?;
+        if let Event::Key(key) = ev {
+            let selected = list_state.selected().unwrap_or(0);
+            match (key.code, key.modifiers) {
+                (KeyCode::Esc, _)
+                | (KeyCode::Char('q'), _)
+                | (KeyCode::Char('c'), KeyModifiers::CONTROL) => {
+                    return Ok(MultiSelectResult { selected: None });
+                }
+                (KeyCode::Enter, _) => {
+                    let indices = checked
+                        .iter()
+                        .enumerate()
+                        .filter(|(_, c)| **c)
+                        .map(|(i, _)| i)
+                        .collect();
+                    return Ok(MultiSelectResult {
+                        selected: Some(indices),
+                    });
                 }
+                (KeyCode::Up | KeyCode::Char('k'), _) => {
+                    let i = if selected == 0 {
+                        items.len() - 1
+                    } else {
+                        selected - 1
+                    };
+                    list_state.select(Some(i));
+                }
+                (KeyCode::Down | KeyCode::Char('j'), _) => {
+                    let i = if selected >= items.len() - 1 {
+                        0
+                    } else {
+                        selected + 1
+                    };
+                    list_state.select(Some(i));
+                }
+                (KeyCode::Char(' '), _) if selected < checked.len() => {
+                    checked[selected] = !checked[selected];
+                }
+                (KeyCode::Char('a'), KeyModifiers::NONE) => {
+                    checked.iter_mut().for_each(|c| *c = true);
+                }
+                (KeyCode::Char('A'), _) => {
+                    checked.iter_mut().for_each(|c| *c = false);
+                }
+                _ => {}
             }
         }
     }
@@ -181,30 +181,28 @@ pub fn run_select(
             render_select(frame, title, items, &mut state);
         })?;
 
-        if crossterm::event::poll(std::time::Duration::from_millis(50))? {
-            let ev = crossterm::event::read()?;
-            if let Event::Key(key) = ev {
-                match (key.code, key.modifiers) {
-                    (KeyCode::Esc, _)
-                    | (KeyCode::Char('q'), _)
-                    | (KeyCode::Char('c'), KeyModifiers::CONTROL) => {
-                        return Ok(SelectResult { selected: None });
-                    }
-                    (KeyCode::Enter, _) => {
-                        return Ok(SelectResult {
-                            selected: state.selected(),
-                        });
-                    }
-                    (KeyCode::Up | KeyCode::Char('k'), _) => {
-                        let i = state.selected().unwrap_or(0);
-                        state.select(Some(if i == 0 { items.len() - 1 } else { i - 1 }));
-                    }
-                    (KeyCode::Down | KeyCode::Char('j'), _) => {
-                        let i = state.selected().unwrap_or(0);
-                        state.select(Some(if i >= items.len() - 1 { 0 } else { i + 1 }));
-                    }
-                    _ => {}
+        let ev = crossterm::event::read()?;
+        if let Event::Key(key) = ev {
+            match (key.code, key.modifiers) {
+                (KeyCode::Esc, _)
+                | (KeyCode::Char('q'), _)
+                | (KeyCode::Char('c'), KeyModifiers::CONTROL) => {
+                    return Ok(SelectResult { selected: None });
+                }
+                (KeyCode::Enter, _) => {
+                    return Ok(SelectResult {
+                        selected: state.selected(),
+                    });
+                }
+                (KeyCode::Up | KeyCode::Char('k'), _) => {
+                    let i = state.selected().unwrap_or(0);
+                    state.select(Some(if i == 0 { items.len() - 1 } else { i - 1 }));
                 }
+                (KeyCode::Down | KeyCode::Char('j'), _) => {
+                    let i = state.selected().unwrap_or(0);
+                    state.select(Some(if i >= items.len() - 1 { 0 } else { i + 1 }));
+                }
+                _ => {}
             }
         }
     }
@@ -279,51 +277,49 @@ pub fn run_select_fuzzy(
             render_select_fuzzy(frame, title, &filtered, &mut state, &filter);
         })?;
 
-        if crossterm::event::poll(std::time::Duration::from_millis(50))? {
-            let ev = crossterm::event::read()?;
-            if let Event::Key(key) = ev {
-                if key.kind != KeyEventKind::Press {
-                    continue;
+        let ev = crossterm::event::read()?;
+        if let Event::Key(key) = ev {
+            if key.kind != KeyEventKind::Press {
+                continue;
+            }
+            match (key.code, key.modifiers) {
+                (KeyCode::Esc, _) | (KeyCode::Char('c'), KeyModifiers::CONTROL) => {
+                    return Ok(SelectResult { selected: None });
                 }
-                match (key.code, key.modifiers) {
-                    (KeyCode::Esc, _) | (KeyCode::Char('c'), KeyModifiers::CONTROL) => {
-                        return Ok(SelectResult { selected: None });
-                    }
-                    (KeyCode::Enter, _) => {
-                        if let Some(sel) = state.selected()
-                            && let Some(text) = filtered.get(sel)
-                        {
-                            let orig_idx = items.iter().position(|s| s == text);
-                            return Ok(SelectResult { selected: orig_idx });
-                        }
-                        return Ok(SelectResult { selected: None });
-                    }
-                    (KeyCode::Up, _) => {
-                        let i = state.selected().unwrap_or(0);
-                        state.select(Some(if i == 0 {
-                            filtered.len().saturating_sub(1)
-                        } else {
-                            i - 1
-                        }));
+                (KeyCode::Enter, _) => {
+                    if let Some(sel) = state.selected()
+                        && let Some(text) = filtered.get(sel)
+                    {
+                        let orig_idx = items.iter().position(|s| s == text);
+                        return Ok(SelectResult { selected: orig_idx });
                     }
-                    (KeyCode::Down, _) => {
-                        let i = state.selected().unwrap_or(0);
-                        state.select(Some(if i >= filtered.len().saturating_sub(1) {
-                            0
-                        } else {
-                            i + 1
-                        }));
-                    }
-                    (KeyCode::Backspace, _) => {
-                        filter.pop();
-                        update_fuzzy_filter(items, &filter, &mut filtered, &mut state);
-                    }
-                    (KeyCode::Char(c), KeyModifiers::NONE | KeyModifiers::SHIFT) => {
-                        filter.push(c);
-                        update_fuzzy_filter(items, &filter, &mut filtered, &mut state);
-                    }
-                    _ => {}
+                    return Ok(SelectResult { selected: None });
+                }
+                (KeyCode::Up, _) => {
+                    let i = state.selected().unwrap_or(0);
+                    state.select(Some(if i == 0 {
+                        filtered.len().saturating_sub(1)
+                    } else {
+                        i - 1
+                    }));
+                }
+                (KeyCode::Down, _) => {
+                    let i = state.selected().unwrap_or(0);
+                    state.select(Some(if i >= filtered.len().saturating_sub(1) {
+                        0
+                    } else {
+                        i + 1
+                    }));
+                }
+                (KeyCode::Backspace, _) => {
+                    filter.pop();
+                    update_fuzzy_filter(items, &filter, &mut filtered, &mut state);
+                }
+                (KeyCode::Char(c), KeyModifiers::NONE | KeyModifiers::SHIFT) => {
+                    filter.push(c);
+                    update_fuzzy_filter(items, &filter, &mut filtered, &mut state);
                 }
+                _ => {}
             }
         }
     }
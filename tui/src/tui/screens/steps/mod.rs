@@ -75,12 +75,6 @@ pub enum MenuKind {
         index: usize,
         selected: bool,
     },
-    /// Select from a list via popup (for long lists: locale, timezone, kernel)
-    #[allow(dead_code)]
-    Select {
-        options: Vec<&'static str>,
-        current: usize,
-    },
     /// Free-form text input
     Text,
     /// Masked text input (password)
@@ -6,10 +6,7 @@ use super::{MenuItem, MenuKind, radio_group};
 
 pub fn items(config: &GlobalConfig) -> Vec<MenuItem> {
     let mode = config.installation_mode;
-    let has_swap_partition = matches!(
-        config.swap_mode,
-        SwapMode::ZswapPartition | SwapMode::ZswapPartitionEncrypted
-    );
+    let has_swap_partition = config.swap_mode.uses_partition();
 
     let mut items = vec![
         MenuItem {
@@ -7,6 +7,7 @@ use ratatui::widgets::{
 };
 
 use archinstall_zfs_core::config::types::GlobalConfig;
+use archinstall_zfs_core::kernel::scanner::{CompatibilityResult, scan_all_kernels};
 
 use crate::tui::Action;
 use crate::tui::theme;
@@ -24,6 +25,10 @@ pub struct Wizard {
     step_cursors: [usize; 7],
     step_scrolls: [usize; 7],
     max_visited: usize,
+    /// Kernel compatibility scan started with the wizard, so its network
+    /// round-trips overlap with the user filling in the earlier steps.
+    kernel_scan: Option<tokio::task::JoinHandle<Vec<CompatibilityResult>>>,
+    kernel_results: Option<Vec<CompatibilityResult>>,
 }
 
 impl Wizard {
@@ -34,6 +39,8 @@ impl Wizard {
             step_cursors: [0; 7],
             step_scrolls: [0; 7],
             max_visited: 0,
+            kernel_scan: Some(tokio::spawn(scan_all_kernels())),
+            kernel_results: None,
         }
     }
 
@@ -41,6 +48,24 @@ impl Wizard {
         self.config
     }
 
+    /// Wait for the background kernel scan the first time its results are
+    /// needed; later kernel pickers reuse them. Scans again in place if the
+    /// background task failed.
+    async fn finish_kernel_scan(&mut self) {
+        if self.kernel_results.is_some() {
+            return;
+        }
+        let scanned = match self.kernel_scan.take() {
+            Some(task) => task.await.ok(),
+            None => None,
+        };
+        let results = match scanned {
+            Some(results) => results,
+            None => scan_all_kernels().await,
+        };
+        self.kernel_results = Some(results);
+    }
+
     fn items(&self) -> Vec<MenuItem> {
         match self.current_step {
             StepId::Welcome => super::steps::welcome::items(&self.config),
@@ -261,8 +286,10 @@ impl Wizard {
                     }
                 }
                 "kernel" => {
+                    self.finish_kernel_scan().await;
+                    let results = self.kernel_results.as_deref().unwrap_or_default();
                     if let Some((kernel, mode)) =
-                        pickers::pick_kernel(&self.config, terminal).await?
+                        pickers::pick_kernel(&self.config, results, terminal)?
                     {
                         self.config.kernels = Some(vec![kernel]);
                         self.config.zfs_module_mode = mode;
@@ -319,13 +346,6 @@ impl Wizard {
             MenuKind::Toggle => {
                 pickers::apply_toggle(&mut self.config, key);
             }
-            MenuKind::Select { options, current } => {
-                let label = item.label;
-                let result = run_select(terminal, label, options, *current)?;
-                if let Some(idx) = result.selected {
-                    pickers::apply_select(&mut self.config, key, idx, terminal)?;
-                }
-            }
             MenuKind::Text => {
                 let current = &item.value;
                 let initial = if current == "Not set" || current == "None" {
@@ -585,9 +605,6 @@ impl Wizard {
                 MenuKind::Custom => {
                     self.render_kv_item(frame, line_area, item, is_selected, "");
                 }
-                MenuKind::Select { .. } => {
-                    self.render_kv_item(frame, line_area, item, is_selected, "\u{25bc} ");
-                }
             }
         }
 
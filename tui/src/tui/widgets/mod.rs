@@ -1,2 +1 @@
-// Widget stubs — tui-textarea, tui-widget-list, and tui-scrollview
-// provide the main widgets. Custom widgets will be added here.
+// Custom widgets will be added here.